@@ -63,6 +63,9 @@ print("Bot token acquired")
 # which is used for message commands and other features.
 intents = nextcord.Intents.default()
 intents.message_content = True
+# The members intent is privileged: only request it when the profile cache is
+# configured to load every member at startup.
+intents.members = config.profile_cache_chunk_members
 bot = commands.Bot(command_prefix=config.PREFIX, intents=intents)
 
 # ======================================================================================
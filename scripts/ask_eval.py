@@ -0,0 +1,70 @@
+"""
+Offline evaluation and latency harness for the /ask agent pipeline.
+
+Runs a corpus of recorded queries through the navigator, chat agent and tool
+caller against the local stub model, then writes a JSON report with routing
+decisions, tool calls, model round-trips and per-stage wall times.
+
+Usage (from the project root, with a filled-in .env):
+    python scripts/ask_eval.py --label before --out before.json
+    python scripts/ask_eval.py --label after --out after.json
+    python scripts/ask_eval.py --compare before.json after.json
+
+    # Use the queries users actually asked instead of the bundled corpus:
+    python scripts/ask_eval.py --history data/chat_history.json
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable and the relative data paths resolvable.
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+from src.agent.evaluation import compare_reports, load_corpus, load_history_corpus, run_evaluation
+from src.agent.stub_model import StubModel
+from src.utils.types.ask_eval import EvalReport
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "ask_corpus.json"
+
+
+def main():
+    """Parse the command line and run or compare evaluations."""
+    parser = argparse.ArgumentParser(description="Evaluate the /ask pipeline offline.")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS), help="JSON list of queries or EvalCase objects")
+    parser.add_argument("--history", help="Use the queries recorded in a chat_history.json file instead")
+    parser.add_argument("--label", default="", help="Name stored in the report, e.g. a git revision")
+    parser.add_argument("--repeat", type=int, default=1, help="Run the corpus this many times")
+    parser.add_argument("--first-token-delay", type=float, default=0.0, help="Simulated model latency in seconds")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Simulated delay between streamed chunks")
+    parser.add_argument("--out", help="Write the JSON report to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two saved reports")
+    args = parser.parse_args()
+
+    if args.compare:
+        before, after = (EvalReport.model_validate_json(Path(p).read_text(encoding="utf-8")) for p in args.compare)
+        print(compare_reports(before, after))
+        return
+
+    cases = load_history_corpus(args.history) if args.history else load_corpus(args.corpus)
+    stub = StubModel(chunk_delay=args.chunk_delay, first_token_delay=args.first_token_delay)
+    report = asyncio.run(run_evaluation(cases, label=args.label, repeat=args.repeat, stub_model=stub))
+
+    for record in report.records:
+        verdict = {True: "ok", False: "MISS", None: "-"}[record.routing_ok]
+        tools = ",".join(record.tools) or "-"
+        print(f"[{verdict:>4}] {record.final_agent:<12} {tools:<30} {record.run_ms:8.2f}ms  {record.query}")
+    print()
+    for name, value in report.summary.items():
+        print(f"{name:<20} {value:.3f}")
+
+    if args.out:
+        Path(args.out).write_text(report.model_dump_json(indent=2), encoding="utf-8")
+        print(f"\nReport written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Stress test for concurrent giveaway processing.
+
+Creates many giveaways in a temporary directory and fires, all at once, the
+scheduled ending of each plus several End Now and Reroll clicks against fake
+channels with random latency. Checks that every giveaway is announced as
+ended exactly once, that no user is drawn twice for the same giveaway, that
+every recorded draw replays, and that the files on disk match the in-memory
+state. Nothing under `data/` is touched.
+
+Usage (from the project root):
+    python scripts/giveaway_stress.py
+    python scripts/giveaway_stress.py --giveaways 200 --entrants 50 --clicks 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the project root importable.
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.functions.giveaway_store import giveaway_store
+from tests.giveaway_fakes import check, create_giveaways, run
+
+
+def main():
+    """Parse the command line and run the stress test."""
+    parser = argparse.ArgumentParser(description="Race giveaway endings and rerolls against each other.")
+    parser.add_argument("--giveaways", type=int, default=100, help="Giveaways to create (default: 100)")
+    parser.add_argument("--entrants", type=int, default=30, help="Entrants per giveaway (default: 30)")
+    parser.add_argument("--winners", type=int, default=3, help="Winners per giveaway (default: 3)")
+    parser.add_argument("--clicks", type=int, default=3, help="Concurrent End Now clicks per giveaway (default: 3)")
+    parser.add_argument("--rerolls", type=int, default=3, help="Concurrent rerolls per giveaway (default: 3)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        giveaway_store.reload(directory)
+        ids = create_giveaways(args.giveaways, args.entrants, args.winners)
+        started = time.perf_counter()
+        channels = asyncio.run(run(ids, args.clicks, args.rerolls))
+        elapsed = time.perf_counter() - started
+        errors = check(ids, channels, directory)
+
+    for error in errors:
+        print(error)
+    print(f"{len(ids)} giveaways processed in {elapsed:.2f}s, {len(errors)} inconsistencies.")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    # Resolve relative paths from the project root, as the bot does.
+    os.chdir(project_root)
+    main()
@@ -1,45 +1,72 @@
-import json
-from decimal import Decimal, getcontext
+"""
+Generate `src/utils/se_hp_table.py` from `data/seHP.json`.
+
+Each boss HP is stored exactly as an integer mantissa and a power-of-ten
+exponent (HP = mantissa * 10 ** exponent) in two typed arrays, indexed by
+stage - 1. Run it after editing the JSON:
 
-getcontext().prec = 100  # high precision for safety
+    python scripts/jsontopy.py
+"""
 
-INPUT_JSON = "../data/seHP.json"
-OUTPUT_PY = "generated_data.py"
+import json
+import os
+from decimal import Decimal
 
-THRESHOLD = Decimal("1e14")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_JSON = os.path.join(ROOT, "data", "seHP.json")
+OUTPUT_PY = os.path.join(ROOT, "src", "utils", "se_hp_table.py")
 
+# Values per line in the generated arrays.
+PER_LINE = 8
 
-def format_decimal(value: Decimal) -> str:
+
+def split_exact(value) -> tuple[int, int]:
     """
-    Returns a Decimal literal string.
-    Uses scientific notation with exactly 13 decimal places if >= 1e14.
+    Split a JSON number into an exact (mantissa, exponent) pair with no trailing zeros.
     """
-    if value >= THRESHOLD:
-        sci = f"{value:.13E}".replace("E", "e")
-        return f"Decimal('{sci}')"
-    else:
-        return f"Decimal('{value}')"
+    sign, digits, exponent = Decimal(str(value)).normalize().as_tuple()
+    mantissa = int("".join(map(str, digits)))
+    return (-mantissa if sign else mantissa), int(exponent)
+
+
+def format_array(typecode: str, values: list[int]) -> str:
+    """Render an `array(...)` literal, `PER_LINE` values per line."""
+    rows = [
+        "    " + ", ".join(str(v) for v in values[i:i + PER_LINE]) + ","
+        for i in range(0, len(values), PER_LINE)
+    ]
+    return f'array("{typecode}", [\n' + "\n".join(rows) + "\n])"
 
 
 with open(INPUT_JSON, "r", encoding="utf-8") as f:
     raw = json.load(f)
 
-lines = []
-lines.append("from decimal import Decimal\n")
-lines.append("data = {\n")
+stages = sorted(int(k) for k in raw)
+if stages != list(range(1, len(stages) + 1)):
+    raise SystemExit("seHP.json must cover every stage from 1 without gaps")
+
+pairs = [split_exact(raw[str(stage)]) for stage in stages]
+mantissas = [m for m, _ in pairs]
+exponents = [e for _, e in pairs]
+
+if max(abs(m) for m in mantissas) >= 2 ** 63 or max(abs(e) for e in exponents) >= 2 ** 7:
+    raise SystemExit("a value does not fit the int64 mantissa / int8 exponent layout")
+
+source = f'''"""
+Star Expedition boss HP, generated by `scripts/jsontopy.py` from `data/seHP.json`.
 
-for k, v in raw.items():
-    key = k
-    value = Decimal(str(v))
+Do not edit by hand. The HP of stage `s` is exactly
+`MANTISSAS[s - 1] * 10 ** EXPONENTS[s - 1]`.
+"""
 
-    key_str = key
-    value_str = format_decimal(value)
+from array import array
 
-    lines.append(f"    {key_str}: {value_str},\n")
+MANTISSAS = {format_array("q", mantissas)}
 
-lines.append("}\n")
+EXPONENTS = {format_array("b", exponents)}
+'''
 
 with open(OUTPUT_PY, "w", encoding="utf-8") as f:
-    f.writelines(lines)
+    f.write(source)
 
-print(f"Generated {OUTPUT_PY}")
+print(f"Generated {OUTPUT_PY} ({len(stages)} stages)")
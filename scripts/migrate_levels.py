@@ -0,0 +1,46 @@
+"""
+Recompute every user's level, optionally after rescaling their XP.
+
+Replaces the old `update_lvls.py` (x3.5 XP rescale) and `fix_user_levels.py`
+(level fix) scripts. Runs as a dry run unless `--apply` is given, and can be
+run while the bot is up: the data file is locked for the whole migration, so
+XP granted meanwhile is applied before or after it, never lost.
+
+Usage (from the project root):
+    python scripts/migrate_levels.py                      # show level fixes
+    python scripts/migrate_levels.py --scale 3.5          # show the x3.5 rescale
+    python scripts/migrate_levels.py --scale 3.5 --apply  # write it
+    python scripts/migrate_levels.py --scale 3.5 --apply --out data/updated_data.json
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable and the relative data paths resolvable.
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+from src.utils.functions.level_migration import format_migration_report, migrate_user_levels, scale_xp
+
+
+def main():
+    """Parse the command line and run the migration."""
+    parser = argparse.ArgumentParser(description="Recompute user levels, optionally rescaling XP.")
+    parser.add_argument("--scale", type=float, help="Multiply every XP total by this factor, e.g. 3.5")
+    parser.add_argument("--apply", action="store_true", help="Write the result instead of only showing the diff")
+    parser.add_argument("--out", help="Write to this file instead of data/user_levels.json")
+    parser.add_argument("--limit", type=int, default=50, help="Changed users to list (0 for all)")
+    args = parser.parse_args()
+
+    report = migrate_user_levels(
+        transform=scale_xp(args.scale) if args.scale is not None else None,
+        dry_run=not args.apply,
+        output_path=args.out,
+    )
+    print(format_migration_report(report, args.limit or None))
+
+
+if __name__ == "__main__":
+    main()
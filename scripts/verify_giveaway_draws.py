@@ -0,0 +1,48 @@
+"""
+Replay and verify the recorded winner draws of a giveaway.
+
+Every draw stores its seed and a digest of the entrants and weights it drew
+from; this replays each one from the stored reroll pool and reports whether
+it gives the recorded winners.
+
+Usage (from the project root):
+    python scripts/verify_giveaway_draws.py <giveaway id>
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable and the relative data paths resolvable.
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+from src.utils.functions.giveaway_draw import verify_draws
+from src.utils.functions.giveaway_store import giveaway_store
+
+
+def main():
+    """Parse the command line and verify the giveaway's draws."""
+    parser = argparse.ArgumentParser(description="Replay and verify a giveaway's recorded draws.")
+    parser.add_argument("giveaway_id", help="ID of the giveaway")
+    args = parser.parse_args()
+
+    g = giveaway_store.get(args.giveaway_id)
+    if g is None:
+        sys.exit(f"No giveaway with id {args.giveaway_id}.")
+    pool = g.reroll_pool
+    if pool is None or not pool.draws:
+        sys.exit("This giveaway has no recorded draws.")
+
+    mismatches = set(verify_draws(pool))
+    print(f"{g.prize}: {len(pool.eligible)} entrants, weighting: {pool.weighting}")
+    for index, record in enumerate(pool.draws):
+        status = "MISMATCH" if index in mismatches else "ok"
+        winners = ", ".join(str(uid) for uid in record.winners) or "none"
+        print(f"  #{index + 1} {record.drawn_at:%Y-%m-%d %H:%M:%S} seed={record.seed} winners={winners} [{status}]")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module implements an offline evaluation and latency harness for the
+`/ask` agent pipeline.
+
+A corpus of recorded queries is run through the same navigator, chat agent and
+tool caller that `/ask` uses, with `Runner.run` pointed at the local stub model.
+For every query the harness records the routing decision, the tools invoked,
+the number of model round-trips and the wall time spent in each stage: local
+prompt building, the model, the tools and the run as a whole. Activity of the
+memoized calculators behind the tools is recorded as well.
+
+Reports are plain JSON (`EvalReport`), so a run before and after a change to
+the instructions or tools can be compared with `compare_reports`.
+"""
+
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from agents import Agent, Model, ModelProvider, RunConfig, RunContextWrapper, RunHooks, Runner, Tool
+
+from src.agent.navigator import build_chat_agent, build_navigator
+from src.agent.stub_model import StubModel, StubModelProvider
+from src.utils.config import config
+from src.utils.functions.chat_context import build_chat_context
+from src.utils.types.ask_eval import CacheStats, EvalCase, EvalRecord, EvalReport
+from src.utils.types.chat_history import ChatHistories
+
+# Longest final output kept in a report record.
+OUTPUT_PREVIEW_LENGTH = 200
+
+# ======================================================================================
+# INSTRUMENTATION
+# ======================================================================================
+
+class TimedModel(Model):
+    """
+    Wraps a model and accumulates the time spent in each call.
+
+    Attributes:
+        inner (Model): The wrapped model.
+        elapsed (float): Seconds spent in the model since the last reset.
+    """
+
+    def __init__(self, inner: Model):
+        """
+        Initialize the timed model.
+
+        Args:
+            inner (Model): The model to wrap.
+        """
+        self.inner = inner
+        self.elapsed = 0.0
+
+    async def get_response(self, *args: Any, **kwargs: Any):
+        """Delegate to the wrapped model and time the call."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.get_response(*args, **kwargs)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    async def stream_response(self, *args: Any, **kwargs: Any):
+        """Delegate to the wrapped model and time the whole stream."""
+        start = time.perf_counter()
+        try:
+            async for event in self.inner.stream_response(*args, **kwargs):
+                yield event
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+
+class TimedModelProvider(ModelProvider):
+    """
+    Hands out a single `TimedModel` wrapping the inner provider's model.
+
+    Attributes:
+        model (TimedModel): The shared timed model.
+    """
+
+    def __init__(self, inner: ModelProvider):
+        """
+        Initialize the provider.
+
+        Args:
+            inner (ModelProvider): The provider whose model is timed.
+        """
+        self.model = TimedModel(inner.get_model(None))
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        """Return the timed model regardless of the requested name."""
+        return self.model
+
+
+class StageHooks(RunHooks):
+    """
+    Run hooks that accumulate the time spent inside tools.
+
+    Attributes:
+        tool_elapsed (float): Seconds spent in tools since the last reset.
+    """
+
+    def __init__(self):
+        """Initialize the hooks."""
+        self.tool_elapsed = 0.0
+        self._tool_started: Dict[str, float] = {}
+
+    async def on_tool_start(self, context: RunContextWrapper, agent: Agent, tool: Tool) -> None:
+        """Remember when the tool started."""
+        self._tool_started[tool.name] = time.perf_counter()
+
+    async def on_tool_end(self, context: RunContextWrapper, agent: Agent, tool: Tool, result: str) -> None:
+        """Add the tool's duration to the total."""
+        started = self._tool_started.pop(tool.name, None)
+        if started is not None:
+            self.tool_elapsed += time.perf_counter() - started
+
+
+def _cache_counts() -> Dict[str, CacheStats]:
+    """Snapshot the hit/miss counters of every memoized calculator."""
+    # Imported here so every calculator module has registered its caches.
+    import src.utils.functions.awaken  # noqa: F401
+    import src.utils.functions.dt_calc  # noqa: F401
+    import src.utils.functions.grim_calc  # noqa: F401
+    import src.utils.functions.se_hp  # noqa: F401
+    from src.utils.functions.memo import memo_stats
+
+    return {
+        name.rsplit(".", 1)[-1]: CacheStats(hits=stats.hits, misses=stats.misses)
+        for name, stats in memo_stats().items()
+    }
+
+
+# ======================================================================================
+# EVALUATION
+# ======================================================================================
+
+async def evaluate_case(case: EvalCase, provider: TimedModelProvider, hooks: StageHooks) -> EvalRecord:
+    """
+    Run one query through the `/ask` pipeline and measure it.
+
+    Args:
+        case (EvalCase): The query and its expected routing.
+        provider (TimedModelProvider): The timed provider the run uses.
+        hooks (StageHooks): The hooks that time tool calls.
+
+    Returns:
+        EvalRecord: The measurements for this query.
+    """
+    provider.model.elapsed = 0.0
+    hooks.tool_elapsed = 0.0
+
+    # Pre-routing: everything `/ask` does locally before the first model call.
+    start = time.perf_counter()
+    context = build_chat_context(None, config.ask_context_token_budget, config.ask_summary_token_budget)
+    nav_agent = build_navigator(build_chat_agent("Evaluator", context))
+    prompt_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    result = await Runner.run(
+        starting_agent=nav_agent,
+        input=case.query,
+        run_config=RunConfig(model_provider=provider),
+        hooks=hooks,
+    )
+    run_ms = (time.perf_counter() - start) * 1000
+
+    handoffs: List[str] = []
+    tools: List[str] = []
+    for item in result.new_items:
+        if item.type == "handoff_output_item":
+            handoffs.append(f"{item.source_agent.name} -> {item.target_agent.name}")
+        elif item.type == "tool_call_item":
+            tools.append(str(getattr(item.raw_item, "name", "unknown")))
+
+    final_agent = result.last_agent.name
+    return EvalRecord(
+        query=case.query,
+        final_agent=final_agent,
+        handoffs=handoffs,
+        tools=tools,
+        round_trips=len(result.raw_responses),
+        prompt_ms=prompt_ms,
+        model_ms=provider.model.elapsed * 1000,
+        tool_ms=hooks.tool_elapsed * 1000,
+        run_ms=run_ms,
+        routing_ok=(final_agent == case.expected_agent) if case.expected_agent else None,
+        tool_ok=(case.expected_tool in tools) if case.expected_tool else None,
+        output=str(result.final_output)[:OUTPUT_PREVIEW_LENGTH],
+    )
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of `values` (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(records: List[EvalRecord], caches: Dict[str, CacheStats]) -> Dict[str, float]:
+    """
+    Aggregate per-query records into comparable metrics.
+
+    Args:
+        records (List[EvalRecord]): The per-query measurements.
+        caches (Dict[str, CacheStats]): Cache activity over the run.
+
+    Returns:
+        Dict[str, float]: Metric name to value.
+    """
+    summary: Dict[str, float] = {"queries": float(len(records))}
+    if not records:
+        return summary
+
+    routed = [r.routing_ok for r in records if r.routing_ok is not None]
+    tooled = [r.tool_ok for r in records if r.tool_ok is not None]
+    if routed:
+        summary["routing_accuracy"] = sum(routed) / len(routed)
+    if tooled:
+        summary["tool_accuracy"] = sum(tooled) / len(tooled)
+
+    summary["round_trips_mean"] = statistics.fmean(r.round_trips for r in records)
+    for stage in ("prompt_ms", "model_ms", "tool_ms", "run_ms"):
+        values = [getattr(r, stage) for r in records]
+        summary[f"{stage}_mean"] = statistics.fmean(values)
+        summary[f"{stage}_p50"] = _percentile(values, 0.50)
+        summary[f"{stage}_p95"] = _percentile(values, 0.95)
+
+    hits = sum(c.hits for c in caches.values())
+    lookups = hits + sum(c.misses for c in caches.values())
+    if lookups:
+        summary["cache_hit_rate"] = hits / lookups
+    return summary
+
+
+async def run_evaluation(
+    cases: List[EvalCase],
+    label: str = "",
+    repeat: int = 1,
+    stub_model: Optional[StubModel] = None,
+) -> EvalReport:
+    """
+    Run a corpus through the `/ask` pipeline against the stub model.
+
+    Args:
+        cases (List[EvalCase]): The recorded queries.
+        label (str): A name for the run, stored in the report.
+        repeat (int): How many times to run the whole corpus; repeats show
+            the effect of warm caches.
+        stub_model (Optional[StubModel]): The stub to use, e.g. one with
+            simulated latency. Defaults to an instant stub.
+
+    Returns:
+        EvalReport: The full report.
+    """
+    provider = TimedModelProvider(StubModelProvider(stub_model))
+    hooks = StageHooks()
+    before = _cache_counts()
+
+    records: List[EvalRecord] = []
+    for _ in range(max(1, repeat)):
+        for case in cases:
+            records.append(await evaluate_case(case, provider, hooks))
+
+    after = _cache_counts()
+    caches = {
+        name: CacheStats(hits=after[name].hits - before[name].hits, misses=after[name].misses - before[name].misses)
+        for name in after
+    }
+    return EvalReport(label=label, records=records, summary=summarize(records, caches), caches=caches)
+
+
+# ======================================================================================
+# CORPUS AND REPORTS
+# ======================================================================================
+
+def load_corpus(path: str) -> List[EvalCase]:
+    """
+    Load a corpus file: a JSON list of `EvalCase` objects or plain query strings.
+
+    Args:
+        path (str): Path to the corpus file.
+
+    Returns:
+        List[EvalCase]: The cases in file order.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [EvalCase(query=item) if isinstance(item, str) else EvalCase(**item) for item in data]
+
+
+def load_history_corpus(path: str) -> List[EvalCase]:
+    """
+    Build an unlabelled corpus from the queries recorded in a chat history file.
+
+    Args:
+        path (str): Path to a `chat_history.json` file.
+
+    Returns:
+        List[EvalCase]: One case per recorded query.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    histories = ChatHistories(root=data)
+    return [EvalCase(query=turn.query) for history in histories.root.values() for turn in history.turns]
+
+
+def compare_reports(before: EvalReport, after: EvalReport) -> str:
+    """
+    Render the summary metrics of two runs side by side.
+
+    Args:
+        before (EvalReport): The baseline run.
+        after (EvalReport): The run to compare against the baseline.
+
+    Returns:
+        str: A plain-text table with one metric per line.
+    """
+    names = list(dict.fromkeys([*before.summary, *after.summary]))
+    width = max((len(n) for n in names), default=6)
+    lines = [f"{'metric':<{width}}  {before.label or 'before':>12}  {after.label or 'after':>12}  {'delta':>10}"]
+    for name in names:
+        old = before.summary.get(name)
+        new = after.summary.get(name)
+        delta = f"{new - old:+10.3f}" if old is not None and new is not None else f"{'-':>10}"
+        old_str = f"{old:12.3f}" if old is not None else f"{'-':>12}"
+        new_str = f"{new:12.3f}" if new is not None else f"{'-':>12}"
+        lines.append(f"{name:<{width}}  {old_str}  {new_str}  {delta}")
+    return "\n".join(lines)
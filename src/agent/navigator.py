@@ -11,6 +11,7 @@ it hands off the query to either the `chat_agent` or the `tool_agent`.
 """
 
 import os
+from agents import Agent, ModelSettings
 from dotenv import load_dotenv
 
 # ======================================================================================
@@ -21,4 +22,65 @@ from dotenv import load_dotenv
 # The `OPENAI_MODEL` environment variable is required for the agent to know which
 # model to use for generating responses.
 load_dotenv()
-MODEL = os.getenv("OPENAI_MODEL")
\ No newline at end of file
+MODEL = os.getenv("OPENAI_MODEL")
+
+# ======================================================================================
+# AGENT CONFIGURATION
+# ======================================================================================
+
+NAVIGATOR_INSTRUCTIONS = """
+1- Do not answer queries yourself.
+2- Classify each query:
+  - If it's a general question, handoff to chat_agent.
+  - If it's game-related data, handoff to tool_caller.
+3- Always route, never respond directly.
+"""
+
+
+def build_chat_agent(user_display_name: str, context: str) -> Agent:
+    """
+    Build the per-user chat agent.
+
+    Args:
+        user_display_name (str): The sanitized name to address the user by.
+        context (str): The user's token-budgeted conversation context.
+
+    Returns:
+        Agent: The chat agent with the user's context in its instructions.
+    """
+    chat_agent_instructions = f"""
+System:
+You are a helpful and sarcastic discord bot. Plain string no markdown.
+You must never reply with the history unless the user asks for it.
+The user you are talking to is named {user_display_name}.
+
+Here is your conversation with this user so far:
+{context}
+"""
+
+    return Agent(
+        name="Chat Agent",
+        instructions=chat_agent_instructions,
+        model=MODEL,
+        model_settings=ModelSettings(max_tokens=200)
+    )
+
+
+def build_navigator(chat_agent: Agent) -> Agent:
+    """
+    Build the navigator agent that routes a query to the tool caller or the chat agent.
+
+    Args:
+        chat_agent (Agent): The chat agent for general questions.
+
+    Returns:
+        Agent: The navigator agent.
+    """
+    # Imported here to avoid loading the tools (and their data) at module import time.
+    from src.agent.tool_caller import tool_agent
+
+    return Agent(
+        name="Navigator Agent",
+        instructions=NAVIGATOR_INSTRUCTIONS,
+        handoffs=[tool_agent, chat_agent]
+    )
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module streams agent output into a Discord followup message.
+
+`Runner.run_streamed` yields text deltas as the model generates them. Rather
+than waiting for the whole answer, the first delta is sent as a followup
+message right away and later deltas are folded into throttled edits of that
+same message, so the user sees the answer grow while staying well under
+Discord's message-edit rate limit.
+"""
+
+import time
+from typing import Optional
+
+import nextcord
+from agents import Agent, RunConfig, Runner
+from openai.types.responses import ResponseTextDeltaEvent
+
+# Discord rejects message content longer than this many characters.
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+def _clip(text: str) -> str:
+    """Trim `text` to Discord's message length limit."""
+    if len(text) <= DISCORD_MESSAGE_LIMIT:
+        return text
+    return text[: DISCORD_MESSAGE_LIMIT - 1] + "…"
+
+
+class ThrottledFollowup:
+    """
+    Progressively edits a single followup message with a minimum interval
+    between edits.
+
+    Attributes:
+        interaction (nextcord.Interaction): The deferred interaction to answer.
+        min_interval (float): Minimum seconds between two edits.
+        message (Optional[nextcord.WebhookMessage]): The followup message, once sent.
+        text (str): The latest full text pushed by the caller.
+        shown (str): The text currently visible on Discord.
+        first_sent_at (Optional[float]): Monotonic time of the first send.
+    """
+
+    def __init__(self, interaction: nextcord.Interaction, min_interval: float = 1.0):
+        """
+        Initialize the throttled followup.
+
+        Args:
+            interaction (nextcord.Interaction): The deferred interaction.
+            min_interval (float): Minimum seconds between two edits.
+        """
+        self.interaction = interaction
+        self.min_interval = min_interval
+        self.message: Optional[nextcord.WebhookMessage] = None
+        self.text = ""
+        self.shown = ""
+        self.first_sent_at: Optional[float] = None
+        self._last_edit = 0.0
+
+    async def push(self, text: str) -> None:
+        """
+        Record the latest text and update Discord if the throttle allows it.
+
+        The first non-empty text is sent immediately; later updates are only
+        written once `min_interval` has passed since the previous edit.
+
+        Args:
+            text (str): The full text generated so far.
+        """
+        self.text = text
+        if not text.strip():
+            return
+
+        now = time.monotonic()
+        if self.message is None:
+            self.message = await self.interaction.followup.send(_clip(text), wait=True)
+            self.first_sent_at = now
+            self._last_edit = now
+            self.shown = text
+        elif now - self._last_edit >= self.min_interval and text != self.shown:
+            await self.message.edit(content=_clip(text))
+            self._last_edit = now
+            self.shown = text
+
+    async def finish(self, final_text: str) -> None:
+        """
+        Write the final text, sending or editing the message as needed.
+
+        Args:
+            final_text (str): The complete answer to display.
+        """
+        self.text = final_text
+        if self.message is None:
+            self.message = await self.interaction.followup.send(_clip(final_text), wait=True)
+            self.first_sent_at = time.monotonic()
+        elif final_text != self.shown:
+            await self.message.edit(content=_clip(final_text))
+        self.shown = final_text
+
+
+async def stream_to_followup(
+    interaction: nextcord.Interaction,
+    agent: Agent,
+    query: str,
+    run_config: Optional[RunConfig] = None,
+    min_interval: float = 1.0,
+) -> str:
+    """
+    Run `agent` in streaming mode and mirror its text into a followup message.
+
+    Tool results and handoffs produce no text deltas, so the final output is
+    always written once the run completes.
+
+    Args:
+        interaction (nextcord.Interaction): The deferred interaction to answer.
+        agent (Agent): The starting agent.
+        query (str): The user's query.
+        run_config (Optional[RunConfig]): Optional run configuration, e.g. a
+            stub model provider.
+        min_interval (float): Minimum seconds between message edits.
+
+    Returns:
+        str: The final output of the run.
+    """
+    result = Runner.run_streamed(starting_agent=agent, input=query, run_config=run_config)
+    followup = ThrottledFollowup(interaction, min_interval=min_interval)
+    text = ""
+
+    async for event in result.stream_events():
+        # Text produced before a handoff belongs to the previous agent.
+        if event.type == "agent_updated_stream_event":
+            text = ""
+        elif event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+            text += event.data.delta
+            await followup.push(text)
+
+    output = str(result.final_output)
+    await followup.finish(output)
+    return output
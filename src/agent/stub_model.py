@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module implements a local, deterministic stand-in for the OpenAI model
+used by the `/ask` agent pipeline.
+
+The stub speaks the agents SDK `Model` interface, so the navigator, the chat
+agent and the tool caller run through the real `Runner` (handoffs, tool calls,
+streaming events) without any network access. Routing is decided with simple
+keyword rules, which makes it suitable for offline testing and for measuring
+the local parts of the pipeline.
+
+Enable it for the running bot by setting `OPENAI_MODEL=stub` in the `.env`
+file, or pass `StubModelProvider()` through a `RunConfig` explicitly.
+"""
+
+import asyncio
+import json
+import os
+import re
+import uuid
+from typing import Any, AsyncIterator, Optional
+
+from agents import (
+    FunctionTool,
+    Handoff,
+    Model,
+    ModelProvider,
+    ModelResponse,
+    ModelSettings,
+    ModelTracing,
+    RunConfig,
+    Tool,
+    TResponseInputItem,
+    Usage,
+)
+from dotenv import load_dotenv
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseCreatedEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseTextDeltaEvent,
+)
+
+load_dotenv()
+
+# The model name that switches the bot over to the stub provider.
+STUB_MODEL_NAME = "stub"
+
+# ======================================================================================
+# ROUTING RULES
+# ======================================================================================
+
+# Keywords that make the navigator hand a query to the tool caller.
+GAME_KEYWORDS = ("grim", "imprint", "essence", "temple", "dt", "awaken", "csg", "se", "boss", "hp")
+
+# Keywords used by the tool caller to pick a tool, checked in order.
+TOOL_KEYWORDS: list[tuple[str, tuple[str, ...]]] = [
+    ("grimoire_calculation", ("grim", "imprint", "essence")),
+    ("temple_info_and_calculation", ("temple", "dt")),
+    ("awakening_plan", ("plan", "chance", "probability")),
+    ("awakening_simulation", ("awaken", "csg")),
+    ("se_hp_getter", ("se", "boss", "hp")),
+]
+
+# Choices for string tool parameters, matched against the query text.
+STRING_CHOICES: dict[str, tuple[str, ...]] = {
+    "book": ("Enable", "Imprint"),
+    "grade": ("A-", "A+", "B+", "B-", "SSS", "SS"),
+}
+
+# Keywords that switch a boolean tool parameter on when found in the query.
+BOOLEAN_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "analytic": ("expected", "average", "percentile"),
+}
+
+
+def _words(text: str) -> set[str]:
+    """Return the lowercase alphanumeric words of `text`."""
+    return set(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def _matches(text: str, keywords: tuple[str, ...]) -> bool:
+    """
+    Return True if any keyword is a word of `text`. Keywords longer than
+    three letters also match as prefixes ("grim" matches "grimoire").
+    """
+    return any(w == k or (len(k) > 3 and w.startswith(k)) for w in _words(text) for k in keywords)
+
+
+def last_user_text(input: str | list[TResponseInputItem]) -> str:
+    """
+    Extract the most recent user message from a model input.
+
+    Args:
+        input: Either the raw query string or the SDK's list of input items.
+
+    Returns:
+        str: The text of the last user message, or an empty string.
+    """
+    if isinstance(input, str):
+        return input
+
+    for item in reversed(input):
+        if not isinstance(item, dict) or item.get("role") != "user":
+            continue
+        content = item.get("content")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return " ".join(str(part.get("text", "")) for part in content if isinstance(part, dict))
+    return ""
+
+
+def _tool_arguments(tool: FunctionTool, text: str) -> dict[str, Any]:
+    """
+    Build tool-call arguments from the numbers and choices found in `text`.
+
+    Integer parameters are filled in schema order from the integers in the
+    query; string parameters are matched against `STRING_CHOICES` and
+    boolean parameters against `BOOLEAN_KEYWORDS`.
+    """
+    numbers = [int(n) for n in re.findall(r"\d+", text)]
+    properties: dict[str, Any] = tool.params_json_schema.get("properties", {})
+    required = set(tool.params_json_schema.get("required", []))
+    args: dict[str, Any] = {}
+
+    for name, schema in properties.items():
+        kind = schema.get("type")
+        if kind is None and "anyOf" in schema:
+            kind = next((s.get("type") for s in schema["anyOf"] if s.get("type") != "null"), None)
+
+        if kind == "integer" and numbers:
+            args[name] = numbers.pop(0)
+        elif kind == "string":
+            choices = STRING_CHOICES.get(name, ())
+            picked = next((c for c in choices if c.lower() in text.lower()), choices[0] if choices else None)
+            if picked is not None:
+                args[name] = picked
+        elif kind == "boolean":
+            args[name] = _matches(text, BOOLEAN_KEYWORDS.get(name, ()))
+        elif name in required and kind == "integer":
+            args[name] = 1
+
+    return args
+
+
+# ======================================================================================
+# STUB MODEL
+# ======================================================================================
+
+class StubModel(Model):
+    """
+    A keyword-driven model that produces handoffs, tool calls and text.
+
+    Attributes:
+        chunk_delay (float): Seconds to wait between streamed text chunks,
+            used to imitate generation latency.
+        first_token_delay (float): Seconds to wait before the first output.
+    """
+
+    def __init__(self, chunk_delay: float = 0.0, first_token_delay: float = 0.0):
+        """
+        Initialize the stub model.
+
+        Args:
+            chunk_delay (float): Delay between streamed text chunks.
+            first_token_delay (float): Delay before the first output.
+        """
+        self.chunk_delay = chunk_delay
+        self.first_token_delay = first_token_delay
+
+    def _decide(
+        self,
+        system_instructions: Optional[str],
+        input: str | list[TResponseInputItem],
+        tools: list[Tool],
+        handoffs: list[Handoff],
+    ) -> ResponseOutputMessage | ResponseFunctionToolCall:
+        """Pick the next output item: a handoff, a tool call or a text reply."""
+        text = last_user_text(input)
+
+        # Navigator: route once, game queries to the tool caller, the rest to chat.
+        if handoffs:
+            wants_tools = _matches(text, GAME_KEYWORDS)
+            target = next(
+                (h for h in handoffs if ("tool" in h.agent_name.lower()) == wants_tools),
+                handoffs[0],
+            )
+            return self._function_call(target.tool_name, {})
+
+        # Tool caller: pick the first tool whose keywords match.
+        function_tools = {t.name: t for t in tools if isinstance(t, FunctionTool)}
+        for tool_name, keywords in TOOL_KEYWORDS:
+            tool = function_tools.get(tool_name)
+            if tool and _matches(text, keywords):
+                return self._function_call(tool.name, _tool_arguments(tool, text))
+        if function_tools:
+            return self._message("Sorry, I don't have a tool for that.")
+
+        # Chat agent: a short deterministic reply.
+        return self._message(f"Stub reply: {text.strip()}")
+
+    @staticmethod
+    def _function_call(name: str, arguments: dict[str, Any]) -> ResponseFunctionToolCall:
+        """Build a completed function-call output item."""
+        return ResponseFunctionToolCall(
+            id=f"fc_{uuid.uuid4().hex}",
+            call_id=f"call_{uuid.uuid4().hex}",
+            name=name,
+            arguments=json.dumps(arguments),
+            type="function_call",
+            status="completed",
+        )
+
+    @staticmethod
+    def _message(text: str) -> ResponseOutputMessage:
+        """Build a completed assistant message output item."""
+        return ResponseOutputMessage(
+            id=f"msg_{uuid.uuid4().hex}",
+            content=[ResponseOutputText(text=text, type="output_text", annotations=[])],
+            role="assistant",
+            status="completed",
+            type="message",
+        )
+
+    @staticmethod
+    def _usage(input: str | list[TResponseInputItem], output: str) -> Usage:
+        """Estimate token usage with the common four-characters-per-token rule."""
+        input_tokens = max(1, len(str(input)) // 4)
+        output_tokens = max(1, len(output) // 4)
+        return Usage(
+            requests=1,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+        )
+
+    async def get_response(
+        self,
+        system_instructions: Optional[str],
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: Any,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        **kwargs: Any,
+    ) -> ModelResponse:
+        """Return the whole stub response at once."""
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+        item = self._decide(system_instructions, input, tools, handoffs)
+        return ModelResponse(
+            output=[item],
+            usage=self._usage(input, item.model_dump_json()),
+            response_id=None,
+        )
+
+    async def stream_response(
+        self,
+        system_instructions: Optional[str],
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: Any,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream the stub response as created, text-delta and completed events."""
+        item = self._decide(system_instructions, input, tools, handoffs)
+        response = Response(
+            id=f"resp_{uuid.uuid4().hex}",
+            created_at=0,
+            model=STUB_MODEL_NAME,
+            object="response",
+            output=[item],
+            tool_choice="auto",
+            tools=[],
+            top_p=None,
+            parallel_tool_calls=False,
+        )
+        sequence = 0
+
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+        yield ResponseCreatedEvent(type="response.created", response=response, sequence_number=sequence)
+
+        if isinstance(item, ResponseOutputMessage):
+            text = item.content[0].text if isinstance(item.content[0], ResponseOutputText) else ""
+            # Stream word by word so callers see several deltas per reply.
+            for chunk in re.findall(r"\S+\s*", text):
+                sequence += 1
+                yield ResponseTextDeltaEvent(
+                    type="response.output_text.delta",
+                    item_id=item.id,
+                    output_index=0,
+                    content_index=0,
+                    delta=chunk,
+                    logprobs=[],
+                    sequence_number=sequence,
+                )
+                if self.chunk_delay:
+                    await asyncio.sleep(self.chunk_delay)
+
+        sequence += 1
+        yield ResponseCompletedEvent(type="response.completed", response=response, sequence_number=sequence)
+
+
+class StubModelProvider(ModelProvider):
+    """
+    A model provider that returns one shared `StubModel` for every model name.
+
+    Attributes:
+        model (StubModel): The stub model handed out to all agents.
+    """
+
+    def __init__(self, model: Optional[StubModel] = None):
+        """
+        Initialize the provider.
+
+        Args:
+            model (Optional[StubModel]): The model to hand out; a default stub
+                is created if omitted.
+        """
+        self.model = model or StubModel()
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        """Return the stub model regardless of the requested name."""
+        return self.model
+
+
+def get_run_config() -> Optional[RunConfig]:
+    """
+    Return a `RunConfig` that routes every agent to the stub model when
+    `OPENAI_MODEL` is set to `stub`, or None to use the real provider.
+    """
+    if os.getenv("OPENAI_MODEL") == STUB_MODEL_NAME:
+        return RunConfig(model_provider=StubModelProvider())
+    return None
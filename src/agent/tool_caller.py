@@ -16,6 +16,7 @@ from src.agent.tools import (
     se_hp,
     temple_info,
     awakening_simulation,
+    awakening_plan,
     grimoire_calculation,
 )
 
@@ -40,7 +41,7 @@ tool_agent = Agent(
     name="Tool Caller",
     instructions="You must only use the tools provided to you—never handle requests on your own. If a tool doesn’t exist, refuse politly.\nPlain string no markdown",
     model=MODEL,
-    tools=[se_hp, temple_info, awakening_simulation, grimoire_calculation],
+    tools=[se_hp, temple_info, awakening_simulation, awakening_plan, grimoire_calculation],
     tool_use_behavior="stop_on_first_tool",
     model_settings=ModelSettings(max_tokens=300),
 )
\ No newline at end of file
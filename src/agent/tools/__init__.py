@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """This package contains the tools for the tool-calling agent."""
-from .awakening import awakening_simulation
+from .awakening import awakening_plan, awakening_simulation
 from .grimoire import grimoire_calculation
 from .se_hp import se_hp
 from .temple import temple_info
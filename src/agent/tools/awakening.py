@@ -1,20 +1,63 @@
 # -*- coding: utf-8 -*-
-"""Tool for awakening simulation."""
+"""Tools for awakening simulation and planning."""
+import asyncio
+from typing import Optional
+
 from agents import function_tool
 from src.utils.functions.awaken import make_response as _get_awakening_simulation
+from src.utils.functions.awaken_plan import make_plan_response
 
 awakening_simulation = function_tool(
     _get_awakening_simulation,
     name_override="awakening_simulation",
     description_override="""
 Simulates awakening a specified number of times and returns the results,
-including CSG spent, retired amount, and gala points earned.
+including CSG spent, retired amount, and gala points earned. With analytic
+set, returns the expected retired amount and gala points instead, with
+5th-95th percentile bands.
 
 Args:
-    iterations (int, required): The number of awakenings to simulate.
+    iterations (int, required): The number of awakenings to simulate (1 to 1,000,000).
+    analytic (bool, optional): Report expected returns instead of a random
+        simulation. Use it when the user asks for expected or average returns.
 
 Returns:
     str: A formatted string summarizing the simulation results.
     """,
     use_docstring_info=False,
 )
+
+async def _get_awakening_plan(
+    grade: str,
+    probability: float = 90.0,
+    hits: int = 1,
+    budget_csg: Optional[int] = None,
+    return_percent: Optional[float] = None,
+) -> str:
+    """Run `make_plan_response` off the event loop: return estimates run a Monte Carlo."""
+    return await asyncio.to_thread(make_plan_response, grade, probability, hits, budget_csg, return_percent)
+
+
+awakening_plan = function_tool(
+    _get_awakening_plan,
+    name_override="awakening_plan",
+    description_override="""
+Plans awakenings for a target grade under both the normal and the buffed
+odds: the awakenings (and CSG) needed to reach the grade with a given
+probability, the chance of reaching it within a CSG budget, and optionally
+the estimated chance of retiring a given share of that budget.
+
+Args:
+    grade (str, required): Target grade, e.g. "A-"; that grade or better counts.
+        Grades: E-, E, E+, D-, D, D+, C-, C, C+, B-, B, B+, A-, A, A+, S, SS, SSS, X.
+    probability (float, optional): Target chance in percent (default 90).
+    hits (int, optional): How many of the target grade are wanted (default 1).
+    budget_csg (int, optional): CSG the user can spend.
+    return_percent (float, optional): Share of the budget to get back by
+        retiring, in percent. Only used with budget_csg.
+
+Returns:
+    str: A formatted comparison of both pools.
+    """,
+    use_docstring_info=False,
+)
@@ -1,38 +1,22 @@
 # -*- coding: utf-8 -*-
 """Tool for Grimoire upgrade cost calculation."""
 from agents import function_tool
-from src.utils.config import emojis
-from src.utils.functions.grim_calc import (
-    get_grim_calc as _get_grim_calc_data,
-    GrimCalcResult,
-)
-
-
-def _get_grim_calc_response(book: str, goal_lvl: int, current_lvl: int | None = None) -> str:
-    """Formats the Grimoire calculation result into a string."""
-    result = _get_grim_calc_data(book, goal_lvl, current_lvl)
+from src.utils.functions.grim_calc import get_grim_calc_response, get_grim_reach_response
 
-    if result.error:
-        return f"⚠️ {result.error}"
 
-    if book.lower() == "enable":
-        book_name = f"{emojis.grim_book1} Grimoire • Enabling Chapter"
-        level_range = f"`{current_lvl} → {goal_lvl}`" if current_lvl else f"`→ {goal_lvl}`"
-        response = (
-            f"> **{book_name}** {level_range}\n"
-            f"> \n"
-            f"> {emojis.grim_essence} `{result.essence_cost:,}` {result.essence_choices:.2f} event choices"
-        )
-    else:  # Imprint
-        book_name = "Grimoire • Imprint Chapter"
-        level_range = f"`{current_lvl} → {goal_lvl}`" if current_lvl else f"`→ {goal_lvl}`"
-        response = (
-            f"> **{book_name}** {level_range}\n"
-            f"> \n"
-            f"> {emojis.grim_essence} `{result.essence_cost:,}` {result.essence_choices:.2f} event choices\n"
-            f"> {emojis.grim_imprint} `{result.imprint_cost:,}` {result.imprint_choices:.2f} event choices"
-        )
-    return response
+def _get_grim_calc_response(
+    book: str,
+    goal_lvl: int | None = None,
+    current_lvl: int | None = None,
+    essence: int | None = None,
+    imprint: int | None = None,
+) -> str:
+    """Formats the Grimoire calculation (or reverse query) result into a string."""
+    if goal_lvl is None:
+        if essence is None:
+            return "⚠️ Provide a goal level, or the essence available to see what it reaches."
+        return get_grim_reach_response(book, essence, imprint, current_lvl)
+    return get_grim_calc_response(book, goal_lvl, current_lvl)
 
 
 grimoire_calculation = function_tool(
@@ -40,15 +24,19 @@ grimoire_calculation = function_tool(
     name_override="grimoire_calculation",
     description_override="""
 Calculates the resource cost to upgrade a Grimoire from a current level
-to a target level.
+to a target level. Without a goal level, finds the highest level the given
+essence (and imprint) can reach instead.
 
 Args:
     book (str, required): The type of Grimoire ("Enable" or "Imprint").
-    goal_lvl (int, required): The target level for the calculation (1-150).
+    goal_lvl (int, optional): The target level for the calculation (1-150).
+        Leave empty for the reverse query.
     current_lvl (int, optional): The current grimoire level (1-150).
+    essence (int, optional): Essence available, for the reverse query.
+    imprint (int, optional): Imprint available, for the reverse query.
 
 Returns:
-    str: A formatted string with the calculated resource costs.
+    str: A formatted string with the calculated resource costs or reachable level.
     """,
     use_docstring_info=False,
 )
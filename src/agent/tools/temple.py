@@ -1,16 +1,42 @@
 # -*- coding: utf-8 -*-
 """Tool to calculate the required resources for a specific temple level."""
 from agents import function_tool
-from src.utils.functions import get_dt_calc as _get_dt_calc
+from src.utils.functions import get_dt_calc
+from src.utils.functions.dt_calc import format_dt_plan, get_dt_plan
+
+
+def _get_dt_calc(
+    goal_temple: int | None = None,
+    origin: int = 0,
+    surge: int = 0,
+    chaos: int = 0,
+    core: int = 0,
+    polystar: int = 0,
+    nirvana: int = 0,
+    bag_gems: int = 0,
+    bag_spirit: int = 0,
+) -> str:
+    """Runs the temple calculation and adds the cheapest rank-ups when resources are missing."""
+    ranks = dict(origin=origin, surge=surge, chaos=chaos, core=core, polystar=polystar,
+                 nirvana=nirvana, bag_gems=bag_gems, bag_spirit=bag_spirit)
+    if goal_temple is None:
+        return format_dt_plan(get_dt_plan(**ranks))
+
+    result = get_dt_calc(goal_temple=goal_temple, **ranks)
+    if result.error or ((result.required_gems or 0) <= 0 and (result.required_spiritveins or 0) <= 0):
+        return str(result)
+    return f"{result}\n{format_dt_plan(get_dt_plan(goal_temple=goal_temple, **ranks))}"
+
 
 temple_info = function_tool(
     _get_dt_calc,
     name_override="temple_info_and_calculation",
     description_override="""
 Calculates the required resources (gems and spiritveins) needed to reach a specific temple level, can also be used to get the required temple resources only.
+When resources are missing, also returns the cheapest heroes to add to reach it. Without goal_temple, returns the highest temple the user reaches and the cheapest heroes to add for the next one.
     
     Args:
-        goal_temple (int, required): Target temple level (1-22)
+        goal_temple (int, optional): Target temple level (1-22)
         origin (int, optional): Number of Origin/D1 ranks. (0-16).
         surge (int, optional): Number of Surge/D2 ranks. (0-16).
         chaos (int, optional): Number of Chaos/D3 ranks. (0-16).
@@ -21,7 +47,7 @@ Calculates the required resources (gems and spiritveins) needed to reach a speci
         bag_spirit (int, optional): Current number of Scattered Spiritvein Shards in bag. (1-999999).
     
     Returns:
-        A dictionary containing users and required [gems and spiritveins], or an error message if input is invalid.
+        The users and required [gems and spiritveins] and the cheapest rank-ups, or an error message if input is invalid.
 """,
     use_docstring_info=False,
 )
@@ -12,9 +12,12 @@ The XP calculation is based on a four-tier system:
 4.  **True multiplier**: Final multiplier for a specific role.
 """
 
+import asyncio
+
 import nextcord
-from ..utils.config import config, channels, emojis, user_ids
+from ..utils.config import config, channels, emojis, roles, user_ids
 from ..utils.functions.leveling import add_xp, calculate_xp_from_context
+from ..utils.functions.level_roles import apply_level_roles
 
 def setup(bot):
     """
@@ -73,8 +76,11 @@ def setup(bot):
             message.author.id
         )
 
-        # Add the calculated XP to the user and check for a level-up.
-        leveled_up, new_level, _ = add_xp(
+        # Add the calculated XP to the user and check for a level-up. The
+        # file lock may be held by a migration for a while, so it is waited
+        # for in a worker thread rather than on the event loop.
+        leveled_up, new_level, _ = await asyncio.to_thread(
+            add_xp,
             message.author.id,
             message.author.name,
             xp_amount
@@ -103,3 +109,10 @@ def setup(bot):
                 # Silently ignore any exceptions that may occur, such as when the
                 # bot does not have permission to send messages.
                 print(f"Error sending level up message: {e}")
+
+            # Grant the level role of the new level, if one is configured.
+            if roles.level_roles:
+                try:
+                    await apply_level_roles(message.author, new_level)
+                except Exception as e:
+                    print(f"Error updating level roles: {e}")
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module fills the shared profile cache from gateway events, so commands
+rarely need to fetch users or members over REST. With
+`config.profile_cache_chunk_members` (which needs the members intent), the
+members of the Exile server are also requested in chunks at startup.
+"""
+
+import nextcord
+
+from src.utils.config import config
+from src.utils.functions.profile_cache import profile_cache
+
+
+def setup(bot):
+    """
+    Set up the listeners that keep the profile cache warm.
+
+    Listeners are added with `add_listener` so they do not replace the
+    `@bot.event` handlers of other event modules.
+
+    Args:
+        bot: The `nextcord.ext.commands.Bot` instance.
+    """
+    async def on_message(message: nextcord.Message):
+        if not message.author.bot:
+            profile_cache.put_user(message.author)
+
+    async def on_raw_reaction_add(payload: nextcord.RawReactionActionEvent):
+        profile_cache.put_member(payload.member)
+
+    async def on_interaction(interaction: nextcord.Interaction):
+        profile_cache.put_user(interaction.user)
+
+    async def on_member_join(member: nextcord.Member):
+        profile_cache.put_member(member)
+
+    async def on_member_update(before: nextcord.Member, after: nextcord.Member):
+        profile_cache.put_member(after)
+
+    async def on_user_update(before: nextcord.User, after: nextcord.User):
+        profile_cache.put_user(after)
+
+    async def on_member_remove(member: nextcord.Member):
+        profile_cache.forget_member(member.guild.id, member.id)
+
+    async def on_ready():
+        """Request the Exile server's members once, if configured."""
+        if not (config.profile_cache_chunk_members and bot.intents.members):
+            return
+        guild = bot.get_guild(config.exile_server_id)
+        if guild is None or guild.chunked:
+            return
+        try:
+            for member in await guild.chunk() or []:
+                profile_cache.put_member(member)
+            print(f"✅ Cached {guild.member_count} members")
+        except Exception as e:
+            print(f"Error chunking guild members: {e}")
+
+    for listener in (
+        on_message, on_raw_reaction_add, on_interaction, on_member_join,
+        on_member_update, on_user_update, on_member_remove, on_ready,
+    ):
+        bot.add_listener(listener)
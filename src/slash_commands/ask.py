@@ -7,28 +7,15 @@ questions that are answered by the bot's AI agent.
 
 import nextcord
 from nextcord.ext import commands
-from agents import Agent, ModelSettings, Runner
+from agents import Runner
+from src.agent.navigator import build_chat_agent, build_navigator
+from src.agent.streaming import stream_to_followup
+from src.agent.stub_model import get_run_config
 from src.utils.config import config
-from src.utils.functions.chat_history import update_chat_history
-from src.utils.types.chat_history import ChatHistory
-import os
-from dotenv import load_dotenv
+from src.utils.functions.chat_context import build_chat_context
+from src.utils.functions.chat_history import load_user_chat_history, update_chat_history
 import re
 
-load_dotenv()
-MODEL = os.getenv("OPENAI_MODEL")
-
-# Lazy import to avoid circular dependencies and ensure all modules are loaded
-_tool_agent = None
-
-def get_tool_agent():
-    """Lazy-load the tool_agent to avoid import issues at module load time."""
-    global _tool_agent
-    if _tool_agent is None:
-        from src.agent.tool_caller import tool_agent
-        _tool_agent = tool_agent
-    return _tool_agent
-
 
 class Ask(commands.Cog):
     """
@@ -88,57 +75,47 @@ class Ask(commands.Cog):
             discord_username = interaction.user.name
             server_nickname = getattr(interaction.user, 'display_name', None)
             
-            history = update_chat_history(user_id, query, discord_username, server_nickname)
-
-            # Create a more descriptive history string for the agent, newest first.
-            reversed_queries = reversed(history.queries)
-            history_list = [f"{i+1}. {q}" for i, q in enumerate(reversed_queries)]
-            history_str = "\n".join(history_list)
+            # Build the conversation context from previous turns (queries and
+            # answers), trimmed to the configured token budget.
+            history = load_user_chat_history(user_id)
+            context = build_chat_context(
+                history, config.ask_context_token_budget, config.ask_summary_token_budget
+            )
 
             # Get user's preferred name, sanitize it, and default if necessary
             raw_user_name = getattr(interaction.user, 'display_name', None) or interaction.user.name
             sanitized_user_name = re.sub(r'[^a-zA-Z0-9]', '', raw_user_name)
             user_display_name = sanitized_user_name if sanitized_user_name else "Wandering Exiler"
 
-            chat_agent_instructions = f"""
-System:
-You are a helpful and sarcastic discord bot. Plain string no markdown.
-You must never reply with the history unless the user asks for it.
-The user you are talking to is named {user_display_name}.
-
-Here is the user's recent query history (from newest to oldest):
-{history_str}
-"""
-
-            chat_agent = Agent(
-                name="Chat Agent",
-                instructions=chat_agent_instructions,
-                model=MODEL,
-                model_settings=ModelSettings(max_tokens=200)
-            )
-
-            nav_agent = Agent(
-                name="Navigator Agent",
-                instructions="""
-1- Do not answer queries yourself.
-2- Classify each query:
-  - If it's a general question, handoff to chat_agent.
-  - If it's game-related data, handoff to tool_caller.
-3- Always route, never respond directly.
-""",
-                handoffs=[get_tool_agent(), chat_agent]
-            )
+            nav_agent = build_navigator(build_chat_agent(user_display_name, context))
 
-            # Run the navigator agent with the user's query.
-            result = await Runner.run(starting_agent=nav_agent, input=query)
-            output = str(result.final_output)
+            # `OPENAI_MODEL=stub` swaps in the offline stub model provider.
+            run_config = get_run_config()
 
             # ============================================================================
             # RESPONSE
             # ============================================================================
 
-            # Send the agent's response as a follow-up message.
-            await interaction.followup.send(output)
+            if config.ask_stream:
+                # Stream the answer into a single followup message, edited in
+                # throttled chunks so the first tokens show up right away.
+                output = await stream_to_followup(
+                    interaction,
+                    nav_agent,
+                    query,
+                    run_config=run_config,
+                    min_interval=config.ask_stream_edit_interval,
+                )
+            else:
+                # Run the navigator agent with the user's query.
+                result = await Runner.run(starting_agent=nav_agent, input=query, run_config=run_config)
+                output = str(result.final_output)
+
+                # Send the agent's response as a follow-up message.
+                await interaction.followup.send(output)
+
+            # Record the finished exchange so the next query has it as context.
+            update_chat_history(user_id, query, output, discord_username, server_nickname)
 
         except Exception as e:
             # ============================================================================
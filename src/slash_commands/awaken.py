@@ -9,7 +9,7 @@ and calculate the total resources spent and gained.
 import nextcord
 from nextcord.ext import commands
 
-from src.utils.functions.awaken import make_response
+from src.utils.functions.awaken import MAX_AWAKENINGS, make_response
 from src.utils.config import channels
 
 
@@ -39,8 +39,15 @@ class Awaken(commands.Cog):
             description="Number of times to awaken",
             required=True,
             min_value=1,
-            max_value=999,
+            max_value=MAX_AWAKENINGS,
             default=1
+        ),
+        mode: str = nextcord.SlashOption(
+            name="mode",
+            description="Simulate the awakenings or show the expected returns",
+            required=False,
+            choices={"Simulate": "simulate", "Expected": "expected"},
+            default="simulate"
         )
     ):
         """
@@ -49,6 +56,8 @@ class Awaken(commands.Cog):
         Args:
             interaction (Interaction): The interaction object.
             times (int): The number of times to awaken.
+            mode (str): 'simulate' for a random simulation, 'expected' for the
+                expected returns with 5th-95th percentile bands.
         """
         try:
             # ============================================================================
@@ -70,8 +79,8 @@ class Awaken(commands.Cog):
             # COMMAND PROCESSING
             # ============================================================================
 
-            # Generate the response for the awakening simulation.
-            final_reply = make_response(times)
+            # Generate the response for the awakening simulation or forecast.
+            final_reply = make_response(times, analytic=(mode == "expected"))
 
             # ============================================================================
             # RESPONSE
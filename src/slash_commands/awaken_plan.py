@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module implements the `/awaken_plan` slash command, which answers
+"what-if" questions about awakenings (how many awakenings for a given chance
+at a grade, the chance within a CSG budget) for both pools side by side.
+"""
+
+import asyncio
+
+import nextcord
+from nextcord.ext import commands
+
+from src.utils.functions.awaken_plan import MAX_BUDGET_CSG, make_plan_response, shutdown_executor
+from src.utils.functions.game_tables import tables
+from src.utils.config import channels
+
+
+class AwakenPlan(commands.Cog):
+    """
+    A cog that handles the `/awaken_plan` slash command.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        """
+        Initialize the AwakenPlan cog.
+
+        Args:
+            bot (commands.Bot): The bot instance this cog is being added to.
+        """
+        self.bot = bot
+
+    def cog_unload(self):
+        """Stop the Monte Carlo process pool when the cog is unloaded or the bot closes."""
+        shutdown_executor()
+
+    @nextcord.slash_command(
+        name="awaken_plan",
+        description="Plan awakenings for a target grade under normal and buffed odds"
+    )
+    async def awaken_plan(
+        self,
+        interaction: nextcord.Interaction,
+        grade: str = nextcord.SlashOption(
+            name="grade",
+            description="Target grade (that grade or better counts)",
+            required=True,
+            choices={answer: answer for answer in tables.normal_pool.answers}
+        ),
+        probability: float = nextcord.SlashOption(
+            name="probability",
+            description="Target chance in percent",
+            required=False,
+            min_value=1,
+            max_value=99.99,
+            default=90
+        ),
+        hits: int = nextcord.SlashOption(
+            name="hits",
+            description="How many of the target grade you want",
+            required=False,
+            min_value=1,
+            max_value=100,
+            default=1
+        ),
+        budget: int = nextcord.SlashOption(
+            name="budget",
+            description="CSG you can spend",
+            required=False,
+            min_value=100,
+            max_value=MAX_BUDGET_CSG,
+            default=None
+        ),
+        return_target: float = nextcord.SlashOption(
+            name="return_target",
+            description="Share of the budget to get back by retiring, in percent (needs a budget)",
+            required=False,
+            min_value=1,
+            max_value=1000,
+            default=None
+        )
+    ):
+        """
+        Handle the `/awaken_plan` slash command.
+
+        Args:
+            interaction (Interaction): The interaction object.
+            grade (str): The target grade.
+            probability (float): The target chance in percent.
+            hits (int): How many of the target grade are wanted.
+            budget (int): The CSG budget, if any.
+            return_target (float): The share of the budget to get back, if any.
+        """
+        try:
+            # ============================================================================
+            # PRE-PROCESSING CHECKS
+            # ============================================================================
+
+            # Check whether the command is used in an allowed channel.
+            allowed_channel = channels.spam
+            if interaction.guild and isinstance(interaction.channel, nextcord.TextChannel):
+                if interaction.channel.name != allowed_channel:
+                    await interaction.response.send_message(
+                        f"This command can only be used in the #{allowed_channel} channel.\n"
+                        f"If it's not there, please create one.",
+                        ephemeral=True
+                    )
+                    return
+
+            # ============================================================================
+            # COMMAND PROCESSING
+            # ============================================================================
+
+            # Return estimates run a Monte Carlo; keep it off the event loop.
+            await interaction.response.defer()
+            final_reply = await asyncio.to_thread(
+                make_plan_response, grade, probability, hits, budget, return_target
+            )
+
+            # ============================================================================
+            # RESPONSE
+            # ============================================================================
+
+            await interaction.followup.send(final_reply)
+
+        except Exception as e:
+            # ============================================================================
+            # ERROR HANDLING
+            # ============================================================================
+
+            print(e)
+            await interaction.followup.send("Something went wrong, kindly try again.", ephemeral=True)
+
+
+def setup(bot: commands.Bot):
+    """
+    Set up the AwakenPlan cog.
+
+    Args:
+        bot (commands.Bot): The bot instance to add the cog to.
+    """
+    bot.add_cog(AwakenPlan(bot))
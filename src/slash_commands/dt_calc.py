@@ -2,7 +2,8 @@ import nextcord
 from nextcord.ext import commands
 from pydantic import BaseModel, Field
 from src.utils.functions import get_dt_calc
-from src.utils.temple_cost import temple_cost as temp_cost
+from src.utils.functions.dt_calc import format_dt_plan, get_dt_plan
+from src.utils.functions.game_tables import tables
 from src.utils.config import emojis
 
 
@@ -90,10 +91,10 @@ class DTCalc(commands.Cog):
         interaction: nextcord.Interaction,
         temple_level: int = nextcord.SlashOption(
             name="temple_level",
-            description="Enter your goal temple level here to compare (limit 1-22)",
+            description="Enter your goal temple level here to compare (limit 1-22), leave empty for your highest",
             min_value=1,
             max_value=22,
-            required=True
+            required=False
         ),
         origin: int = nextcord.SlashOption(
             name="origin",
@@ -163,11 +164,11 @@ class DTCalc(commands.Cog):
         """
         Calculate Divine Temple resource requirements and compare with current resources.
         This command helps players plan their temple upgrades by showing required and missing resources.
+        Without a temple level it shows the highest temple reached and the cheapest heroes to add for the next one;
+        with one the user can't cover yet, the cheapest heroes to add are appended.
         """
         try:
-            # Calculate user's resources and requirements
-            calc_result = CalculationResult(**get_dt_calc(
-                goal_temple=temple_level,
+            ranks = dict(
                 origin=origin,
                 surge=surge,
                 chaos=chaos,
@@ -176,11 +177,19 @@ class DTCalc(commands.Cog):
                 nirvana=nirvana,
                 bag_gems=bag_aurora,
                 bag_spirit=bag_spirit,
-            ).__dict__)
+            )
+
+            # Reverse question: highest temple reached and the cheapest way to the next one
+            if temple_level is None:
+                await interaction.response.send_message(format_dt_plan(get_dt_plan(**ranks)))
+                return
+
+            # Calculate user's resources and requirements
+            calc_result = CalculationResult(**get_dt_calc(goal_temple=temple_level, **ranks).__dict__)
             
             temple_req = TempleRequirement(
-                gem=temp_cost[temple_level - 1].gem,
-                spiritvein=temp_cost[temple_level - 1].spiritvein
+                gem=tables.temple.gems[temple_level],
+                spiritvein=tables.temple.spiritveins[temple_level]
             )
 
             # Create ResourceInfo instance for consistent formatting
@@ -198,6 +207,10 @@ class DTCalc(commands.Cog):
                 response += self._format_user_resources(resources)
                 response += self._format_resource_difference(calc_result, resources)
 
+            # Add the cheapest heroes to cover what is still missing
+            if calc_result.required_gems > 0 or calc_result.required_spiritveins > 0:
+                response += "\n\n" + format_dt_plan(get_dt_plan(goal_temple=temple_level, **ranks))
+
             await interaction.response.send_message(response)
             
         except Exception:
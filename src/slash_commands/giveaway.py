@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import nextcord
 from nextcord import Interaction, SlashOption,Embed, ButtonStyle
@@ -10,13 +10,20 @@ from nextcord.ui import View, Button
 
 from src.utils.functions.giveaway import (
 	load_giveaways, save_giveaways, delete_expired_giveaways,
-	get_active_giveaway, get_giveaway_by_id, update_giveaway, start_giveaway,
-	end_giveaway, reroll_giveaway, setup_scheduler,
-	default_embed, build_start_embed, update_embed_winners
-    , gather_reaction_user_ids_from_message, pick_reaction_winners
+	get_active_giveaways, get_giveaway_by_id, start_giveaway, set_giveaway_message,
+	finish_giveaway, reroll_and_announce, schedule_giveaway_end, giveaway_end_job_id, GIVEAWAY_END_JOB,
+	build_start_embed,
+	record_reaction_entry, reconcile_entrants
 )
+from src.utils.functions.discord_rest import with_backoff
+from src.utils.functions.giveaway_store import giveaway_store
+from src.utils.functions.profile_cache import profile_cache
+from src.utils.functions.scheduler import timer_scheduler
+from src.utils.functions.time_utils import utc_now
 from src.utils.types.giveaway import Giveaway
+from src.utils.types.scheduler import ScheduledJob
 from src.utils.permissions import can_member_start_giveaway
+from src.utils.config import config
 
 def duration_to_seconds(duration: str) -> int:
 	mapping = {
@@ -27,6 +34,12 @@ def duration_to_seconds(duration: str) -> int:
 		"7 days": 604800,
 	}
 	return mapping.get(duration, 86400)
+
+
+def giveaway_button_id(action: str, giveaway_id: str) -> str:
+	"""Return the custom id of a giveaway button, e.g. 'giveaway:end_now:<id>'."""
+	return f"giveaway:{action}:{giveaway_id}"
+
 # permission helper removed — creation permission now requires the bot owner
 # or the role named 'giveaway manager' and is checked inline in the command
 class GiveawayView(View):
@@ -34,31 +47,21 @@ class GiveawayView(View):
 		super().__init__(timeout=None)
 		self.giveaway_id = giveaway_id
 		self.host_id = host_id
-		# If the giveaway has ended, the reroll button should be enabled.
-		# We'll set that dynamically (buttons are available on the view via
-		# self.children) — by default they are created disabled/enabled
-		# according to the decorator settings.
+		# Buttons are built with custom ids encoding the giveaway, which makes
+		# the view persistent: the cog registers one per stored giveaway at
+		# startup, so the buttons on existing posts keep working after a
+		# restart without editing them.
+		# Once the giveaway has ended, End Now is disabled and Reroll shown;
+		# before that Reroll isn't part of the view at all.
+		end_now = Button(label="End Now", style=ButtonStyle.danger, custom_id=giveaway_button_id("end_now", giveaway_id), disabled=ended)
+		end_now.callback = self.end_now
+		self.add_item(end_now)
 		if ended:
-			# enable any reroll button we find
-			for child in self.children:
-				if isinstance(child, Button) and getattr(child, 'label', None) == 'Reroll':
-					child.disabled = False
-				if isinstance(child, Button) and getattr(child, 'label', None) == 'End Now':
-					# already ended, don't allow End Now
-					child.disabled = True
-		else:
-			# remove reroll from the view so it isn't visible until the giveaway
-			# has ended — we'll create a new view with the reroll button when
-			# the giveaway ends.
-			for child in list(self.children):
-				if isinstance(child, Button) and getattr(child, 'label', None) == 'Reroll':
-					try:
-						self.remove_item(child)
-					except Exception:
-						pass
-
-	@nextcord.ui.button(label="End Now", style=ButtonStyle.danger)
-	async def end_now(self, button: Button, interaction: Interaction):
+			reroll = Button(label="Reroll", style=ButtonStyle.primary, custom_id=giveaway_button_id("reroll", giveaway_id))
+			reroll.callback = self.reroll
+			self.add_item(reroll)
+
+	async def end_now(self, interaction: Interaction):
 		# Only the bot owner may end early — use the library's is_owner check
 		# which correctly identifies the bot owner.
 		try:
@@ -78,46 +81,27 @@ class GiveawayView(View):
 			# already responded or something went wrong - ignore and continue
 			pass
 
-		# End the giveaway (pick winners in storage) and then perform the
-		# same announcement/edit as the scheduled end (if message exists).
-		winners = end_giveaway(self.giveaway_id)
+		# End the giveaway and announce it through the same pipeline as the
+		# scheduled end; if it already ran (or another click won the race)
+		# nothing is announced twice. The clicked message is the post, so it
+		# is not fetched again.
 		g = get_giveaway_by_id(self.giveaway_id)
-
-		# If storage had no participants/winners, try to pick from reactions
-		if (not winners or len(winners) == 0) and g and g.message_id and interaction.guild:
+		channel = interaction.guild.get_channel(g.channel_id) if (g and interaction.guild) else None
+		winners = await finish_giveaway(
+			self.giveaway_id,
+			channel if isinstance(channel, nextcord.TextChannel) else None,
+			GiveawayView(self.giveaway_id, self.host_id, ended=True),
+			interaction.message,
+		)
+		# Cancel the scheduled ending only once the giveaway has ended: if
+		# finishing failed, the job (a no-op once ended) still ends it.
+		timer_scheduler.cancel(giveaway_end_job_id(self.giveaway_id))
+		if winners is None:
 			try:
-				ch = interaction.guild.get_channel(g.channel_id)
-				if isinstance(ch, nextcord.TextChannel):
-					# use shared helper to sample winners from reactions
-					winners_from_reactions = await pick_reaction_winners(ch, g.message_id, [], g.winners)
-					if winners_from_reactions:
-						winners = winners_from_reactions
-						g.winner_ids = winners
-						update_giveaway(g)
+				await interaction.followup.send("This giveaway has already ended.", ephemeral=True)
 			except Exception:
 				pass
-
-		# Try to edit the original message and announce winners
-		if g and g.message_id:
-			channel = interaction.guild.get_channel(g.channel_id) if interaction.guild else None
-			if isinstance(channel, nextcord.TextChannel):
-				try:
-					msg = await channel.fetch_message(g.message_id)
-					
-					# build/modify embed (use helpers to ensure thumbnail/description show)
-					embed = msg.embeds[0] if msg.embeds else default_embed("🎉 Giveaway Ended 🎉")
-					embed = update_embed_winners(embed, winners)
-					await msg.edit(embed=embed, view=GiveawayView(self.giveaway_id, self.host_id, ended=True))
-					
-				except Exception:
-					pass
-
-		# Announce winners in the channel
-		if g:
-			channel = interaction.guild.get_channel(g.channel_id) if interaction.guild else None
-			if channel and winners and isinstance(channel, nextcord.TextChannel):
-				mentions = ", ".join(f"<@{w}>" for w in winners)
-				await channel.send(f"🎉 Giveaway has ended — congratulations: {mentions}")
+			return
 
 		# reply after the long-running work using a followup
 		try:
@@ -129,8 +113,7 @@ class GiveawayView(View):
 			except Exception:
 				pass
 
-	@nextcord.ui.button(label="Reroll", style=ButtonStyle.primary, disabled=True)
-	async def reroll(self, button: Button, interaction: Interaction):
+	async def reroll(self, interaction: Interaction):
 		# Reroll is only available once the giveaway has ended — fetch the
 		# stored giveaway and ensure it's inactive
 		g = get_giveaway_by_id(self.giveaway_id)
@@ -145,7 +128,7 @@ class GiveawayView(View):
 			user_member = interaction.user
 		else:
 			uid = getattr(interaction.user, 'id', None)
-			user_member = interaction.guild.get_member(uid) if (interaction.guild and uid is not None) else None
+			user_member = await profile_cache.get_member(interaction.guild, uid) if (interaction.guild and uid is not None) else None
 		try:
 			is_owner = await interaction.client.is_owner(interaction.user)
 		except Exception:
@@ -166,20 +149,17 @@ class GiveawayView(View):
 		except Exception:
 			pass
 
-		prev_winners = g.winner_ids
-		new_winners = reroll_giveaway(self.giveaway_id, prev_winners)
-		# if reroll returned no winners (participants not stored), try reactions
-		if not new_winners and g and g.message_id and interaction.guild:
-			try:
-				ch = interaction.guild.get_channel(g.channel_id)
-				if isinstance(ch, nextcord.TextChannel):
-					new_from_reactions = await pick_reaction_winners(ch, g.message_id, prev_winners, g.winners)
-					if new_from_reactions:
-						new_winners = new_from_reactions
-						g.winner_ids = new_winners
-						update_giveaway(g)
-			except Exception:
-				pass
+		# Draw from the persisted reroll pool (no reaction requests, except
+		# once for giveaways ended before entrants were tracked) and announce;
+		# concurrent clicks are serialized per giveaway.
+		channel = interaction.guild.get_channel(g.channel_id) if interaction.guild else None
+		new_winners = await reroll_and_announce(
+			self.giveaway_id,
+			channel if isinstance(channel, nextcord.TextChannel) else None,
+			# Keep reroll enabled after reroll
+			GiveawayView(self.giveaway_id, self.host_id, ended=True),
+			interaction.message,
+		)
 		if not new_winners:
 			try:
 				await interaction.followup.send("Not enough eligible participants to reroll.", ephemeral=True)
@@ -189,28 +169,6 @@ class GiveawayView(View):
 				except Exception:
 					pass
 			return
-		# Announce new winners and update the embed message
-		channel = None
-		if interaction.guild:
-			# Only get text channels
-			for ch in interaction.guild.text_channels:
-				if ch.id == g.channel_id:
-					channel = ch
-					break
-		if channel:
-			winner_mentions = ", ".join(f"<@{uid}>" for uid in new_winners)
-			if isinstance(channel, nextcord.TextChannel):
-				await channel.send(f"🎉 Reroll successful!\nNew winners: {winner_mentions}")
-				# If the original message exists, edit the embed to show new winners
-				if g.message_id:
-					try:
-						msg = await channel.fetch_message(g.message_id)
-						embed = msg.embeds[0] if msg.embeds else default_embed("🎉 Giveaway Ended 🎉")
-						embed = update_embed_winners(embed, new_winners)
-						# Keep reroll enabled after reroll
-						await msg.edit(embed=embed, view=GiveawayView(self.giveaway_id, self.host_id, ended=True))
-					except Exception:
-						pass
 		# respond after the longer work
 		try:
 			await interaction.followup.send("Reroll complete.", ephemeral=True)
@@ -227,71 +185,98 @@ def setup(bot: commands.Bot):
 class GiveawayCog(commands.Cog):
 	def __init__(self, bot):
 		self.bot = bot
+		self._flush_task = None
+		self._started = False
+		self._reconcile_task = None
 
-	# reaction winner selection is centralized in src.utils.functions.giveaway
+	# --- Entrant tracking ---
 
+	def _schedule_flush(self):
+		"""Persist tracked entrants after a short delay, batching bursts of reactions."""
+		if self._flush_task is None or self._flush_task.done():
+			self._flush_task = asyncio.create_task(self._flush_entrants())
 
-	async def _schedule_end(self, giveaway: Giveaway):
-		"""Async helper to wait until the giveaway's end_time then perform
-		announcement and message edits using the bot API.
-		"""
-		now = datetime.utcnow()
-		wait_seconds = max(0, (giveaway.end_time - now).total_seconds())
-		await asyncio.sleep(wait_seconds)
+	async def _flush_entrants(self):
+		await asyncio.sleep(config.giveaway_entrant_flush_delay)
+		giveaway_store.flush()
 
-		# Pick winners (idempotent) and update storage
-		winners = end_giveaway(giveaway.id)
+	@commands.Cog.listener()
+	async def on_raw_reaction_add(self, payload: nextcord.RawReactionActionEvent):
+		if payload.member is not None and payload.member.bot:
+			return
+		if record_reaction_entry(payload.message_id, payload.user_id, True, str(payload.emoji)):
+			self._schedule_flush()
+
+	@commands.Cog.listener()
+	async def on_raw_reaction_remove(self, payload: nextcord.RawReactionActionEvent):
+		if record_reaction_entry(payload.message_id, payload.user_id, False, str(payload.emoji)):
+			self._schedule_flush()
+
+	async def _reconcile_active(self):
+		"""Background pass over the reactions of active giveaways, catching
+		entries made while the bot was offline."""
+		for g in giveaway_store.active():
+			channel = self.bot.get_channel(g.channel_id)
+			if isinstance(channel, nextcord.TextChannel):
+				try:
+					await reconcile_entrants(channel, g)
+				except Exception as e:
+					print(f"Error reconciling giveaway entrants: {e}")
 
-		# Fetch the channel early so we can fallback to reactions if needed
-		channel = self.bot.get_channel(giveaway.channel_id)
 
-		# If storage had no winners, fallback to reactions on the message
-		if (not winners or len(winners) == 0) and giveaway.message_id and channel and isinstance(channel, nextcord.TextChannel):
-			try:
-				react_winners = await pick_reaction_winners(channel, giveaway.message_id, [], giveaway.winners)
-				if react_winners:
-					winners = react_winners
-					# persist these winners
-					g2 = get_giveaway_by_id(giveaway.id)
-					if g2:
-						g2.winner_ids = winners
-						update_giveaway(g2)
-			except Exception:
-				pass
+	async def _on_giveaway_end(self, job: ScheduledJob):
+		"""Timer scheduler handler: end a giveaway whose end time has come,
+		then edit its post and announce the winners. Safe to run twice.
+		"""
+		giveaway = get_giveaway_by_id(job.payload.get("giveaway_id", ""))
+		# Already ended (e.g. End Now) or deleted: nothing to announce.
+		if giveaway is None or not giveaway.active:
+			return
 
-		# Fetch the channel and original message if available
+		# Winners come from the entrants tracked from reaction events, so no
+		# reaction pagination happens at end time.
 		channel = self.bot.get_channel(giveaway.channel_id)
-		mention_text = ", ".join(f"<@{w}>" for w in winners) if winners else "No winners"
-
-		# Edit original message embed if we have a message id
-		if channel and giveaway.message_id and isinstance(channel, nextcord.TextChannel):
+		if channel is None:
 			try:
-				msg = await channel.fetch_message(giveaway.message_id)
-				embed = msg.embeds[0] if msg.embeds else default_embed("🎉 Giveaway Ended 🎉")
-				embed = update_embed_winners(embed, winners)
-				await msg.edit(embed=embed, view=GiveawayView(giveaway.id, giveaway.host_id, ended=True))
-			except Exception:
-				pass
+				channel = await with_backoff(lambda: self.bot.fetch_channel(giveaway.channel_id))
+			except Exception as e:
+				print(f"Error fetching giveaway channel: {e}")
+		await finish_giveaway(
+			giveaway.id,
+			channel if isinstance(channel, nextcord.TextChannel) else None,
+			GiveawayView(giveaway.id, giveaway.host_id, ended=True),
+		)
 
-		# Announce winners
-		if channel and winners:
-				if isinstance(channel, nextcord.TextChannel):
-					await channel.send(f"🎉 Giveaway ended — congratulations: {mention_text}")
-
-	async def cog_load(self):
-		# Start the scheduler after the bot event loop is ready. setup_scheduler is idempotent.
-		setup_scheduler()
-		# Re-schedule end tasks for any active giveaways on bot startup so we
-		# can handle announcement/editing even when the bot was restarted.
-		giveaways = load_giveaways()
-		now = datetime.utcnow()
-		for g in giveaways:
-			if g.active and g.end_time > now:
-				# schedule the async handler
-				try:
-					asyncio.create_task(self._schedule_end(g))
-				except Exception:
-					pass
+	@commands.Cog.listener()
+	async def on_ready(self):
+		# on_ready fires again after reconnects; start only once. Starting
+		# after ready matters: overdue endings fire at once, and their
+		# channels must already be in the cache.
+		if self._started:
+			return
+		self._started = True
+		# Giveaways from the old single-file store are imported once, here
+		# rather than when the store module is imported.
+		giveaway_store.migrate_legacy()
+		# Endings are persisted by the timer scheduler, so nothing has to be
+		# re-created per giveaway: register the handler and start the task.
+		timer_scheduler.register(GIVEAWAY_END_JOB, self._on_giveaway_end)
+		# Giveaways created before the scheduler existed have no job yet.
+		for g in load_giveaways():
+			if g.active and timer_scheduler.get(giveaway_end_job_id(g.id)) is None:
+				schedule_giveaway_end(g)
+		timer_scheduler.start()
+		# Re-attach the buttons of every stored giveaway post. Ended ones get
+		# the Reroll view they were last edited with.
+		for g in load_giveaways():
+			if g.message_id is not None:
+				self.bot.add_view(GiveawayView(g.id, g.host_id, ended=not g.active), message_id=g.message_id)
+		# Catch up on entries made while the bot was offline, in the background.
+		self._reconcile_task = asyncio.create_task(self._reconcile_active())
+
+	def cog_unload(self):
+		# Don't lose entries still waiting for the delayed flush.
+		giveaway_store.flush()
 	@nextcord.slash_command(name="giveaway", description="Start a giveaway event.")
 	async def giveaway(
 		self,
@@ -301,13 +286,14 @@ class GiveawayCog(commands.Cog):
 		host: nextcord.Member = SlashOption(description="Host (mention a server member)", required=True),
 		winners: int = SlashOption(description="Number of winners (max 3)", required=True, min_value=1, max_value=3),
 		mention: bool = SlashOption(description="Mention @everyone?", required=False, default=False),
-		message: str = SlashOption(description="Custom message to be attached", required=False, default=None)
+		message: str = SlashOption(description="Custom message to be attached", required=False, default=None),
+		weighting: str = SlashOption(description="Weight entries by member level", required=False, default="none", choices={"Equal odds": "none", "By level": "level"})
 	):
 		# Permission check: only the bot owner or members with the role
 		# named "giveaway manager" may create giveaways. This replaced the
 		# previous admins/mods check.
 		user_id = getattr(interaction.user, "id", None)
-		member = interaction.user if isinstance(interaction.user, nextcord.Member) else (interaction.guild.get_member(user_id) if interaction.guild and user_id else None)
+		member = interaction.user if isinstance(interaction.user, nextcord.Member) else (await profile_cache.get_member(interaction.guild, user_id) if interaction.guild and user_id else None)
 		# Permission: allow only members who have the role "giveaway manager"
 		# (case-insensitive) or the bot owner
 		if not member:
@@ -336,13 +322,13 @@ class GiveawayCog(commands.Cog):
 			return
 
 		delete_expired_giveaways()
-		# Check for active giveaway
-		if get_active_giveaway():
-			await interaction.response.send_message("There is already an active giveaway. Please wait for it to end.", ephemeral=True)
+		# Several giveaways may run at once, up to the configured limit
+		if len(get_active_giveaways()) >= config.giveaway_max_active:
+			await interaction.response.send_message(f"There are already {config.giveaway_max_active} active giveaways. Please wait for one to end.", ephemeral=True)
 			return
 
 		# Prepare giveaway data
-		now = datetime.utcnow()
+		now = utc_now()
 		duration_sec = duration_to_seconds(duration)
 		end_time = now + timedelta(seconds=duration_sec)
 		giveaway_id = str(uuid.uuid4())
@@ -361,7 +347,8 @@ class GiveawayCog(commands.Cog):
 			active=True,
 			participants=[],
 			winner_ids=[],
-			message_id=None
+			message_id=None,
+			weighting=weighting
 		)
 		start_giveaway(giveaway_obj)
 
@@ -374,22 +361,17 @@ class GiveawayCog(commands.Cog):
 		content = "@everyone" if mention else None
 		msg = await giveaway_channel.send(content=content, embed=embed, view=view)
 
-		# Reacting with 🎉 so people can enter by reacting — store message id
-		# and persist it so we can examine reactions when the giveaway ends.
+		# Store the message ID right away so we can edit it later: reactions
+		# count as entries only once the post is linked to its giveaway, and
+		# members may react before the bot's own 🎉 is added. The ending was
+		# scheduled by start_giveaway.
+		set_giveaway_message(giveaway_id, msg.id)
+
+		# Reacting with 🎉 so people can enter by reacting.
 		try:
 			await msg.add_reaction("🎉")
 		except Exception:
 			# ignore if missing permissions or other errors
 			pass
 
-		# Store the message ID so we can edit it later
-		giveaway_obj.message_id = msg.id
-		update_giveaway(giveaway_obj)
-
-		# Schedule the async end handler so the bot can edit/announce winners
-		try:
-			asyncio.create_task(self._schedule_end(giveaway_obj))
-		except Exception:
-			pass
-
 		await interaction.response.send_message(f"Giveaway started in <#{giveaway_channel.id}>!", ephemeral=True)
@@ -1,7 +1,6 @@
 import nextcord
 from nextcord.ext import commands
-from src.utils.config import emojis
-from src.utils.functions.grim_calc import get_grim_calc
+from src.utils.functions.grim_calc import get_grim_calc, format_grim_calc, get_grim_reach, format_grim_reach
 
 
 class GrimCalc(commands.Cog):
@@ -34,8 +33,8 @@ class GrimCalc(commands.Cog):
         ),
         goal_lvl: int = nextcord.SlashOption(
             name="goal_lvl",
-            description="Target grimoire level (1-150)",
-            required=True,
+            description="Target grimoire level (1-150), leave empty to see what your resources reach",
+            required=False,
             min_value=1,
             max_value=150
         ),
@@ -45,16 +44,46 @@ class GrimCalc(commands.Cog):
             required=False,
             min_value=1,
             max_value=150
+        ),
+        essence: int = nextcord.SlashOption(
+            name="essence",
+            description="Essence you have, to find the highest level you can reach",
+            required=False,
+            min_value=0
+        ),
+        imprint: int = nextcord.SlashOption(
+            name="imprint",
+            description="Imprint you have (Imprint book only)",
+            required=False,
+            min_value=0
         )
     ):
         """
         Calculates the resource cost to upgrade a Grimoire from a current level
-        to a target (goal) level.
+        to a target (goal) level, or, without a goal level, the highest level
+        the given essence (and imprint) can reach.
         """
         try:
             # Defer the response to avoid timeouts
             await interaction.response.defer()
 
+            # Without a goal level, answer the reverse query from the given resources
+            if goal_lvl is None:
+                if essence is None:
+                    await interaction.followup.send(
+                        "⚠️ Provide a goal level, or the essence you have to see what it reaches.",
+                        ephemeral=True
+                    )
+                    return
+
+                reach = get_grim_reach(book, essence, imprint if book == "Imprint" else None, current_lvl)
+                if reach.error:
+                    await interaction.followup.send(f"⚠️ {reach.error}", ephemeral=True)
+                    return
+
+                await interaction.followup.send(format_grim_reach(book, reach))
+                return
+
             # Get calculation from the helper function
             result = get_grim_calc(book, goal_lvl, current_lvl)
 
@@ -66,25 +95,9 @@ class GrimCalc(commands.Cog):
                 )
                 return
 
-            # Determine book name for the response
-            if book.lower() == "enable":
-                book_name = f"{emojis.grim_book1} Grimoire • Enabling Chapter"
-                level_range = f"`{current_lvl} → {goal_lvl}`" if current_lvl else f"`→ {goal_lvl}`"
-                response = (
-                    f"> **{book_name}** {level_range}\n"
-                    f"> \n"
-                    f"> {emojis.grim_essence} `{result.essence_cost:,}` {result.essence_choices:.2f} event choices"
-                )
-            else:  # Imprint
-                book_name = "Grimoire • Imprint Chapter"
-                level_range = f"`{current_lvl} → {goal_lvl}`" if current_lvl else f"`→ {goal_lvl}`"
-                response = (
-                    f"> **{book_name}** {level_range}\n"
-                    f"> \n"
-                    f"> {emojis.grim_essence} `{result.essence_cost:,}` {result.essence_choices:.2f} event choices\n"
-                    f"> {emojis.grim_imprint} `{result.imprint_cost:,}` {result.imprint_choices:.2f} event choices"
-                )
-            
+            # Format the response with the shared helper used by the agent tool
+            response = format_grim_calc(book, goal_lvl, current_lvl, result)
+
             await interaction.followup.send(response)
 
         except Exception as e:
@@ -2,16 +2,20 @@
 """
 This module implements the `/imagine` slash command, which allows users to generate
 images using DALL-E 3.
+
+Generation runs on a shared async OpenAI client, so the event loop keeps
+serving leveling, giveaways and heartbeats while an image is being made.
 """
-import os
+import asyncio
 import nextcord
 from nextcord.ext import commands
-from openai import OpenAI
 from src.utils.config import config
-from dotenv import load_dotenv
-
-load_dotenv()
-API_KEY = os.getenv("OPENAI_API_KEY")
+from src.utils.functions.image_generation import (
+    GenerationQueue,
+    QueueFullError,
+    UserRateLimiter,
+    close_openai_client,
+)
 
 
 class Imagine(commands.Cog):
@@ -26,7 +30,16 @@ class Imagine(commands.Cog):
             bot (commands.Bot): The bot instance this cog is being added to.
         """
         self.bot = bot
-        self.openai_client = OpenAI(api_key=API_KEY)
+        self.rate_limiter = UserRateLimiter(config.imagine_user_cooldown)
+        self.queue = GenerationQueue(config.imagine_max_concurrent, config.imagine_max_pending)
+
+    def cog_unload(self):
+        """Close the shared OpenAI connection pool when the cog is unloaded."""
+        try:
+            asyncio.get_running_loop().create_task(close_openai_client())
+        except RuntimeError:
+            # No running loop (bot already stopped) — nothing left to close on.
+            pass
 
     @nextcord.slash_command(
         name="imagine",
@@ -49,21 +62,36 @@ class Imagine(commands.Cog):
             interaction (Interaction): The interaction object.
             prompt (str): The user's prompt.
         """
+        # Per-user rate limit, checked before deferring so the refusal is ephemeral.
+        # The hit is recorded now so concurrent requests are refused, and given
+        # back below if the request is not accepted or yields no image.
+        user_id = interaction.user.id if interaction.user else 0
+        retry_after = self.rate_limiter.hit(user_id)
+        if retry_after > 0:
+            await interaction.response.send_message(
+                f"⏳ Slow down, you can imagine again in {retry_after:.0f}s.", ephemeral=True
+            )
+            return
+
         await interaction.response.defer()
 
         try:
-            response = self.openai_client.images.generate(
-                model="dall-e-3",
-                prompt=prompt,
-                size="1024x1024",
-                quality="standard",
-                n=1,
-            )
-            image_url = response.data[0].url
+            image_url = await self.queue.generate(prompt)
+            if not image_url:
+                self.rate_limiter.refund(user_id)
+                await interaction.followup.send("⚠️ No image was returned, kindly try again.", ephemeral=True)
+                return
             await interaction.followup.send(image_url)
 
+        except QueueFullError:
+            self.rate_limiter.refund(user_id)
+            await interaction.followup.send(
+                "⚠️ Too many images are being generated right now, kindly try again later.", ephemeral=True
+            )
+
         except Exception as e:
             print(e)
+            self.rate_limiter.refund(user_id)
             await interaction.followup.send(
                 "⚠️ Something went wrong, kindly try again.", ephemeral=True
             )
@@ -2,6 +2,7 @@ import nextcord
 from nextcord.ext import commands
 from src.utils.config import config, emojis
 from src.utils.functions import get_top_users
+from src.utils.functions.profile_cache import profile_cache
 
 
 class Leaderboard(commands.Cog):
@@ -47,15 +48,13 @@ class Leaderboard(commands.Cog):
             )
 
             # Attempt to set the thumbnail to the avatar of the #1 ranked user.
-            try:
-                top_user_id, _ = top[0]
-                user = await self.bot.fetch_user(int(top_user_id))
-                if user and user.display_avatar:
-                    embed.set_thumbnail(url=user.display_avatar.url)
-            except (nextcord.NotFound, IndexError):
+            top_user_id, _ = top[0]
+            user = await profile_cache.get_user(self.bot, int(top_user_id))
+            if user and user.display_avatar:
+                embed.set_thumbnail(url=user.display_avatar.url)
+            elif self.bot.user and self.bot.user.avatar:
                 # Fallback to the bot's avatar if the top user can't be fetched.
-                if self.bot.user and self.bot.user.avatar:
-                    embed.set_thumbnail(url=self.bot.user.avatar.url)
+                embed.set_thumbnail(url=self.bot.user.avatar.url)
 
             # ============================================================================
             # POPULATE EMBED WITH TOP USERS
@@ -66,13 +65,10 @@ class Leaderboard(commands.Cog):
                 level = data.get("level", 1)
                 xp = data.get("xp", 0)
 
-                # Fetch the user object to get their display name.
-                try:
-                    user_obj = self.bot.get_user(int(user_id)) or await self.bot.fetch_user(int(user_id))
-                    name = user_obj.display_name if user_obj else f"<@{user_id}>"
-                except nextcord.NotFound:
-                    # If the user can't be fetched, fall back to mentioning their ID.
-                    name = f"Unknown User (ID: {user_id})"
+                # Look the user up in the profile cache to get their display name,
+                # falling back to their ID if the user can't be found.
+                user_obj = await profile_cache.get_user(self.bot, int(user_id))
+                name = user_obj.display_name if user_obj else f"Unknown User (ID: {user_id})"
 
                 # Add a field for each user, including rank, name, level, and XP.
                 embed.add_field(
@@ -2,7 +2,7 @@ import nextcord
 from nextcord import SlashOption
 from nextcord.ext import commands
 from src.utils.config import config
-from src.utils.functions import get_xp_required_for_level
+from src.utils.functions import get_xp_required_for_level, get_xp_between_levels, get_level_reached
 
 
 class EachLevelCosts(commands.Cog):
@@ -11,7 +11,7 @@ class EachLevelCosts(commands.Cog):
 
     @nextcord.slash_command(
         name="lvl_costs",
-        description="Show cumulative XP required to reach a specified level (max 250)",
+        description="Show the XP required for a level (max 250), or the level some XP reaches",
         guild_ids=[config.exile_server_id]
     )
     async def lvl_costs(
@@ -19,14 +19,54 @@ class EachLevelCosts(commands.Cog):
         interaction: nextcord.Interaction,
         level: int = SlashOption(
             description="Target level (1-250)",
-            required=True,
+            required=False,
             min_value=1,
             max_value=250
         ),
+        from_level: int = SlashOption(
+            description="Starting level, to show the XP between it and the target level",
+            required=False,
+            min_value=0,
+            max_value=250
+        ),
+        xp: int = SlashOption(
+            description="Total XP, to show the level it reaches",
+            required=False,
+            min_value=0
+        ),
     ):
         try:
             await interaction.response.defer()
 
+            # Without a target level, answer which level the given XP reaches
+            if level is None:
+                if xp is None:
+                    await interaction.followup.send("⚠️ Provide a target level or an amount of XP.", ephemeral=True)
+                    return
+
+                reached = get_level_reached(xp)
+                next_xp = get_xp_required_for_level(reached + 1)
+                response = f"**{xp:,}** XP reaches level **{reached}**"
+                if next_xp is not None:
+                    response += f" ({next_xp - xp:,} XP to level {reached + 1})"
+                await interaction.followup.send(response, ephemeral=True)
+                return
+
+            if from_level is not None:
+                xp_between = get_xp_between_levels(from_level, level)
+                if xp_between is None:
+                    await interaction.followup.send(
+                        "⚠️ The starting level must not be above the target level.",
+                        ephemeral=True
+                    )
+                    return
+
+                await interaction.followup.send(
+                    f"Level **{from_level}** → **{level}** requires **{xp_between:,}** XP",
+                    ephemeral=True
+                )
+                return
+
             xp_req = get_xp_required_for_level(level)
             if xp_req is None:
                 await interaction.followup.send(
@@ -4,6 +4,7 @@ from nextcord.ext import commands
 from src.utils.config import config
 from src.utils.functions.add_role import add_role_to_user
 from src.utils.functions.remove_role import remove_role_from_user
+from src.utils.functions.profile_cache import profile_cache
 
 
 class ManageRole(commands.Cog):
@@ -37,8 +38,13 @@ class ManageRole(commands.Cog):
                 )
                 return
 
-            # Get the member object from the user - fetch fresh data
-            member = await interaction.guild.fetch_member(user.id)
+            # The interaction resolves the option to a member with its current
+            # roles; only look it up (cache first) when it came as a plain user.
+            if isinstance(user, nextcord.Member):
+                member = user
+                profile_cache.put_member(member)
+            else:
+                member = await profile_cache.get_member(interaction.guild, user.id)
             if not member:
                 await interaction.response.send_message(
                     f"❌ User {user} is not a member of this server.",
@@ -1,6 +1,7 @@
 import nextcord
 from nextcord.ext import commands
 from src.utils.functions import get_se_hp
+from src.utils.functions.se_hp import get_se_damage, get_se_hp_table
 from src.utils.config import emojis
 
 
@@ -41,6 +42,28 @@ class BossHP(commands.Cog):
             min_value=1,
             max_value=100,
             default=100
+        ),
+        to_boss: int = nextcord.SlashOption(
+            name="to_boss",
+            description="Target boss(1-200) to get the damage needed to reach it [optional]",
+            required=False,
+            min_value=1,
+            max_value=200
+        ),
+        to_perc: int = nextcord.SlashOption(
+            name="to_percentage",
+            description="Target boss remaining percentage(0-100), 0 to kill it [optional]",
+            required=False,
+            min_value=0,
+            max_value=100,
+            default=0
+        ),
+        table_step: int = nextcord.SlashOption(
+            name="table_step",
+            description="Show the HP every N percent(5-50) [optional]",
+            required=False,
+            min_value=5,
+            max_value=50
         )
     ):
         try:
@@ -50,13 +73,26 @@ class BossHP(commands.Cog):
 
             print("SE command initialized")
 
-            result: str = get_se_hp(boss, perc)
+            result = get_se_hp(boss, perc)
             print(f"Functions called\n{result}")
             if not result:
                 response = f"No available data for {boss}{emoji_boss}"
             else:
                 response = f"> **x{boss}** {emoji_hp} at **{perc}%**\n> \n> {emoji_boss} **{result:.13e}** remaining"
 
+                # Damage needed to reach another boss/percentage, clearing every stage in between
+                if to_boss is not None:
+                    damage = get_se_damage(boss, perc, to_boss, to_perc)
+                    if damage is None:
+                        response += f"\n> \n> ⚠️ Can't go back from **x{boss}** at **{perc}%** to **x{to_boss}** at **{to_perc}%**"
+                    else:
+                        response += f"\n> \n> **x{to_boss}** at **{to_perc}%** needs **{damage:.13e}** damage"
+
+                # HP at every `table_step` percent, from full HP down
+                if table_step is not None:
+                    rows = get_se_hp_table(boss, range(100, 0, -table_step))
+                    response += "\n> " + "".join(f"\n> `{p:>3}%` {hp:.13e}" for p, hp in rows)
+
             await interaction.response.send_message(response)
 
         except Exception as e:
@@ -1,14 +1,12 @@
 import nextcord
 from nextcord.ext import commands
 from src.utils.config import config
-from src.utils.functions.reload_config import reload_all
-import json
-import os
+from src.utils.functions.awaken_pools import pool_registry
 
 class SwitchPool(commands.Cog):
     """
     Switch Command Cog.
-    Provides a slash command to switch the value in awaPool.json.
+    Provides a slash command to switch the active awakening pool.
     """
     
     def __init__(self, bot: commands.Bot):
@@ -35,40 +33,20 @@ class SwitchPool(commands.Cog):
         )
     ):
         """
-        Switch the value in awaPool.json.
+        Switch the active awakening pool and persist the choice in awaPool.json.
         
         Args:
             interaction (nextcord.Interaction): The interaction instance
-            value (bool): The boolean value to set in the file
+            value (bool): True for the normal pool, False for the buffed pool
         """
         try:
-            pool_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "awaPool.json")
-            
-            with open(pool_path, "r") as f:
-                data = json.load(f)
-                
-            data["normal"] = value
-            
-            with open(pool_path, "w") as f:
-                json.dump(data, f, indent=4)
-            
-            # Reload all modules to ensure the change takes effect
-            success, report = reload_all(self.bot)
-            
-            if success:
-                pool_type = "normal" if value else "buffed"
-                await interaction.response.send_message(
-                    f"✅ Successfully switched to **{pool_type}** pool!",
-                    ephemeral=True
-                )
-            else:
-                msg = ["⚠️ Pool was switched but reload had some issues:"]
-                if report["failed"]:
-                    msg.extend(f"• {error}" for error in report["failed"])
-                await interaction.response.send_message(
-                    "\n".join(msg),
-                    ephemeral=True
-                )
+            # Persist the flag and swap the active pool in memory; no reload needed.
+            pool = pool_registry.switch(value)
+
+            await interaction.response.send_message(
+                f"✅ Successfully switched to **{pool.name}** pool!",
+                ephemeral=True
+            )
         except Exception as e:
             await interaction.response.send_message(f"Error: {str(e)}", ephemeral=True)
 
@@ -0,0 +1,91 @@
+import nextcord
+from nextcord import Interaction, SlashOption
+from nextcord.ext import commands
+from src.utils.config import config, roles
+from src.utils.functions.level_roles import RoleSyncReport, format_sync_report, sync_level_roles
+
+
+class SyncLevelRoles(commands.Cog):
+    """
+    SyncLevelRoles Command Cog.
+    Provides a slash command giving every member in the leveling store the
+    level roles of their level. Restricted to bot owner only.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        """
+        Initialize the SyncLevelRoles cog.
+
+        Args:
+            bot (commands.Bot): The bot instance this cog is being added to
+        """
+        self.bot = bot
+        self.running = False
+
+    @nextcord.slash_command(
+        name="sync_level_roles",
+        description="Give every member the level roles of their level",
+        guild_ids=[config.exile_server_id]
+    )
+    @commands.is_owner()  # Only bot owner can use this command
+    async def sync_level_roles_cmd(
+        self,
+        interaction: Interaction,
+        apply: bool = SlashOption(description="Apply the changes (default: only count them)", required=False, default=False),
+        restart: bool = SlashOption(description="Start over instead of resuming an interrupted sync", required=False, default=False)
+    ):
+        """Diff every member's level roles and apply the changes in bulk."""
+        if not interaction.guild:
+            await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
+            return
+        if not roles.level_roles:
+            await interaction.response.send_message("❌ No level roles are configured.", ephemeral=True)
+            return
+        if self.running:
+            await interaction.response.send_message("⏳ A level role sync is already running.", ephemeral=True)
+            return
+
+        self.running = True
+        try:
+            await interaction.response.defer(ephemeral=True)
+            status = await interaction.followup.send("⏳ Syncing level roles...", ephemeral=True, wait=True)
+
+            async def on_progress(report: RoleSyncReport):
+                # Progress edits are best effort: the interaction token expires
+                # after 15 minutes, the sync goes on regardless.
+                try:
+                    await status.edit(content=f"⏳ Syncing level roles...\n{format_sync_report(report)}")
+                except Exception:
+                    pass
+
+            # With the members intent, one chunk request fills the member cache
+            # instead of one fetch per uncached member.
+            if self.bot.intents.members and not interaction.guild.chunked:
+                await interaction.guild.chunk()
+
+            report = await sync_level_roles(
+                interaction.guild,
+                dry_run=not apply,
+                resume=not restart,
+                on_progress=on_progress,
+            )
+            title = "✅ Level roles synced." if apply else "🔎 Dry run, no roles changed."
+            message = f"{title}\n{format_sync_report(report)}"
+            try:
+                await status.edit(content=message)
+            except Exception:
+                if isinstance(interaction.channel, nextcord.TextChannel):
+                    await interaction.channel.send(message)
+
+        except Exception as e:
+            print(f"Error in /sync_level_roles command: {e}")
+            try:
+                await interaction.followup.send(f"❌ Level role sync stopped: {str(e)}\nRun it again to resume.", ephemeral=True)
+            except Exception:
+                pass
+        finally:
+            self.running = False
+
+
+def setup(bot: commands.Bot):
+    bot.add_cog(SyncLevelRoles(bot))
@@ -4,7 +4,7 @@ from src.utils.functions import format_relative_date
 from nextcord import SlashOption
 from nextcord.ext import commands
 from src.utils.config import config
-from src.utils.functions import fetch_user_level
+from src.utils.functions import fetch_user_level, get_messages_to_level
 
 
 class UserStats(commands.Cog):
@@ -63,6 +63,9 @@ class UserStats(commands.Cog):
             if xp_for_next_level > 0:
                 progress_percent = int((xp_progress / xp_for_next_level) * 100)
 
+            # Estimate the messages left with the user's cached XP factors (no file I/O).
+            messages_to_next = get_messages_to_level(target.id, total_xp, current_level + 1)
+
             # ============================================================================
             # EMBED CREATION
             # ============================================================================
@@ -154,6 +157,12 @@ class UserStats(commands.Cog):
                 value=f"{xp_progress:,} / {xp_for_next_level:,} XP ({progress_percent}%)",
                 inline=False,
             )
+            if messages_to_next:
+                embed.add_field(
+                    name="Next Level ETA",
+                    value=f"~{messages_to_next:,} messages",
+                    inline=True,
+                )
 
             # Send the completed embed.
             await interaction.followup.send(embed=embed)
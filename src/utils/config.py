@@ -11,7 +11,7 @@ project root.
 """
 import os
 from dotenv import load_dotenv
-from .types.config import Emojis, Channels, Config, Roles, XpBonus, XpMultiplier, XpTrueMultiplier, UserIDs
+from .types.config import Emojis, Channels, Config, Roles, XpBonus, XpMultiplier, XpTrueMultiplier, UserIDs, LevelRole
 
 # Load environment variables from the .env file in the project root.
 load_dotenv()
@@ -89,6 +89,18 @@ roles.xp_true_multipliers = [
     XpTrueMultiplier(id=roles.premium_xp, value=2.0)
 ]
 
+# ============================================================================
+# LEVEL ROLES
+# Roles granted from a level on. Members keep only the highest level role
+# they reached unless `roles.level_roles_stack` is set. Applied on level-up
+# and in bulk by /sync_level_roles.
+# ============================================================================
+
+roles.level_roles = [
+    # Example: Grant a role from level 10 on.
+    # LevelRole(level=10, id=123456789012345678),
+]
+
 # ============================================================================
 # LEVEL-BASED XP MULTIPLIER
 # Tier 3 of the XP calculation. This multiplier scales with the user's level.
@@ -16,7 +16,7 @@ dt_cost: List[Costs] = [
     Costs(
         name = "origin",
         gems = 5,
-        spiritvein = 197-236,
+        spiritvein = 197_236,
         cots = 420_000,
         stellars = 821_540
     ),
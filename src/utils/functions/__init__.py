@@ -6,10 +6,10 @@ from .dice import roll_dice
 from .ping import get_ping_response
 from .se_hp import get_se_hp
 from .dt_calc import get_dt_calc
-from .leveling import add_xp, get_user_level_info, get_level_for_xp, get_xp_for_level
+from .leveling import add_xp, get_user_level_info, get_level_for_xp, get_xp_for_level, get_messages_to_level
 from .user_level import fetch_user_level
 from .leaderboard import get_top_users
-from .xp_required import get_xp_required_for_level
+from .xp_required import get_xp_required_for_level, get_xp_between_levels, get_level_reached
 from .time_utils import format_relative_date
 
-__all__ = ['roll_dice', 'get_ping_response', 'get_se_hp', 'get_dt_calc', 'add_xp', 'get_user_level_info', 'get_level_for_xp', 'get_xp_for_level', 'fetch_user_level', 'get_top_users', 'get_xp_required_for_level', 'format_relative_date']
+__all__ = ['roll_dice', 'get_ping_response', 'get_se_hp', 'get_dt_calc', 'add_xp', 'get_user_level_info', 'get_level_for_xp', 'get_xp_for_level', 'get_messages_to_level', 'fetch_user_level', 'get_top_users', 'get_xp_required_for_level', 'get_xp_between_levels', 'get_level_reached', 'format_relative_date']
@@ -1,107 +1,328 @@
-import random, json, os
-from importlib import import_module
-from typing import List, Dict, Any, Optional, Tuple
+import math, random
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
 
-def get_current_pool() -> Tuple[List[Dict[str, Any]], str]:
+from pydantic import BaseModel, ConfigDict
+
+from src.utils.types.game_tables import AwakeningPoolTable
+from .awaken_pools import pool_registry
+from .memo import memoize
+
+# Upper bound for a single `/awaken` simulation.
+MAX_AWAKENINGS = 1_000_000
+
+# CSG spent per awakening.
+CSG_PER_AWAKENING = 100
+
+# Analytic mode: outcomes are treated as rare while their expected number of
+# hits stays below `_RARE_HITS`, and up to `_MAX_RARE_HITS` hits are enumerated.
+_RARE_HITS = 0.5
+_MAX_RARE_HITS = 3
+_NORMAL = NormalDist()
+
+
+class OutcomeBand(BaseModel):
+    """
+    Distribution summary of a total over many awakenings.
+
+    Attributes:
+        mean (float): Expected total.
+        std (float): Standard deviation of the total.
+        p5 (float): 5th percentile of the total.
+        p95 (float): 95th percentile of the total.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    mean: float
+    std: float
+    p5: float
+    p95: float
+
+
+class AwakeningForecast(BaseModel):
+    """
+    Analytic forecast of the returns of a number of awakenings.
+
+    Attributes:
+        pool_name (str): The pool the forecast was computed for.
+        iterations (int): Number of awakenings.
+        csg (int): CSG spent on the awakenings.
+        retire (OutcomeBand): Total retire value.
+        points (OutcomeBand): Total gala points.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    pool_name: str
+    iterations: int
+    csg: int
+    retire: OutcomeBand
+    points: OutcomeBand
+
+
+def get_current_pool() -> Tuple[AwakeningPoolTable, str]:
     """
     Get the current pool configuration.
-    
+
+    The active pool is held in memory by the pool registry, so no file is
+    read here.
+
     Returns:
-        tuple[list, str]: A tuple containing the pool data and pool name
+        tuple[AwakeningPoolTable, str]: A tuple containing the pool table and pool name
     """
-    # reading json file 
-    with open("data/awaPool.json", "r") as f:
-        curr_pool = json.load(f)
+    pool = pool_registry.active
+    return pool, pool.name
+
+
+def draw_index(pool: AwakeningPoolTable, rng: Optional[random.Random] = None) -> int:
+    """
+    Draw one outcome index from `pool` with the alias method, in O(1).
+
+    Args:
+        pool (AwakeningPoolTable): The pool to draw from
+        rng (random.Random): The random source, defaults to the module RNG
 
-    if not curr_pool["normal"]:
-        module = import_module("src.utils.awa_pool_buffed")
-        pool = module.pool
-        pool_name: str = "buffed"
-    else:
-        module = import_module("src.utils.awa_pool")
-        pool = module.pool
-        pool_name: str = "normal"
-    
-    return pool, pool_name
+    Returns:
+        int: Index of the drawn outcome in the pool columns
+    """
+    u = (rng or random).random() * len(pool.alias_prob)
+    slot = int(u)
+    # The fractional part of `u` is itself uniform, so one random number suffices.
+    return slot if u - slot < pool.alias_prob[slot] else pool.alias_index[slot]
 
 
-def get_random_answer(pool: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+def get_random_answer(pool: Optional[AwakeningPoolTable] = None) -> Optional[str]:
     """
     Get a random awakening result based on the probability distribution.
-    
+
     Args:
-        pool (list): List of possible awakening outcomes with their probabilities
-        
+        pool (AwakeningPoolTable): The pool to draw from, defaults to the current pool
+
     Returns:
         str | None: The selected awakening grade or None if an error occurs
     """
     if pool is None:
         pool, _ = get_current_pool()
-        
-    random_value = random.random()
-    cumulative_probability = 0.0
 
-    for item in pool:
-        cumulative_probability += item["probability"]
-        if random_value < cumulative_probability:
-            return item["answer"]
+    return pool.answers[draw_index(pool)]
+
+
+def simulate_counts(pool: AwakeningPoolTable, iterations: int, rng: Optional[random.Random] = None) -> List[int]:
+    """
+    Simulate `iterations` awakenings and return how often each outcome occurred.
+
+    Small batches are drawn one by one from the alias table. Larger batches
+    are tallied in one multinomial draw, split into one binomial draw per
+    outcome, so the cost depends on the number of outcomes, not on `iterations`.
+    Both paths sample exactly the same distribution.
+
+    Args:
+        pool (AwakeningPoolTable): The pool to draw from
+        iterations (int): Number of awakenings to simulate
+        rng (random.Random): The random source, defaults to the module RNG
+
+    Returns:
+        List[int]: Count of each outcome, in pool order
+    """
+    source = rng or random
+    counts = [0] * len(pool.answers)
+
+    if iterations < len(counts):
+        for _ in range(iterations):
+            counts[draw_index(pool, rng)] += 1
+        return counts
 
-    return None
+    remaining = iterations
+    remaining_mass = sum(pool.probabilities)
+    for index, probability in enumerate(pool.probabilities):
+        if remaining <= 0 or remaining_mass <= 0:
+            break
+        if index == len(counts) - 1:
+            count = remaining
+        else:
+            # Binomial draw conditioned on the outcomes already tallied.
+            count = source.binomialvariate(remaining, min(1.0, probability / remaining_mass))
+        counts[index] = count
+        remaining -= count
+        remaining_mass -= probability
+    return counts
 
 
-def run_multiple_selections(iterations: int) -> Tuple[Dict[str, int], List[Dict[str, Any]], str]:
+def run_multiple_selections(iterations: int) -> Tuple[Dict[str, int], AwakeningPoolTable, str]:
     """
     Perform multiple awakening attempts and track results.
-    
+
     Args:
         iterations (int): Number of awakening attempts to perform
-        
+
     Returns:
         Tuple containing:
             - Dict[str, int]: Results count for each outcome
-            - List[Dict[str, Any]]: Current pool configuration
+            - AwakeningPoolTable: Current pool table
             - str: Pool name (normal/buffed)
     """
     # Get current pool
     current_pool, pool_name = get_current_pool()
-    
-    # Initialize results tracking
-    results = {item["answer"]: 0 for item in current_pool}
-    
-    # Perform awakenings
-    for _ in range(iterations):
-        result = get_random_answer(current_pool)
-        if result is not None:
-            results[result] += 1
+
+    counts = simulate_counts(current_pool, iterations)
+    results = dict(zip(current_pool.answers, counts))
 
     return results, current_pool, pool_name
 
 
-def make_response(iterations: int) -> str:
+def _total_band(pool: AwakeningPoolTable, values: Tuple[int, ...], iterations: int) -> OutcomeBand:
+    """
+    Summarize the sum of `values` over `iterations` independent awakenings.
+
+    The mean and standard deviation are exact. For the percentiles, outcomes
+    too rare to show up reliably (the rarest ones, up to `_RARE_HITS` expected
+    hits in total) are split off: the sum of the common outcomes is
+    approximated as normal, while up to `_MAX_RARE_HITS` rare hits are
+    enumerated exactly, so jackpot grades do not smear the bands. The work
+    depends on the pool size only, never on `iterations`.
+    """
+    total = sum(pool.probabilities)
+    probs = [p / total for p in pool.probabilities]
+    mean = sum(p * v for p, v in zip(probs, values))
+    variance = max(0.0, sum(p * v * v for p, v in zip(probs, values)) - mean * mean)
+
+    # Rarest outcomes first, while their expected number of hits stays small.
+    rare: List[int] = []
+    rare_mass = 0.0
+    for index in sorted(range(len(probs)), key=probs.__getitem__):
+        if iterations * (rare_mass + probs[index]) > _RARE_HITS:
+            break
+        rare.append(index)
+        rare_mass += probs[index]
+
+    common_mass = 1.0 - rare_mass
+    common = [i for i in range(len(probs)) if i not in rare]
+    common_mean = sum(probs[i] * values[i] for i in common) / common_mass if common else 0.0
+    common_var = (
+        max(0.0, sum(probs[i] * values[i] ** 2 for i in common) / common_mass - common_mean ** 2) if common else 0.0
+    )
+
+    # Mixture components (weight, mean, std): k rare hits summing to `rare_sum`,
+    # plus the normal approximation of the remaining draws.
+    components: List[Tuple[float, float, float]] = []
+    rare_sums: Dict[int, float] = {0: 1.0}
+    for hits in range(min(iterations, _MAX_RARE_HITS) + 1):
+        if hits:
+            grown: Dict[int, float] = {}
+            for rare_sum, chance in rare_sums.items():
+                for i in rare:
+                    key = rare_sum + values[i]
+                    grown[key] = grown.get(key, 0.0) + chance * probs[i] / rare_mass
+            rare_sums = grown
+        weight = math.comb(iterations, hits) * rare_mass ** hits * common_mass ** (iterations - hits)
+        draws = iterations - hits
+        for rare_sum, chance in rare_sums.items():
+            components.append((weight * chance, rare_sum + draws * common_mean, math.sqrt(draws * common_var)))
+
+    def cdf(x: float) -> float:
+        return sum(
+            w * (_NORMAL.cdf((x - m) / sd) if sd > 0 else float(x >= m))
+            for w, m, sd in components
+        )
+
+    def quantile(q: float) -> float:
+        low, high = float(iterations * min(values)), float(iterations * max(values))
+        for _ in range(60):
+            mid = (low + high) / 2
+            if cdf(mid) < q:
+                low = mid
+            else:
+                high = mid
+        return high
+
+    return OutcomeBand(
+        mean=iterations * mean,
+        std=math.sqrt(iterations * variance),
+        p5=quantile(0.05),
+        p95=quantile(0.95),
+    )
+
+
+@memoize(maxsize=1024)
+def forecast_awakenings(pool: AwakeningPoolTable, iterations: int) -> AwakeningForecast:
+    """
+    Compute the expected returns of `iterations` awakenings without simulating them.
+
+    Each awakening is an independent draw from the pool, so the totals'
+    moments follow from the per-outcome probabilities in time independent
+    of `iterations`.
+
+    Args:
+        pool (AwakeningPoolTable): The pool to forecast
+        iterations (int): Number of awakenings
+
+    Returns:
+        AwakeningForecast: Expected retire value and gala points with 5th/95th percentile bands
+    """
+    return AwakeningForecast(
+        pool_name=pool.name,
+        iterations=iterations,
+        csg=iterations * CSG_PER_AWAKENING,
+        retire=_total_band(pool, pool.retire, iterations),
+        points=_total_band(pool, pool.points, iterations),
+    )
+
+
+def make_forecast_response(iterations: int) -> str:
+    """
+    Format an analytic awakening forecast into a Discord message.
+
+    Args:
+        iterations (int): Number of awakenings to forecast
+
+    Returns:
+        str: Formatted Discord message with the expected retire value and gala
+             points and their 5th-95th percentile bands
+    """
+    pool, _ = get_current_pool()
+    forecast = forecast_awakenings(pool, iterations)
+    retire, points = forecast.retire, forecast.points
+
+    return (
+        f"Expected returns for `{iterations}` awakenings with **{forecast.pool_name}** odds\n\n"
+        f"CSG's Spent: `{forecast.csg}` \n"
+        f"Expected Retired Amount: `{retire.mean:.0f}` (5%-95%: `{retire.p5:.0f}` - `{retire.p95:.0f}`) \n"
+        f"Expected Return: `{(retire.mean / forecast.csg) * 100:.1f}%` "
+        f"(5%-95%: `{(retire.p5 / forecast.csg) * 100:.1f}%` - `{(retire.p95 / forecast.csg) * 100:.1f}%`) \n\n"
+        f"Expected Gala Points: `{points.mean:.0f}` (5%-95%: `{points.p5:.0f}` - `{points.p95:.0f}`)"
+    )
+
+
+def make_response(iterations: int, analytic: bool = False) -> str:
     """
     Format awakening results into a Discord message.
-    
+
     Args:
         iterations (int): Number of awakening attempts performed
-        
+        analytic (bool): Report the exact expected returns instead of a simulation
+
     Returns:
         str: Formatted Discord message with awakening statistics
              including retire value, CSG cost, and gala points
     """
+    if not 1 <= iterations <= MAX_AWAKENINGS:
+        return f"⚠️ The number of awakenings must be between 1 and {MAX_AWAKENINGS}."
+
+    if analytic:
+        return make_forecast_response(iterations)
+
     results, pool, pool_name = run_multiple_selections(iterations)
-    
+
     retire = 0
     gala_points = 0
-    csg: int = iterations * 100
+    csg: int = iterations * CSG_PER_AWAKENING
     final_response: str = f"You awakened `{iterations}` times with **{pool_name}** odds\n\n"
 
     for index, (result, count) in enumerate(results.items()):
         if count > 0:
-            current_data = pool[index]
-            final_response += f"- {current_data['emoji']} x {count} -> {current_data['retire'] * count}\n"
-            retire += current_data["retire"] * count
-            gala_points += current_data["points"] * count
+            final_response += f"- {pool.emojis[index]} x {count} -> {pool.retire[index] * count}\n"
+            retire += pool.retire[index] * count
+            gala_points += pool.points[index] * count
 
     final_response += f"\nCSG's Spent: `{csg}` \nRetired Amount: `{retire}` \nReturn Valued at: `{(retire/csg) * 100:.1f}%` \n\nPoints Earned for Gala: `{gala_points}`"
 
-    return final_response
\ No newline at end of file
+    return final_response
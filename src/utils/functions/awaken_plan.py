@@ -0,0 +1,324 @@
+"""
+"What-if" planner over the awakening pools.
+
+Answers questions such as "how many awakenings for a 90% chance at an A- or
+better?" or "what are my chances with 100k CSG?" for both pools side by side.
+Grade-hit questions are answered exactly with geometric/binomial math. The
+chance of getting back a given share of the CSG spent has no closed form and
+is estimated by Monte Carlo, split into batches across a process pool.
+"""
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from src.utils.config import config
+from src.utils.types.game_tables import AwakeningPoolTable
+from .awaken import CSG_PER_AWAKENING, MAX_AWAKENINGS, simulate_counts
+from .game_tables import tables
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+class PoolPlan(BaseModel):
+    """
+    Planner answers for one awakening pool.
+
+    Attributes:
+        pool_name (str): 'normal' or 'buffed'.
+        hit_chance (float): Chance that a single awakening reaches the target grade.
+        awakenings_needed (int | None): Awakenings needed to reach the target
+            probability, None if the grade cannot be reached in this pool.
+        budget_awakenings (int | None): Awakenings the budget pays for, if a budget was given.
+        budget_chance (float | None): Chance of reaching the target within the budget.
+        return_chance (float | None): Estimated chance of retiring at least the
+            target share of the budget, if a return target was given.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    pool_name: str
+    hit_chance: float
+    awakenings_needed: Optional[int] = None
+    budget_awakenings: Optional[int] = None
+    budget_chance: Optional[float] = None
+    return_chance: Optional[float] = None
+
+
+# ======================================================================================
+# EXACT GRADE MATH
+# ======================================================================================
+
+def grade_chance(pool: AwakeningPoolTable, grade: str) -> float:
+    """
+    Chance that one awakening reaches `grade` or better.
+
+    Args:
+        pool (AwakeningPoolTable): The pool to draw from
+        grade (str): Grade name, e.g. 'A-' (case-insensitive)
+
+    Returns:
+        float: The per-awakening chance, 0 if the pool has no such grade
+    """
+    answers = [answer.lower() for answer in pool.answers]
+    if grade.lower() not in answers:
+        return 0.0
+    start = answers.index(grade.lower())
+    return sum(pool.probabilities[start:]) / sum(pool.probabilities)
+
+
+def hit_probability(chance: float, awakenings: int, hits: int = 1) -> float:
+    """
+    Chance of at least `hits` successes in `awakenings` independent tries.
+
+    Args:
+        chance (float): Per-awakening success chance
+        awakenings (int): Number of awakenings
+        hits (int): Successes required
+
+    Returns:
+        float: The binomial upper tail P(X >= hits)
+    """
+    if hits <= 0:
+        return 1.0
+    if chance <= 0.0 or awakenings < hits:
+        return 0.0
+    if chance >= 1.0:
+        return 1.0
+    if hits == 1:
+        return -math.expm1(awakenings * math.log1p(-chance))
+
+    # 1 - P(X < hits), with the pmf computed in log space for large counts.
+    log_p, log_q = math.log(chance), math.log1p(-chance)
+    below = 0.0
+    for k in range(hits):
+        log_pmf = (
+            math.lgamma(awakenings + 1) - math.lgamma(k + 1) - math.lgamma(awakenings - k + 1)
+            + k * log_p + (awakenings - k) * log_q
+        )
+        below += math.exp(log_pmf)
+    return max(0.0, 1.0 - below)
+
+
+def awakenings_for_probability(chance: float, probability: float, hits: int = 1) -> Optional[int]:
+    """
+    Smallest number of awakenings giving at least `probability` of `hits` successes.
+
+    Args:
+        chance (float): Per-awakening success chance
+        probability (float): Target probability, between 0 and 1 (exclusive)
+        hits (int): Successes required
+
+    Returns:
+        int | None: The number of awakenings, None if the target cannot be reached
+    """
+    if chance <= 0.0:
+        return None
+    if chance >= 1.0:
+        return hits
+
+    if hits == 1:
+        # Geometric distribution: 1 - (1 - p)^n >= probability.
+        needed = math.ceil(math.log1p(-probability) / math.log1p(-chance))
+        # Guard against floating point landing one short.
+        return needed if hit_probability(chance, needed) >= probability else needed + 1
+
+    # The binomial tail grows with n: bracket by doubling, then binary search.
+    low, high = hits - 1, hits
+    while hit_probability(chance, high, hits) < probability:
+        low, high = high, high * 2
+    while high - low > 1:
+        mid = (low + high) // 2
+        if hit_probability(chance, mid, hits) >= probability:
+            high = mid
+        else:
+            low = mid
+    return high
+
+
+# ======================================================================================
+# MONTE CARLO
+# ======================================================================================
+
+def _count_returns(normal: bool, awakenings: int, target_retire: int, trials: int, seed: int) -> int:
+    """Worker: count the trials whose total retire value reaches `target_retire`."""
+    pool = tables.pool(normal=normal)
+    rng = random.Random(seed)
+    successes = 0
+    for _ in range(trials):
+        counts = simulate_counts(pool, awakenings, rng)
+        if sum(c * r for c, r in zip(counts, pool.retire)) >= target_retire:
+            successes += 1
+    return successes
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=config.awaken_plan_workers)
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the shared process pool, if it was started; the next estimate starts a new one."""
+    global _executor
+    if _executor is not None:
+        executor, _executor = _executor, None
+        # Don't block the event loop on running batches; drop queued ones.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def return_probability(pool: AwakeningPoolTable, awakenings: int, target_retire: int, trials: Optional[int] = None) -> float:
+    """
+    Estimate the chance that `awakenings` awakenings retire at least `target_retire`.
+
+    Trials are split into batches, each run in the shared process pool with
+    its own seed. With a single worker the batches run in this process.
+
+    Args:
+        pool (AwakeningPoolTable): The pool to draw from
+        awakenings (int): Number of awakenings per trial
+        target_retire (int): Total retire value to reach
+        trials (int): Monte Carlo trials, defaults to `config.awaken_plan_trials`
+
+    Returns:
+        float: The estimated probability
+    """
+    trials = trials or config.awaken_plan_trials
+    workers = config.awaken_plan_workers
+    normal = pool.name == "normal"
+
+    batches: List[int] = [trials // workers] * workers
+    for i in range(trials % workers):
+        batches[i] += 1
+    seeds = [random.getrandbits(64) for _ in batches]
+
+    if workers <= 1:
+        successes = sum(
+            _count_returns(normal, awakenings, target_retire, size, seed) for size, seed in zip(batches, seeds)
+        )
+    else:
+        futures = [
+            _get_executor().submit(_count_returns, normal, awakenings, target_retire, size, seed)
+            for size, seed in zip(batches, seeds)
+            if size > 0
+        ]
+        successes = sum(future.result() for future in futures)
+    return successes / trials
+
+
+# ======================================================================================
+# PLANNER
+# ======================================================================================
+
+# Largest budget the planner accepts: what `MAX_AWAKENINGS` awakenings cost.
+MAX_BUDGET_CSG = MAX_AWAKENINGS * CSG_PER_AWAKENING
+
+def plan_pool(
+    pool: AwakeningPoolTable,
+    grade: str,
+    probability: float,
+    hits: int = 1,
+    budget_csg: Optional[int] = None,
+    return_percent: Optional[float] = None,
+) -> PoolPlan:
+    """
+    Answer the planner questions for one pool.
+
+    Args:
+        pool (AwakeningPoolTable): The pool to plan for
+        grade (str): Target grade (that grade or better counts)
+        probability (float): Target probability, between 0 and 1 (exclusive)
+        hits (int): Number of target grades wanted
+        budget_csg (int | None): CSG available to spend, at most `MAX_BUDGET_CSG`
+        return_percent (float | None): Share of the budget to get back by
+            retiring, in percent; needs `budget_csg`
+
+    Returns:
+        PoolPlan: The answers for this pool
+
+    Raises:
+        ValueError: If `budget_csg` exceeds `MAX_BUDGET_CSG`.
+    """
+    chance = grade_chance(pool, grade)
+    plan = {
+        "pool_name": pool.name,
+        "hit_chance": chance,
+        "awakenings_needed": awakenings_for_probability(chance, probability, hits),
+    }
+
+    if budget_csg is not None:
+        if budget_csg > MAX_BUDGET_CSG:
+            raise ValueError(f"budget_csg must be at most {MAX_BUDGET_CSG}")
+        awakenings = budget_csg // CSG_PER_AWAKENING
+        plan["budget_awakenings"] = awakenings
+        plan["budget_chance"] = hit_probability(chance, awakenings, hits)
+        if return_percent is not None and awakenings > 0:
+            target = math.ceil(awakenings * CSG_PER_AWAKENING * return_percent / 100)
+            plan["return_chance"] = return_probability(pool, awakenings, target)
+
+    return PoolPlan(**plan)
+
+
+def make_plan_response(
+    grade: str,
+    probability: float = 90.0,
+    hits: int = 1,
+    budget_csg: Optional[int] = None,
+    return_percent: Optional[float] = None,
+) -> str:
+    """
+    Compare both awakening pools for a target grade and format the answer.
+
+    Args:
+        grade (str): Target grade, e.g. 'A-' (that grade or better counts)
+        probability (float): Target probability in percent (0-100, exclusive)
+        hits (int): Number of target grades wanted
+        budget_csg (int | None): CSG available to spend
+        return_percent (float | None): Share of the budget to get back by
+            retiring, in percent; only used with a budget
+
+    Returns:
+        str: Formatted Discord message with one section per pool
+    """
+    if not 0 < probability < 100:
+        return "⚠️ The probability must be between 0 and 100 (exclusive)."
+    if hits < 1:
+        return "⚠️ The number of hits must be at least 1."
+    if budget_csg is not None and budget_csg < CSG_PER_AWAKENING:
+        return f"⚠️ The budget must be at least {CSG_PER_AWAKENING} CSG."
+    if budget_csg is not None and budget_csg > MAX_BUDGET_CSG:
+        return f"⚠️ The budget can be at most {MAX_BUDGET_CSG:,} CSG ({MAX_AWAKENINGS:,} awakenings)."
+
+    pools = (tables.normal_pool, tables.buffed_pool)
+    grade_name = next((a for a in pools[0].answers if a.lower() == grade.lower()), None)
+    if grade_name is None:
+        return f"⚠️ Unknown grade `{grade}`. Valid grades: {', '.join(pools[0].answers)}"
+
+    target = f"{hits} x **{grade_name}**" if hits > 1 else f"**{grade_name}**"
+    response = f"Plan for {target} or better with `{probability:g}%` chance\n"
+
+    for pool in pools:
+        plan = plan_pool(pool, grade_name, probability / 100, hits, budget_csg, return_percent)
+        response += f"\n**{plan.pool_name}** odds"
+        if plan.hit_chance <= 0:
+            response += f": {grade_name} is not in this pool\n"
+            continue
+        response += f": `1 in {1 / plan.hit_chance:,.0f}` per awakening\n"
+        if plan.awakenings_needed is not None:
+            response += (
+                f"- `{plan.awakenings_needed:,}` awakenings "
+                f"(`{plan.awakenings_needed * CSG_PER_AWAKENING:,}` CSG) for `{probability:g}%`\n"
+            )
+        if plan.budget_chance is not None:
+            response += (
+                f"- With `{budget_csg:,}` CSG (`{plan.budget_awakenings:,}` awakenings): "
+                f"`{plan.budget_chance * 100:.1f}%`\n"
+            )
+        if plan.return_chance is not None:
+            response += f"- Chance to retire at least `{return_percent:g}%` of it: `{plan.return_chance * 100:.1f}%`\n"
+
+    return response
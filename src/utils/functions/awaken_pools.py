@@ -0,0 +1,89 @@
+"""
+Registry of the active awakening pool.
+
+Both pools are precompiled once in the game table registry. This module only
+tracks which of them is active: the normal/buffed flag in `data/awaPool.json`
+is read once at startup, and `/switch_pool` persists a new flag and swaps the
+active table in memory, so simulations never touch the file system.
+"""
+
+import json
+import os
+
+from src.utils.types.game_tables import AwakeningPoolTable, GameTables
+from .game_tables import DATA_DIR, tables
+
+POOL_FLAG_PATH = os.path.join(DATA_DIR, "awaPool.json")
+
+
+class AwakeningPoolRegistry:
+    """
+    Holds the active awakening pool and switches it atomically.
+
+    Attributes:
+        flag_path (str): Path of the JSON file persisting the normal/buffed flag.
+    """
+
+    def __init__(self, game_tables: GameTables, flag_path: str):
+        """
+        Initialize the registry from the persisted flag.
+
+        Args:
+            game_tables (GameTables): The registry holding both precompiled pools.
+            flag_path (str): Path of the JSON file persisting the normal/buffed flag.
+        """
+        self._tables = game_tables
+        self.flag_path = flag_path
+        self._active = game_tables.pool(normal=self._read_flag())
+
+    def _read_flag(self) -> bool:
+        """Return the persisted flag; a missing or unreadable file means the normal pool."""
+        try:
+            with open(self.flag_path, "r") as f:
+                return bool(json.load(f).get("normal", True))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return True
+
+    def _write_flag(self, normal: bool) -> None:
+        """
+        Persist the flag through a temporary file so a crash never leaves it
+        half-written. Other keys already in the file are kept.
+        """
+        try:
+            with open(self.flag_path, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        data["normal"] = normal
+
+        tmp_path = f"{self.flag_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, self.flag_path)
+
+    @property
+    def active(self) -> AwakeningPoolTable:
+        """The pool simulations currently draw from."""
+        return self._active
+
+    def switch(self, normal: bool) -> AwakeningPoolTable:
+        """
+        Persist the flag and make the chosen pool active.
+
+        The swap is a single reference assignment, so a simulation running
+        concurrently sees either the old pool or the new one, never a mix.
+
+        Args:
+            normal (bool): True for the normal pool, False for the buffed pool.
+
+        Returns:
+            AwakeningPoolTable: The newly active pool.
+        """
+        self._write_flag(normal)
+        self._active = self._tables.pool(normal=normal)
+        return self._active
+
+
+pool_registry = AwakeningPoolRegistry(tables, POOL_FLAG_PATH)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module builds the token-budgeted conversation context for `/ask`.
+
+Recent turns (queries and the bot's answers) are kept verbatim, newest first,
+until the token budget is spent. Turns that no longer fit are folded into a
+rolling summary of short one-line entries, which is itself capped. Token counts
+are estimated locally, so no tokenizer or model call is needed.
+"""
+
+import math
+import re
+from typing import List
+
+from src.utils.types.chat_history import ChatHistory, ChatTurn
+
+# Words kept from a query or an answer when a turn is folded into the summary.
+SUMMARY_WORDS_PER_SIDE = 10
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in `text`.
+
+    Uses the larger of the usual ~4 characters per token rule and the word
+    count, which keeps short, punctuation-heavy text from being undercounted.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        int: The estimated token count.
+    """
+    if not text:
+        return 0
+    return max(math.ceil(len(text) / 4), len(text.split()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Trim `text` so its estimated token count fits `max_tokens`.
+
+    Args:
+        text (str): The text to trim.
+        max_tokens (int): The token budget.
+
+    Returns:
+        str: The text, cut at a word boundary with an ellipsis if it was too long.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    kept: List[str] = []
+    chars = len("…")
+    for word in text.split():
+        # Same estimate as `estimate_tokens`, kept incrementally to stay linear.
+        chars += len(word) + (1 if kept else 0)
+        if max(math.ceil(chars / 4), len(kept) + 1) > max_tokens:
+            break
+        kept.append(word)
+    return " ".join(kept) + "…"
+
+
+def _first_words(text: str, count: int) -> str:
+    """Return the first `count` words of `text` on a single line."""
+    words = re.sub(r"\s+", " ", text).strip().split(" ")
+    head = " ".join(words[:count])
+    return head + ("…" if len(words) > count else "")
+
+
+def summarize_turn(turn: ChatTurn) -> str:
+    """
+    Compress a turn into a one-line summary entry.
+
+    Args:
+        turn (ChatTurn): The turn to compress.
+
+    Returns:
+        str: e.g. 'asked "grim cost to 100" -> answered "Grimoire • Enabling…"'.
+    """
+    entry = f'asked "{_first_words(turn.query, SUMMARY_WORDS_PER_SIDE)}"'
+    if turn.answer:
+        entry += f' -> answered "{_first_words(turn.answer, SUMMARY_WORDS_PER_SIDE)}"'
+    return entry
+
+
+def _turn_tokens(turn: ChatTurn) -> int:
+    """Estimate the tokens a turn takes in the rendered context."""
+    return estimate_tokens(turn.query) + estimate_tokens(turn.answer) + 4
+
+
+def compact_history(history: ChatHistory, token_budget: int, summary_budget: int) -> None:
+    """
+    Fold the turns that no longer fit the budget into the rolling summary.
+
+    The newest turns are kept while their estimated tokens fit within
+    `token_budget - summary_budget`; the newest turn is always kept. Older
+    turns become summary entries, and the oldest summary entries are dropped
+    once the summary exceeds `summary_budget`. The history is modified in place.
+
+    Args:
+        history (ChatHistory): The user's history.
+        token_budget (int): Token budget for the whole rendered context.
+        summary_budget (int): Part of the budget reserved for the summary.
+    """
+    turn_budget = max(0, token_budget - summary_budget)
+    used = 0
+    keep_from = len(history.turns)
+    for index in range(len(history.turns) - 1, -1, -1):
+        cost = _turn_tokens(history.turns[index])
+        if used + cost > turn_budget and keep_from < len(history.turns):
+            break
+        used += cost
+        keep_from = index
+
+    folded = history.turns[:keep_from]
+    if folded:
+        history.summary.extend(summarize_turn(turn) for turn in folded)
+        history.turns = history.turns[keep_from:]
+
+    # A single turn larger than the whole budget is trimmed rather than stored as is.
+    if len(history.turns) == 1 and used > turn_budget:
+        turn = history.turns[0]
+        turn.query = truncate_to_tokens(turn.query, turn_budget // 2)
+        turn.answer = truncate_to_tokens(turn.answer, turn_budget // 2)
+
+    while history.summary and estimate_tokens("; ".join(history.summary)) > summary_budget:
+        history.summary.pop(0)
+
+
+def build_chat_context(history: ChatHistory | None, token_budget: int, summary_budget: int) -> str:
+    """
+    Render a user's history as prompt context that fits `token_budget`.
+
+    Args:
+        history (ChatHistory | None): The user's history, if any.
+        token_budget (int): Token budget for the whole rendered context.
+        summary_budget (int): Part of the budget reserved for the summary.
+
+    Returns:
+        str: The context text, or a placeholder if there is no history.
+    """
+    if history is None or (not history.turns and not history.summary):
+        return "(no previous conversation)"
+
+    lines: List[str] = []
+    remaining = token_budget
+
+    if history.summary:
+        summary = truncate_to_tokens("Earlier: " + "; ".join(history.summary), summary_budget)
+        lines.append(summary)
+        remaining -= estimate_tokens(summary)
+
+    # Walk newest to oldest so the most recent turns win the budget.
+    header = "Recent conversation (oldest to newest):"
+    remaining -= estimate_tokens(header)
+    recent: List[str] = []
+    for turn in reversed(history.turns):
+        block = f"User: {turn.query}"
+        if turn.answer:
+            block += f"\nYou: {turn.answer}"
+        cost = estimate_tokens(block)
+        if cost > remaining:
+            if not recent and remaining > 0:
+                recent.append(truncate_to_tokens(block, remaining))
+            break
+        recent.append(block)
+        remaining -= cost
+
+    if recent:
+        lines.append(header)
+        lines.extend(reversed(recent))
+    return "\n".join(lines)
@@ -8,7 +8,9 @@ import json
 import os
 from typing import Optional
 
-from src.utils.types.chat_history import ChatHistories, ChatHistory
+from src.utils.config import config
+from src.utils.types.chat_history import ChatHistories, ChatHistory, ChatTurn
+from .chat_context import compact_history
 
 
 HISTORY_FILE = "data/chat_history.json"
@@ -59,17 +61,23 @@ def load_user_chat_history(user_id: int) -> Optional[ChatHistory]:
 
 
 def update_chat_history(
-    user_id: int, query: str, discord_username: str, server_nickname: Optional[str]
+    user_id: int,
+    query: str,
+    answer: str,
+    discord_username: str,
+    server_nickname: Optional[str],
 ) -> ChatHistory:
     """
-    Updates a user's chat history with a new query.
+    Records a finished exchange in a user's chat history.
 
     If the user has no existing chat history, a new one is created.
-    If the history exceeds 5 queries, the oldest query is removed.
+    Turns that no longer fit the configured token budget are folded into
+    the history's rolling summary, so the stored history stays bounded.
 
     Args:
         user_id (int): The user's ID.
-        query (str): The new query to add.
+        query (str): The user's query.
+        answer (str): The bot's answer to the query.
         discord_username (str): The user's Discord username.
         server_nickname (Optional[str]): The user's server-specific nickname.
 
@@ -85,7 +93,6 @@ def update_chat_history(
         history = ChatHistory(
             discord_username=discord_username,
             server_nickname=server_nickname,
-            queries=[],
         )
         all_histories.root[user_id_str] = history
 
@@ -93,10 +100,9 @@ def update_chat_history(
     history.discord_username = discord_username
     history.server_nickname = server_nickname
     
-    # Add new query and manage history length
-    if len(history.queries) >= 5:
-        history.queries.pop(0)
-    history.queries.append(query)
+    # Add the new turn and fold whatever no longer fits into the summary
+    history.turns.append(ChatTurn(query=query, answer=answer))
+    compact_history(history, config.ask_context_token_budget, config.ask_summary_token_budget)
 
     save_chat_histories(all_histories)
     return history
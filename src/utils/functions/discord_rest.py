@@ -0,0 +1,91 @@
+"""
+Helpers for Discord REST calls made outside a slash command's reply.
+
+Background work (giveaway endings, bulk jobs) issues REST calls that may hit
+Discord's rate limits. `with_backoff` retries a call after a 429 (waiting
+the `Retry-After` Discord sends) or a transient 5xx error, and
+`gather_with_backoff` runs independent calls concurrently, each with its own
+retries, so one failing call never cancels the others.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+import nextcord
+
+from src.utils.config import config
+
+T = TypeVar("T")
+RestCall = Callable[[], Awaitable[T]]
+
+
+def _retry_delay(error: nextcord.HTTPException, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying after `error`, None if it is not retryable.
+
+    Args:
+        error (nextcord.HTTPException): The failed request.
+        attempt (int): Attempts made so far, starting at 1.
+    """
+    if error.status == 429:
+        headers = getattr(error.response, "headers", None) or {}
+        try:
+            delay = float(headers.get("Retry-After", ""))
+        except ValueError:
+            delay = 2.0 ** attempt
+    elif error.status >= 500:
+        delay = 2.0 ** (attempt - 1)
+    else:
+        return None
+    return min(delay, config.discord_rest_max_backoff)
+
+
+async def with_backoff(call: RestCall[T], attempts: Optional[int] = None) -> T:
+    """
+    Await `call()`, retrying after rate limits and transient server errors.
+
+    `call` is a factory rather than a coroutine because a coroutine can only
+    be awaited once.
+
+    Args:
+        call (RestCall[T]): Returns a new awaitable for each attempt.
+        attempts (int | None): Attempts in total, defaults to `config.discord_rest_attempts`.
+
+    Returns:
+        T: The result of the first successful attempt.
+
+    Raises:
+        nextcord.HTTPException: The last error, once no attempts are left or
+            if it is not retryable (403, 404, ...).
+    """
+    attempts = attempts or config.discord_rest_attempts
+    for attempt in range(1, attempts + 1):
+        try:
+            return await call()
+        except nextcord.HTTPException as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == attempts:
+                raise
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+async def gather_with_backoff(*calls: RestCall[Any], label: str = "Discord request") -> List[Any]:
+    """
+    Run independent REST calls concurrently, each through `with_backoff`.
+
+    Failures are logged and returned in place of the result instead of being
+    raised, so every call gets its chance.
+
+    Args:
+        calls (RestCall[Any]): The calls to run.
+        label (str): Describes the calls in the log.
+
+    Returns:
+        List[Any]: Each call's result or exception, in order.
+    """
+    results = await asyncio.gather(*(with_backoff(call) for call in calls), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error in {label}: {result}")
+    return results
@@ -1,15 +1,21 @@
-from pydantic import BaseModel
-from src.utils.dt_cost import dt_cost
-from src.utils.temple_cost import temple_cost
+from typing import Dict, List, Tuple
+from pydantic import BaseModel, ConfigDict
+from src.utils.config import emojis
+from .game_tables import tables
+from .memo import memoize
 
-# Type definition for the return dictionary
+# Type definition for the return dictionary.
+# Results are memoized and shared between callers, so the model is frozen.
 class ReturnDict(BaseModel):
+        model_config = ConfigDict(frozen=True)
+
         user_gems: int | None = 0
         user_spirits: int | None = 0
         required_gems: int | None = 0
         required_spiritveins: int | None = 0
         error: str | None = None
 
+@memoize(maxsize=4096)
 def get_dt_calc(
         *,
         goal_temple: int,
@@ -38,6 +44,9 @@ def get_dt_calc(
     
     Returns:
         A dictionary containing users and required [gems and spiritveins], or an error message if input is invalid.
+
+    Temple requirements come from the startup-loaded table registry and results
+    are memoized per argument tuple.
     """
     # Validate input
     if goal_temple < 1:
@@ -48,9 +57,8 @@ def get_dt_calc(
     total_spirits: int = bag_spirit
     
     # Get temple requirements or return error if invalid
-    try:
-        temple = temple_cost[goal_temple - 1]
-    except IndexError:
+    temple = tables.temple
+    if goal_temple > temple.max_level:
         return ReturnDict(error = f"Invalid goal_temple value: {goal_temple}")
         
     # List of ranks in order of progression
@@ -60,14 +68,184 @@ def get_dt_calc(
     for rank_index, rank_count in enumerate(dt_ranks):
         if rank_count > 0:
             # Add resources based on rank cost multiplied by number of ranks
-            total_gems += dt_cost[rank_index].gems * rank_count
-            total_spirits += dt_cost[rank_index].spiritvein * rank_count
+            total_gems += temple.rank_gems[rank_index] * rank_count
+            total_spirits += temple.rank_spiritveins[rank_index] * rank_count
 
     # Calculate remaining required resources
     result: ReturnDict = ReturnDict(
          user_gems = total_gems,
          user_spirits = total_spirits,
-         required_gems = temple.gem - total_gems,
-         required_spiritveins = temple.spiritvein - total_spirits
+         required_gems = temple.gems[goal_temple] - total_gems,
+         required_spiritveins = temple.spiritveins[goal_temple] - total_spirits
     )
     return result
+
+
+class DtPlan(BaseModel):
+        """
+        Result of the Divine Temple reverse solver.
+
+        Results are memoized and shared between callers, so the model is frozen.
+
+        Attributes:
+            reachable_temple (int): Highest temple the current heroes and bag cover (0 if none).
+            goal_temple (int): The temple the rank-ups are planned for.
+            added_ranks (Tuple[int, ...]): Heroes to add per tier, Origin through Nirvana.
+            cots (int): Crystals of Transcendence the added heroes cost.
+            stellars (int): Stellar Shards the added heroes cost.
+            error (str | None): Why no plan exists, if it does not.
+        """
+        model_config = ConfigDict(frozen=True)
+
+        reachable_temple: int = 0
+        goal_temple: int = 0
+        added_ranks: Tuple[int, ...] = ()
+        cots: int = 0
+        stellars: int = 0
+        error: str | None = None
+
+# Solver state: (cots, stellars) spent, spiritveins gained, heroes added per tier so far.
+_Entry = Tuple[Tuple[int, int], int, Tuple[int, ...]]
+
+def _cheapest_ranks(current: Tuple[int, ...], need_gems: int, need_spirits: int) -> _Entry | None:
+        """
+        Bounded knapsack over the six tiers: the cheapest set of added heroes
+        covering both missing amounts.
+
+        States are keyed by gems gained (capped at the need) and hold only the
+        Pareto-optimal (cost, spiritveins) entries, so the work is bounded by
+        the temple's gem requirement. The last tier (Nirvana, which gives both
+        resources) just closes the remaining gap. Cost is compared as
+        (CoTS, Stellar Shards).
+        """
+        temple = tables.temple
+        last = len(temple.rank_gems) - 1
+        states: Dict[int, List[_Entry]] = {0: [((0, 0), 0, ())]}
+
+        for tier in range(last):
+            available = max(0, temple.rank_limits[tier] - current[tier])
+            grown: Dict[int, List[_Entry]] = {}
+            for gems, entries in states.items():
+                for (cots, stellars), spirits, added in entries:
+                    for count in range(available + 1):
+                        key = min(need_gems, gems + count * temple.rank_gems[tier])
+                        grown.setdefault(key, []).append((
+                            (cots + count * temple.rank_cots[tier], stellars + count * temple.rank_stellars[tier]),
+                            min(need_spirits, spirits + count * temple.rank_spiritveins[tier]),
+                            added + (count,),
+                        ))
+
+            # Keep an entry only if no cheaper entry already has as many spiritveins.
+            states = {}
+            for gems, entries in grown.items():
+                entries.sort(key=lambda entry: (entry[0], -entry[1]))
+                kept: List[_Entry] = []
+                for entry in entries:
+                    if not kept or entry[1] > kept[-1][1]:
+                        kept.append(entry)
+                states[gems] = kept
+
+        # The last tier only has to close the remaining gap, so its count is computed directly.
+        gem_value, spirit_value = temple.rank_gems[last], temple.rank_spiritveins[last]
+        available = max(0, temple.rank_limits[last] - current[last])
+        best: _Entry | None = None
+        for gems, entries in states.items():
+            for (cots, stellars), spirits, added in entries:
+                count = max(0, -(-(need_gems - gems) // gem_value), -(-(need_spirits - spirits) // spirit_value))
+                if count > available:
+                    continue
+                entry = (
+                    (cots + count * temple.rank_cots[last], stellars + count * temple.rank_stellars[last]),
+                    spirits + count * spirit_value,
+                    added + (count,),
+                )
+                if best is None or entry[0] < best[0]:
+                    best = entry
+        return best
+
+@memoize(maxsize=4096)
+def get_dt_plan(
+        *,
+        goal_temple: int | None = None,
+        origin: int = 0,
+        surge: int = 0,
+        chaos: int = 0,
+        core: int = 0,
+        polystar: int = 0,
+        nirvana: int = 0,
+        bag_gems: int = 0,
+        bag_spirit: int = 0
+    ) -> DtPlan:
+    """
+    Finds the highest temple the current heroes and bag reach, and the cheapest
+    set of additional heroes to reach `goal_temple`.
+
+    Each added hero counts as one brought to its tier, at that tier's CoTS and
+    Stellar Shard cost. Results are memoized per argument tuple.
+
+    Args:
+        goal_temple (int, optional): Target temple level (1-22), defaults to the
+            temple after the highest reachable one.
+        origin, surge, chaos, core, polystar, nirvana (int, optional): Heroes of each tier.
+        bag_gems (int, optional): Aurora Gems in bag.
+        bag_spirit (int, optional): Scattered Spiritvein Shards in bag.
+
+    Returns:
+        DtPlan: The reachable temple and the cheapest rank-ups, or an error.
+    """
+    temple = tables.temple
+    current = (origin, surge, chaos, core, polystar, nirvana)
+    if any(count < 0 or count > limit for count, limit in zip(current, temple.rank_limits)):
+        return DtPlan(error="Hero counts must be between 0 and the tier limit.")
+
+    totals = get_dt_calc(goal_temple=1, origin=origin, surge=surge, chaos=chaos, core=core,
+                         polystar=polystar, nirvana=nirvana, bag_gems=bag_gems, bag_spirit=bag_spirit)
+    user_gems, user_spirits = totals.user_gems or 0, totals.user_spirits or 0
+    reachable = max(0, temple.reachable_level(user_gems, user_spirits))
+
+    goal = goal_temple if goal_temple is not None else reachable + 1
+    if not 1 <= goal <= temple.max_level:
+        if goal_temple is None:
+            return DtPlan(reachable_temple=reachable, goal_temple=reachable, added_ranks=(0,) * len(current))
+        return DtPlan(reachable_temple=reachable, error=f"Invalid goal_temple value: {goal_temple}")
+
+    need_gems = max(0, temple.gems[goal] - user_gems)
+    need_spirits = max(0, temple.spiritveins[goal] - user_spirits)
+    best = _cheapest_ranks(current, need_gems, need_spirits)
+    if best is None:
+        return DtPlan(reachable_temple=reachable, goal_temple=goal,
+                      error=f"Temple {goal} can't be reached even with every tier maxed.")
+
+    (cots, stellars), _, added = best
+    return DtPlan(reachable_temple=reachable, goal_temple=goal, added_ranks=added, cots=cots, stellars=stellars)
+
+def format_dt_plan(plan: DtPlan) -> str:
+    """
+    Formats a Divine Temple plan as a Discord message.
+
+    Args:
+        plan (DtPlan): The plan to format.
+
+    Returns:
+        str: The reachable temple and the rank-ups to add, or the error.
+    """
+    lines = [f"**Highest temple you reach** -> `{plan.reachable_temple}`"]
+    if plan.error:
+        lines.append(f"⚠️ {plan.error}")
+        return "\n".join(lines)
+
+    if plan.goal_temple <= plan.reachable_temple:
+        if plan.goal_temple == tables.temple.max_level:
+            lines.append("That's the highest temple!")
+        else:
+            lines.append(f"You already cover temple `{plan.goal_temple}`.")
+        return "\n".join(lines)
+
+    temple = tables.temple
+    ranks = ", ".join(
+        f"+{count} {getattr(emojis, name, name)}"
+        for name, count in zip(temple.rank_names, plan.added_ranks) if count
+    )
+    lines.append(f"**Cheapest way to temple {plan.goal_temple}** -> {ranks or 'bag resources only'}")
+    lines.append(f"Costs `{plan.cots:,}` CoTS and `{plan.stellars:,}` Stellar Shards")
+    return "\n".join(lines)
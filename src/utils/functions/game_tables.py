@@ -0,0 +1,180 @@
+"""
+Startup-loaded registry of the game lookup tables.
+
+The Grimoire JSON files, the Divine Temple cost modules and both awakening
+pools are read once, when this module is first imported, and converted into
+immutable, integer-indexed tables. Calculators and agent tools look values up
+in `tables` instead of re-reading files on every call. When a Grimoire JSON
+file is edited, the memoization layer notices and the Grimoire tables are
+rebuilt.
+"""
+
+import json
+import os
+from itertools import accumulate
+from typing import Any, Dict, List, Tuple
+
+from ..awa_pool import pool as normal_pool
+from ..awa_pool_buffed import pool as buffed_pool
+from ..dt_cost import dt_cost
+from ..temple_cost import temple_cost
+from ..types.game_tables import AwakeningPoolTable, GameTables, GrimTable, TempleTable
+from .memo import on_data_change
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../..", "data")
+GRIM_ENABLE_PATH = os.path.join(DATA_DIR, "grim1Cost.json")
+GRIM_IMPRINT_PATH = os.path.join(DATA_DIR, "grim2Cost.json")
+
+# Maximum number of heroes per Divine Temple tier, Origin through Nirvana.
+DT_RANK_LIMITS = (16, 16, 16, 16, 16, 12)
+
+
+def _load_json_data(file_path: str) -> Dict[str, Any]:
+    """A utility function to load data from a specified JSON file."""
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Error: {file_path} not found")
+        return {}
+
+
+def load_grim_table(book: str, file_path: str) -> GrimTable:
+    """
+    Build a Grimoire table from a `{"level": cost}` JSON file.
+
+    Costs are either a plain integer (essence only, Enable book) or an
+    `{"essence": ..., "imprint": ...}` object (Imprint book). Levels must be
+    contiguous from 1; the table stops at the first missing level.
+
+    Args:
+        book: The book name stored on the table.
+        file_path: Path to the JSON cost file.
+
+    Returns:
+        The cumulative cost table, empty if the file could not be read.
+    """
+    data = _load_json_data(file_path)
+    essence: List[int] = [0]
+    imprint: List[int] = [0]
+
+    level = 1
+    while str(level) in data:
+        cost = data[str(level)]
+        if isinstance(cost, int):
+            essence.append(cost)
+            imprint.append(0)
+        else:
+            essence.append(cost.get("essence", 0))
+            imprint.append(cost.get("imprint", 0))
+        level += 1
+
+    return GrimTable(book=book, essence=tuple(essence), imprint=tuple(imprint))
+
+
+def build_temple_table() -> TempleTable:
+    """Build the Divine Temple table from `temple_cost` and `dt_cost`."""
+    ordered = sorted(temple_cost, key=lambda t: t.level)
+    return TempleTable(
+        gems=(0, *(t.gem for t in ordered)),
+        spiritveins=(0, *(t.spiritvein for t in ordered)),
+        rank_gems=tuple(c.gems for c in dt_cost),
+        rank_spiritveins=tuple(c.spiritvein for c in dt_cost),
+        rank_names=tuple(c.name for c in dt_cost),
+        rank_cots=tuple(c.cots for c in dt_cost),
+        rank_stellars=tuple(c.stellars for c in dt_cost),
+        rank_limits=DT_RANK_LIMITS,
+    )
+
+
+def build_alias_table(probabilities: Tuple[float, ...]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Build a Walker/Vose alias table for a categorical distribution.
+
+    A draw picks a slot uniformly, keeps it with probability `prob[slot]` and
+    otherwise takes `alias[slot]`, so every draw costs O(1) whatever the
+    number of outcomes. Probabilities are normalized by their sum.
+
+    Args:
+        probabilities: Probability of each outcome.
+
+    Returns:
+        The acceptance probabilities and alias indices, one per outcome.
+    """
+    count = len(probabilities)
+    total = sum(probabilities)
+    scaled = [p * count / total for p in probabilities]
+    prob = [1.0] * count
+    alias = list(range(count))
+
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Whatever is left over is 1 up to rounding error and keeps prob = 1.
+
+    return tuple(prob), tuple(alias)
+
+
+def build_pool_table(name: str, pool: List[Dict[str, Any]]) -> AwakeningPoolTable:
+    """
+    Precompile an awakening pool into column tuples.
+
+    Args:
+        name: The pool name ('normal' or 'buffed').
+        pool: The pool definition, a list of outcome dictionaries.
+
+    Returns:
+        The column-oriented pool table.
+    """
+    probabilities = tuple(float(item["probability"]) for item in pool)
+    alias_prob, alias_index = build_alias_table(probabilities)
+    return AwakeningPoolTable(
+        name=name,
+        answers=tuple(item["answer"] for item in pool),
+        emojis=tuple(item["emoji"] for item in pool),
+        probabilities=probabilities,
+        cumulative=tuple(accumulate(probabilities)),
+        alias_prob=alias_prob,
+        alias_index=alias_index,
+        retire=tuple(int(item["retire"]) for item in pool),
+        points=tuple(int(item["points"]) for item in pool),
+    )
+
+
+def load_game_tables() -> GameTables:
+    """Load and precompute every game table."""
+    return GameTables(
+        enable=load_grim_table("Enable", GRIM_ENABLE_PATH),
+        imprint=load_grim_table("Imprint", GRIM_IMPRINT_PATH),
+        temple=build_temple_table(),
+        normal_pool=build_pool_table("normal", normal_pool),
+        buffed_pool=build_pool_table("buffed", buffed_pool),
+    )
+
+
+# The shared registry, built once at import time.
+tables: GameTables = load_game_tables()
+
+
+def reload_grim_tables() -> None:
+    """
+    Rebuild the Grimoire tables after one of their JSON files changed.
+
+    Readers that need live Grimoire data look up `game_tables.tables` on each
+    call instead of importing the name, so they see the new registry.
+    """
+    global tables
+    tables = tables.model_copy(update={
+        "enable": load_grim_table("Enable", GRIM_ENABLE_PATH),
+        "imprint": load_grim_table("Imprint", GRIM_IMPRINT_PATH),
+    })
+
+
+# Memoized Grimoire results are dropped after this hook runs.
+GRIM_DATA_FILES = (GRIM_ENABLE_PATH, GRIM_IMPRINT_PATH)
+on_data_change(GRIM_DATA_FILES, reload_grim_tables)
@@ -1,158 +1,336 @@
-import json
-import os
-from datetime import datetime
-from typing import List, Optional
 import asyncio
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import weakref
+from datetime import timedelta
+from typing import Dict, List, Optional
 import nextcord
 from typing import Iterable
-from src.utils.types.giveaway import Giveaway
+from src.utils.config import config
+from src.utils.types.giveaway import Giveaway, RerollPool
+from .discord_rest import gather_with_backoff, with_backoff
+from .giveaway_draw import draw_from_pool, entrant_weights, remaining_candidates
+from .giveaway_store import giveaway_store
+from .profile_cache import profile_cache
+from .scheduler import timer_scheduler
+from .time_utils import utc_now
 
-GIVEAWAY_JSON = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '..', 'data', 'giveaway.json')
-scheduler = AsyncIOScheduler()
+# Timer scheduler job kind for giveaway endings; the giveaway cog registers its handler.
+GIVEAWAY_END_JOB = "giveaway_end"
 
-# --- JSON Management ---
+
+def giveaway_end_job_id(giveaway_id: str) -> str:
+    """Return the timer scheduler job id of a giveaway's ending."""
+    return f"{GIVEAWAY_END_JOB}:{giveaway_id}"
+
+
+# One asyncio lock per giveaway, alive while someone holds or waits for it.
+_giveaway_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def giveaway_lock(giveaway_id: str) -> asyncio.Lock:
+    """Return the lock serializing end and reroll processing of one giveaway.
+
+    Different giveaways never wait on each other.
+    """
+    lock = _giveaway_locks.get(giveaway_id)
+    if lock is None:
+        lock = _giveaway_locks[giveaway_id] = asyncio.Lock()
+    return lock
+
+# --- Storage (in-memory index, one file per giveaway) ---
 def load_giveaways() -> List[Giveaway]:
-    if not os.path.exists(GIVEAWAY_JSON):
-        return []
-    with open(GIVEAWAY_JSON, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return [Giveaway(**g) for g in data]
+    return giveaway_store.all()
 
 def save_giveaways(giveaways: List[Giveaway]):
-    with open(GIVEAWAY_JSON, 'w', encoding='utf-8') as f:
-        json.dump([g.dict() for g in giveaways], f, default=str, indent=2)
+    giveaway_store.save_all(giveaways)
 
 # --- Expired Giveaways ---
 def delete_expired_giveaways():
-    giveaways = load_giveaways()
-    now = datetime.utcnow()
-    active = [g for g in giveaways if g.end_time > now and g.active]
-    save_giveaways(active)
-    # Remove jobs from scheduler
-    for job in scheduler.get_jobs():
-        if not any(g.id == job.id for g in active):
-            scheduler.remove_job(job.id)
-
-# --- Active Giveaway ---
+    """Delete ended giveaways older than `config.giveaway_retention_days`.
+
+    Active giveaways, even overdue ones waiting for their ending to be
+    processed, and recently ended ones (which can still be rerolled) are kept.
+    """
+    cutoff = utc_now() - timedelta(days=config.giveaway_retention_days)
+    for g in giveaway_store.all():
+        if not g.active and g.end_time < cutoff:
+            giveaway_store.delete(g.id)
+            timer_scheduler.cancel(giveaway_end_job_id(g.id))
+
+# --- Active Giveaways ---
+def get_active_giveaways() -> List[Giveaway]:
+    """Return the running giveaways, the one ending first first."""
+    now = utc_now()
+    return [g for g in giveaway_store.active() if g.end_time > now]
+
 def get_active_giveaway() -> Optional[Giveaway]:
-    giveaways = load_giveaways()
-    now = datetime.utcnow()
-    for g in giveaways:
-        if g.active and g.end_time > now:
-            return g
-    return None
+    """Return the running giveaway ending first, or None."""
+    active = get_active_giveaways()
+    return active[0] if active else None
 
 # --- Start Giveaway ---
 def start_giveaway(giveaway: Giveaway):
-    giveaways = load_giveaways()
-    giveaways.append(giveaway)
-    save_giveaways(giveaways)
-    # We keep persistence and a lightweight scheduler for cleanup. The
-    # actual announcement/editing of messages should be handled by the
-    # bot cog (it has access to the API). The scheduler keeps a job so the
-    # store can be updated if the bot isn't running at the exact end time.
-    try:
-        scheduler.add_job(end_giveaway, 'date', run_date=giveaway.end_time, args=[giveaway.id], id=giveaway.id)
-    except Exception:
-        # If a job with that id already exists or scheduler isn't running,
-        # we ignore — caller (the cog) will also handle end-time behavior.
-        pass
+    giveaway_store.save(giveaway)
+    schedule_giveaway_end(giveaway)
+
+
+def schedule_giveaway_end(giveaway: Giveaway):
+    """Schedule (or move) the ending of a giveaway in the timer scheduler.
+
+    The job is persisted, so the ending fires once even if the bot was
+    restarted or down at the end time.
+    """
+    timer_scheduler.schedule(
+        giveaway_end_job_id(giveaway.id),
+        GIVEAWAY_END_JOB,
+        giveaway.end_time,
+        {"giveaway_id": giveaway.id},
+    )
 
 # --- End Giveaway ---
 def get_giveaway_by_id(giveaway_id: str) -> Optional[Giveaway]:
-    giveaways = load_giveaways()
-    for g in giveaways:
-        if g.id == giveaway_id:
-            return g
-    return None
+    return giveaway_store.get(giveaway_id)
 
 
 def update_giveaway(giveaway: Giveaway):
-    """Save/update a single giveaway in storage."""
-    giveaways = load_giveaways()
-    for i, g in enumerate(giveaways):
-        if g.id == giveaway.id:
-            giveaways[i] = giveaway
-            save_giveaways(giveaways)
-            return
-    # not found -> append
-    giveaways.append(giveaway)
-    save_giveaways(giveaways)
+    """Save/update a single giveaway in storage (one file write)."""
+    giveaway_store.save(giveaway)
+
+
+def set_giveaway_message(giveaway_id: str, message_id: int):
+    """Record the Discord message a giveaway was posted as."""
+    def change(g: Giveaway):
+        g.message_id = message_id
+    giveaway_store.update(giveaway_id, change)
 
 
 def end_giveaway(giveaway_id: str) -> List[int]:
-    """Mark giveaway inactive and pick winners from participants.
+    """Mark giveaway inactive and draw winners from participants.
 
-    - This is idempotent: if winners already selected it will return them.
+    - This is idempotent: an ended giveaway keeps (and returns) its winners.
+    - Entries are weighted per the giveaway's `weighting`, and the draw is
+      recorded in its reroll pool (see `giveaway_draw`).
     - Returns the list of winner user IDs.
+    - Transactional, costs exactly one write.
     """
-    giveaways = load_giveaways()
-    for g in giveaways:
-        if g.id == giveaway_id:
-            # If already ended / winners chosen, return existing winners
-            if not g.active and g.winner_ids:
-                return g.winner_ids
-
-            g.active = False
-            eligible = list(dict.fromkeys(g.participants))  # remove duplicates, preserve ordering
-            if len(eligible) < g.winners:
-                # Not enough participants: no winners chosen
-                g.winner_ids = []
-                update_giveaway(g)
-                return []
-
-            from random import sample
-            winners = sample(eligible, g.winners)
-            g.winner_ids = winners
-            update_giveaway(g)
-            return winners
-
-    return []
+    def change(g: Giveaway) -> List[int]:
+        # Already ended: return existing winners
+        if not g.active:
+            return g.winner_ids
+
+        g.active = False
+        # Entrants are tracked from reactions and already deduplicated
+        entrants = giveaway_store.entrants(g.id)
+        g.reroll_pool = RerollPool(
+            giveaway_id=g.id,
+            eligible=entrants,
+            weighting=g.weighting,
+            weights=entrant_weights(entrants, g.weighting),
+        )
+        if len(remaining_candidates(g.reroll_pool)[0]) < g.winners:
+            # Not enough participants: no winners chosen
+            g.winner_ids = []
+        else:
+            g.winner_ids = draw_from_pool(g.reroll_pool, g.winners)
+        return g.winner_ids
+
+    return giveaway_store.update(giveaway_id, change) or []
 
 # --- Reroll ---
-def reroll_giveaway(giveaway_id: str, exclude: List[int]) -> List[int]:
-    g = get_giveaway_by_id(giveaway_id)
-    if not g:
-        return []
+def reroll_giveaway(giveaway_id: str, exclude: Optional[Iterable[int]] = None) -> List[int]:
+    """Draw new winners for an ended giveaway from its reroll pool.
 
-    eligible = [uid for uid in g.participants if uid not in exclude]
-    if len(eligible) < g.winners:
-        return []
+    Everyone drawn before is excluded. Giveaways ended before reroll pools
+    existed get one built from their entrants minus the current winners and
+    `exclude`. Transactional, costs one write and no Discord requests.
+    Returns the new winner IDs, or an empty list if too few remain.
+    """
+    def change(g: Giveaway) -> List[int]:
+        if g.active:
+            return []
+        if g.reroll_pool is None:
+            drawn = set(g.winner_ids) | set(exclude or ())
+            eligible = [uid for uid in giveaway_store.entrants(g.id) if uid not in drawn]
+            g.reroll_pool = RerollPool(
+                giveaway_id=g.id,
+                previous_winners=list(g.winner_ids),
+                eligible=eligible,
+                weighting=g.weighting,
+                weights=entrant_weights(eligible, g.weighting),
+            )
+        if len(remaining_candidates(g.reroll_pool)[0]) < g.winners:
+            return []
+        g.winner_ids = draw_from_pool(g.reroll_pool, g.winners)
+        return g.winner_ids
+
+    return giveaway_store.update(giveaway_id, change) or []
+
+
+# --- End / reroll processing ---
+async def _fetch_post(channel: nextcord.abc.Messageable, message_id: Optional[int]) -> Optional[nextcord.Message]:
+    """Fetch a giveaway post once, for both reading reactions and editing."""
+    if not message_id:
+        return None
+    try:
+        return await with_backoff(lambda: channel.fetch_message(message_id))
+    except Exception as e:
+        print(f"Error fetching giveaway message: {e}")
+        return None
 
-    from random import sample
-    winners = sample(eligible, g.winners)
-    g.winner_ids = winners
-    update_giveaway(g)
-    return winners
-
-# --- APScheduler Job ---
-def check_giveaway_jobs():
-    delete_expired_giveaways()
-    giveaways = load_giveaways()
-    now = datetime.utcnow()
-    for g in giveaways:
-        if g.active and g.end_time <= now:
-            end_giveaway(g.id)
-
-# --- Scheduler Setup ---
-def setup_scheduler():
-    # Add the periodic checker job only if it doesn't exist already
-    if not scheduler.get_job('giveaway_checker'):
-        scheduler.add_job(check_giveaway_jobs, 'interval', minutes=2, id='giveaway_checker', replace_existing=True)
-
-    # Start scheduler only if it's not running and an event loop exists
-    if scheduler.running:
-        return
 
-    try:
-        # Ensure we have a running loop before starting the AsyncIO scheduler
-        asyncio.get_running_loop()
-    except RuntimeError:
-        # No running loop available yet — caller should start the scheduler later
-        return
+async def _giveaway_post(channel: Optional[nextcord.abc.Messageable], g: Giveaway, message: Optional[nextcord.Message]) -> Optional[nextcord.Message]:
+    """Return the giveaway post: `message` if it is the post, else fetched once."""
+    if message is not None and message.id == g.message_id:
+        return message
+    return await _fetch_post(channel, g.message_id) if channel is not None else None
+
+
+async def _backfill_entrants(g: Giveaway, msg: Optional[nextcord.Message]):
+    """Read the entrants from the post's reactions if none were tracked.
+
+    Covers giveaways from before entrant tracking, or whose post was never
+    reconciled; uses the already fetched message.
+    """
+    if msg is not None and not giveaway_store.entrants(g.id):
+        giveaway_store.set_entrants(g.id, await collect_entrants(g.id, msg))
+
+
+async def _publish(channel: nextcord.abc.Messageable, msg: Optional[nextcord.Message], winners: List[int], view: Optional[nextcord.ui.View], announcement: Optional[str]):
+    """Show `winners` on the post and send `announcement`, concurrently."""
+    calls = []
+    if msg is not None:
+        embed = update_embed_winners(msg.embeds[0] if msg.embeds else default_embed("🎉 Giveaway Ended 🎉"), winners)
+        calls.append(lambda: msg.edit(embed=embed, view=view))
+    if announcement:
+        calls.append(lambda: channel.send(announcement))
+    await gather_with_backoff(*calls, label="giveaway announcement")
+
+
+async def finish_giveaway(giveaway_id: str, channel: Optional[nextcord.abc.Messageable], view: Optional[nextcord.ui.View] = None, message: Optional[nextcord.Message] = None) -> Optional[List[int]]:
+    """End a giveaway and announce it, exactly once.
+
+    The scheduled ending and End Now clicks may race: processing holds the
+    giveaway's lock, and only the call that finds it still active ends and
+    announces it. Other giveaways are processed concurrently.
+
+    The post is fetched once, or not at all when `message` (e.g. the message
+    of a button interaction) already is the post; the edit and the
+    announcement then go out together, each retried on rate limits.
 
-    scheduler.start()
+    Returns:
+        The winners if this call ended the giveaway, None if it was already
+        ended or does not exist.
+    """
+    async with giveaway_lock(giveaway_id):
+        g = giveaway_store.get(giveaway_id)
+        if g is None or not g.active:
+            return None
+        msg = await _giveaway_post(channel, g, message)
+        await _backfill_entrants(g, msg)
+        winners = end_giveaway(giveaway_id)
+        if channel is not None:
+            mentions = ", ".join(f"<@{w}>" for w in winners)
+            await _publish(channel, msg, winners, view, f"🎉 Giveaway ended — congratulations: {mentions}" if winners else None)
+        return winners
+
+
+async def reroll_and_announce(giveaway_id: str, channel: Optional[nextcord.abc.Messageable], view: Optional[nextcord.ui.View] = None, message: Optional[nextcord.Message] = None) -> List[int]:
+    """Reroll an ended giveaway and announce the new winners.
+
+    Concurrent clicks on the same giveaway are serialized, so each reroll
+    draws from the pool left by the previous one. Same single fetch (or
+    none, given the post as `message`) and concurrent edit/announcement as
+    `finish_giveaway`.
+
+    Returns:
+        The new winners, empty if the giveaway is running or too few remain.
+    """
+    async with giveaway_lock(giveaway_id):
+        g = giveaway_store.get(giveaway_id)
+        if g is None or g.active:
+            return []
+        msg = await _giveaway_post(channel, g, message)
+        if g.reroll_pool is None:
+            await _backfill_entrants(g, msg)
+        winners = reroll_giveaway(giveaway_id)
+        if winners and channel is not None:
+            mentions = ", ".join(f"<@{uid}>" for uid in winners)
+            await _publish(channel, msg, winners, view, f"🎉 Reroll successful!\nNew winners: {mentions}")
+        return winners
+
+
+# --- Entrant tracking ---
+# Reaction events seen while a full pass over a giveaway's reactions is
+# paginating, one map of user id -> added per pass in progress.
+_passes_in_progress: Dict[str, List[Dict[int, bool]]] = {}
+
+
+def record_reaction_entry(message_id: int, user_id: int, added: bool, reaction_emoji: str, emoji: str = '🎉') -> bool:
+    """Add or withdraw an entry from a raw reaction event, in O(1).
+
+    Only reactions with `emoji` on the post of an active giveaway count:
+    `reaction_emoji` is the emoji of the event, so adding or removing any
+    other reaction leaves the entry alone.
+    Returns True if the entrants changed; the change is persisted on the
+    next `giveaway_store.flush()` or save of that giveaway.
+    """
+    if reaction_emoji != emoji:
+        return False
+    g = giveaway_store.by_message(message_id)
+    if g is None or not g.active:
+        return False
+    for events in _passes_in_progress.get(g.id, ()):
+        events[user_id] = added
+    if added:
+        return giveaway_store.add_entrant(g.id, user_id)
+    return giveaway_store.remove_entrant(g.id, user_id)
+
+
+async def collect_entrants(giveaway_id: str, msg: nextcord.Message, emoji: str = '🎉') -> List[int]:
+    """Return a giveaway's entrants from a full pass over its reactions.
+
+    Paginating takes one request per 100 users, in user id order, so a
+    reaction added or removed meanwhile may be missing from the pages. The
+    events `record_reaction_entry` sees during the pass are applied on top
+    of the pages, the latest event of each user winning.
+    """
+    events: Dict[int, bool] = {}
+    _passes_in_progress.setdefault(giveaway_id, []).append(events)
+    try:
+        entrants = dict.fromkeys(await collect_reaction_user_ids(msg, emoji=emoji))
+    finally:
+        passes = _passes_in_progress[giveaway_id]
+        passes.remove(events)
+        if not passes:
+            del _passes_in_progress[giveaway_id]
+    for user_id, added in events.items():
+        if added:
+            entrants[user_id] = None
+        else:
+            entrants.pop(user_id, None)
+    return list(entrants)
+
+
+async def reconcile_entrants(channel: nextcord.TextChannel, giveaway: Giveaway, emoji: str = '🎉') -> int:
+    """Rebuild a giveaway's entrants from a full pass over its reactions.
+
+    Catches reactions made while the bot was offline. Meant to run in the
+    background; winner selection never waits for it.
+    Returns the number of entrants found.
+    """
+    message_id = giveaway.message_id
+    if message_id is None:
+        return 0
+    try:
+        msg = await with_backoff(lambda: channel.fetch_message(message_id))
+    except Exception:
+        # Keep the tracked entrants rather than wiping them on a failed fetch.
+        return 0
+    entrants = await collect_entrants(giveaway.id, msg, emoji=emoji)
+    current = giveaway_store.get(giveaway.id)
+    if current is not None and current.active:
+        giveaway_store.set_entrants(giveaway.id, entrants)
+        giveaway_store.flush()
+    return len(entrants)
 
 
 # --- Embed helpers (UI helpers used by the bot cog / slash command) ---
@@ -219,6 +397,8 @@ def build_start_embed(g: Giveaway) -> nextcord.Embed:
     # duration might be stored as seconds or readable; try to be helpful
     embed.add_field(name="Duration", value=(seconds_to_readable(g.duration_seconds) if getattr(g, 'duration_seconds', None) else "Unknown"), inline=True)
     embed.add_field(name="Winners", value=str(g.winners), inline=True)
+    if g.weighting == "level":
+        embed.add_field(name="Odds", value="Entries weighted by level", inline=True)
     embed.add_field(name="Winner(s)", value=(", ".join(f"<@{w}>" for w in g.winner_ids) if g.winner_ids else "TBD"), inline=False)
     if getattr(g, 'message', None):
         embed.add_field(name="Message", value=str(g.message), inline=False)
@@ -280,6 +460,15 @@ async def gather_reaction_user_ids_from_message(channel: nextcord.TextChannel, m
     except Exception:
         return []
 
+    return await collect_reaction_user_ids(msg, emoji=emoji, exclude=exclude, dedupe=dedupe)
+
+
+async def collect_reaction_user_ids(msg: nextcord.Message, emoji: str = '🎉', exclude: Optional[Iterable[int]] = None, dedupe: bool = True) -> list:
+    """Return the user IDs who reacted with `emoji` on an already fetched message.
+
+    Paginates every reaction user, so it costs one REST call per 100 users.
+    Same filtering as `gather_reaction_user_ids_from_message`.
+    """
     reaction_users = []
     for reaction in msg.reactions:
         if str(getattr(reaction, 'emoji', '')) == emoji:
@@ -287,6 +476,8 @@ async def gather_reaction_user_ids_from_message(channel: nextcord.TextChannel, m
                 async for u in reaction.users():
                     if getattr(u, 'bot', False):
                         continue
+                    # Every reacting user comes back in full: keep them.
+                    profile_cache.put_user(u)
                     reaction_users.append(getattr(u, 'id', None))
             except Exception:
                 continue
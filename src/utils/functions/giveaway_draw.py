@@ -0,0 +1,163 @@
+"""
+Giveaway winner draws: weighted, seeded and replayable.
+
+Winners are drawn without replacement with the A-Res algorithm: each
+candidate gets the key `log(u) / weight` for a uniform `u`, and the `k`
+largest keys win, in O(n + k log n). With equal weights this is a uniform
+draw. Every draw uses a fresh `random.Random` seeded from `secrets` and is
+recorded as a `DrawRecord` (seed, digest of the candidates and weights,
+winners) in the giveaway's `RerollPool`, so anyone can replay the draws from
+the stored pool and check that they give the recorded winners.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import random
+import secrets
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from src.utils.types.giveaway import DrawRecord, RerollPool
+from .leveling import load_user_levels
+from .time_utils import utc_now
+
+# Supported entry weightings.
+WEIGHTINGS = ("none", "level")
+
+
+def entrant_weights(user_ids: Sequence[int], weighting: str) -> List[float]:
+    """
+    Weight of each entrant's entry under `weighting`.
+
+    "level" weights each entry by the member's level (users without leveling
+    data count as level 1); "none" returns no weights, meaning equal odds.
+
+    Args:
+        user_ids (Sequence[int]): The entrants.
+        weighting (str): One of `WEIGHTINGS`.
+
+    Returns:
+        List[float]: One weight per entrant, or an empty list for "none".
+    """
+    if weighting != "level":
+        return []
+    levels = load_user_levels()
+    return [float(max(1, int(levels.get(str(uid), {}).get("level", 1)))) for uid in user_ids]
+
+
+def new_seed() -> int:
+    """Return a fresh 64-bit draw seed from the OS randomness source."""
+    return secrets.randbits(64)
+
+
+def candidates_digest(candidates: Sequence[int], weights: Sequence[float]) -> str:
+    """Return the SHA-256 of the candidates and weights a draw was made from."""
+    payload = json.dumps([list(candidates), list(weights)], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def weighted_sample(candidates: Sequence[int], weights: Sequence[float], count: int, seed: int) -> List[int]:
+    """
+    Draw up to `count` candidates without replacement, proportionally to weight.
+
+    Deterministic for a given seed, candidate order and weights. Candidates
+    with a weight of zero or less are never drawn.
+
+    Args:
+        candidates (Sequence[int]): The user IDs to draw from.
+        weights (Sequence[float]): Weight of each candidate, same length.
+        count (int): Winners to draw.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        List[int]: The winners, highest key first.
+    """
+    rng = random.Random(seed)
+    keyed: List[Tuple[float, int]] = []
+    for index, weight in enumerate(weights):
+        # 1 - random() lies in (0, 1], so the log is always defined.
+        u = 1.0 - rng.random()
+        if weight > 0:
+            keyed.append((-math.log(u) / weight, index))
+    # Smallest negated key = largest key; ties go to the earlier candidate.
+    heapq.heapify(keyed)
+    return [candidates[heapq.heappop(keyed)[1]] for _ in range(min(count, len(keyed)))]
+
+
+def remaining_candidates(pool: RerollPool, exclude: Iterable[int] = ()) -> Tuple[List[int], List[float]]:
+    """
+    Return the pool's entrants not drawn yet, with their weights.
+
+    Args:
+        pool (RerollPool): The pool.
+        exclude (Iterable[int]): Further user IDs to leave out.
+
+    Returns:
+        Tuple[List[int], List[float]]: Candidates in pool order and their weights.
+    """
+    skipped = set(pool.previous_winners).union(exclude)
+    weights = pool.weights or [1.0] * len(pool.eligible)
+    candidates: List[int] = []
+    candidate_weights: List[float] = []
+    for uid, weight in zip(pool.eligible, weights):
+        if uid not in skipped and weight > 0:
+            candidates.append(uid)
+            candidate_weights.append(weight)
+    return candidates, candidate_weights
+
+
+def draw_from_pool(pool: RerollPool, count: int, seed: Optional[int] = None) -> List[int]:
+    """
+    Draw `count` winners from the pool and record the draw.
+
+    Everyone drawn before is skipped. The winners are appended to
+    `previous_winners` and a `DrawRecord` to `draws`.
+
+    Args:
+        pool (RerollPool): The pool to draw from, updated in place.
+        count (int): Winners to draw.
+        seed (int | None): Seed to use, a fresh one by default.
+
+    Returns:
+        List[int]: The winners, fewer than `count` if too few remain.
+    """
+    candidates, weights = remaining_candidates(pool)
+    seed = new_seed() if seed is None else seed
+    winners = weighted_sample(candidates, weights, count, seed)
+    pool.draws.append(DrawRecord(
+        seed=seed,
+        count=count,
+        candidates_digest=candidates_digest(candidates, weights),
+        winners=winners,
+        drawn_at=utc_now(),
+    ))
+    pool.previous_winners.extend(winners)
+    return winners
+
+
+def verify_draws(pool: RerollPool) -> List[int]:
+    """
+    Replay every recorded draw of the pool and check it.
+
+    Each draw is replayed from the pool's entrants and weights, minus everyone
+    drawn before it, with its recorded seed.
+
+    Args:
+        pool (RerollPool): The pool to verify.
+
+    Returns:
+        List[int]: Indexes of the draws whose candidates or winners do not
+            match the record; empty if every draw checks out.
+    """
+    recorded = sum(len(record.winners) for record in pool.draws)
+    # Winners drawn before draws were recorded are skipped by every replay.
+    replay = pool.model_copy(update={"previous_winners": pool.previous_winners[:len(pool.previous_winners) - recorded]})
+    mismatches = []
+    for index, record in enumerate(pool.draws):
+        candidates, weights = remaining_candidates(replay)
+        winners = weighted_sample(candidates, weights, record.count, record.seed)
+        if candidates_digest(candidates, weights) != record.candidates_digest or winners != record.winners:
+            mismatches.append(index)
+        replay.previous_winners = replay.previous_winners + record.winners
+    return mismatches
@@ -0,0 +1,302 @@
+"""
+Repository of giveaways.
+
+Giveaways are loaded once into an in-memory index by id, and active ones are
+kept in a heap ordered by end time. Each giveaway is persisted as its own
+JSON file under `data/giveaways/`, so saving one giveaway is one small write
+instead of a rewrite of every giveaway. A legacy `data/giveaway.json` is
+imported by `migrate_legacy`, which the bot calls at startup; importing this
+module only reads.
+
+Entrants are tracked incrementally from reaction events into a per-giveaway
+set; they are written with the giveaway on its next save or on `flush`.
+"""
+
+import heapq
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from src.utils.types.giveaway import Giveaway
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../..", "data")
+GIVEAWAY_DIR = os.path.join(DATA_DIR, "giveaways")
+LEGACY_GIVEAWAY_JSON = os.path.join(DATA_DIR, "giveaway.json")
+
+T = TypeVar("T")
+
+
+class GiveawayRepository:
+    """
+    In-memory index of giveaways, persisted one file per giveaway.
+
+    Models returned by the repository are the indexed instances: change them,
+    then `save` them to persist the change.
+
+    Attributes:
+        directory (str): Directory holding one JSON file per giveaway.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Load every persisted giveaway into the index.
+
+        Args:
+            directory (str): Directory holding one JSON file per giveaway.
+        """
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._by_id: Dict[str, Giveaway] = {}
+        # Heap of (end_time, id) for active giveaways. Entries go stale when a
+        # giveaway ends or moves; `_scheduled` holds each id's current entry.
+        self._heap: List[Tuple[datetime, str]] = []
+        self._scheduled: Dict[str, datetime] = {}
+        self._by_message: Dict[int, str] = {}
+        # Entrants per giveaway as insertion-ordered sets, and the giveaways
+        # whose entrants changed since they were last written.
+        self._entrants: Dict[str, Dict[int, None]] = {}
+        self._dirty: Set[str] = set()
+        self._load()
+
+    def reload(self, directory: Optional[str] = None) -> None:
+        """
+        Drop the index and load it again, optionally from another directory.
+
+        Args:
+            directory (str | None): New directory, defaults to the current one.
+        """
+        with self._lock:
+            self.directory = directory or self.directory
+            self._by_id.clear()
+            self._heap.clear()
+            self._scheduled.clear()
+            self._by_message.clear()
+            self._entrants.clear()
+            self._dirty.clear()
+            self._load()
+
+    # --- Persistence ---
+
+    def _path(self, giveaway_id: str) -> str:
+        return os.path.join(self.directory, f"{giveaway_id}.json")
+
+    def _write(self, giveaway: Giveaway) -> None:
+        """Persist one giveaway through a temporary file."""
+        if giveaway.id in self._entrants:
+            giveaway.participants = list(self._entrants[giveaway.id])
+        self._dirty.discard(giveaway.id)
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(giveaway.id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(giveaway.model_dump(mode="json"), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _load(self) -> None:
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.directory, name), "r", encoding="utf-8") as f:
+                        self._index(Giveaway(**json.load(f)))
+                except (OSError, ValueError) as e:
+                    print(f"Skipping unreadable giveaway file {name}: {e}")
+
+    def migrate_legacy(self, legacy_path: str = LEGACY_GIVEAWAY_JSON) -> int:
+        """
+        Import the giveaways of a single-file store, once.
+
+        Giveaways already in the index are kept. The old file is renamed to
+        `<legacy_path>.migrated`, so it is never imported twice.
+
+        Args:
+            legacy_path (str): The single-file store.
+
+        Returns:
+            int: Number of giveaways imported, 0 if there was no such file.
+        """
+        with self._lock:
+            if not os.path.exists(legacy_path):
+                return 0
+            imported = 0
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                for data in json.load(f):
+                    giveaway = Giveaway(**data)
+                    if giveaway.id not in self._by_id:
+                        self.save(giveaway)
+                        imported += 1
+            # Keep the old file for reference, but never import it twice.
+            os.replace(legacy_path, f"{legacy_path}.migrated")
+            return imported
+
+    # --- Index ---
+
+    def _index(self, giveaway: Giveaway) -> None:
+        self._by_id[giveaway.id] = giveaway
+        if giveaway.message_id is not None:
+            self._by_message[giveaway.message_id] = giveaway.id
+        if giveaway.active:
+            if self._scheduled.get(giveaway.id) != giveaway.end_time:
+                self._scheduled[giveaway.id] = giveaway.end_time
+                heapq.heappush(self._heap, (giveaway.end_time, giveaway.id))
+        else:
+            self._scheduled.pop(giveaway.id, None)
+
+    def _is_current(self, entry: Tuple[datetime, str]) -> bool:
+        end_time, giveaway_id = entry
+        return self._scheduled.get(giveaway_id) == end_time
+
+    # --- Queries ---
+
+    def get(self, giveaway_id: str) -> Optional[Giveaway]:
+        """Return the giveaway with this id, or None."""
+        return self._by_id.get(giveaway_id)
+
+    def by_message(self, message_id: int) -> Optional[Giveaway]:
+        """Return the giveaway posted as this message, or None."""
+        giveaway_id = self._by_message.get(message_id)
+        return self._by_id.get(giveaway_id) if giveaway_id is not None else None
+
+    def all(self) -> List[Giveaway]:
+        """Return every stored giveaway."""
+        with self._lock:
+            return list(self._by_id.values())
+
+    def active(self) -> List[Giveaway]:
+        """Return the active giveaways, the one ending first first."""
+        with self._lock:
+            # Drop stale entries from the top so the heap does not grow unbounded.
+            while self._heap and not self._is_current(self._heap[0]):
+                heapq.heappop(self._heap)
+            return [self._by_id[giveaway_id] for end_time, giveaway_id in sorted(self._heap) if self._is_current((end_time, giveaway_id))]
+
+    # --- Mutations ---
+
+    def save(self, giveaway: Giveaway) -> None:
+        """Index and persist one giveaway (a single file write)."""
+        with self._lock:
+            self._index(giveaway)
+            self._write(giveaway)
+
+    def update(self, giveaway_id: str, change: Callable[[Giveaway], T]) -> Optional[T]:
+        """
+        Apply `change` to a copy of a giveaway and commit it in one write.
+
+        The copy replaces the indexed giveaway only once `change` returned and
+        the file was written; if either fails, the stored giveaway is left
+        untouched. Instances fetched before the update are stale afterwards.
+
+        Args:
+            giveaway_id (str): The giveaway to change.
+            change (Callable[[Giveaway], T]): Mutates the draft and returns a result.
+
+        Returns:
+            T | None: The result of `change`, None if there is no such giveaway.
+        """
+        with self._lock:
+            current = self._by_id.get(giveaway_id)
+            if current is None:
+                return None
+            draft = current.model_copy(deep=True)
+            result = change(draft)
+            self._write(draft)
+            self._index(draft)
+            return result
+
+    def save_all(self, giveaways: Iterable[Giveaway]) -> None:
+        """Replace the stored giveaways with `giveaways`."""
+        with self._lock:
+            keep = {giveaway.id: giveaway for giveaway in giveaways}
+            for giveaway_id in list(self._by_id):
+                if giveaway_id not in keep:
+                    self.delete(giveaway_id)
+            for giveaway in keep.values():
+                self.save(giveaway)
+
+    def delete(self, giveaway_id: str) -> None:
+        """Remove one giveaway from the index and from disk."""
+        with self._lock:
+            giveaway = self._by_id.pop(giveaway_id, None)
+            if giveaway is not None and giveaway.message_id is not None:
+                self._by_message.pop(giveaway.message_id, None)
+            self._scheduled.pop(giveaway_id, None)
+            self._entrants.pop(giveaway_id, None)
+            self._dirty.discard(giveaway_id)
+            try:
+                os.remove(self._path(giveaway_id))
+            except FileNotFoundError:
+                pass
+
+    # --- Entrants ---
+
+    def _entrant_set(self, giveaway: Giveaway) -> Dict[int, None]:
+        entrants = self._entrants.get(giveaway.id)
+        if entrants is None:
+            entrants = self._entrants[giveaway.id] = dict.fromkeys(giveaway.participants)
+        return entrants
+
+    def entrants(self, giveaway_id: str) -> List[int]:
+        """Return the entrants of a giveaway in entry order."""
+        with self._lock:
+            giveaway = self._by_id.get(giveaway_id)
+            return list(self._entrant_set(giveaway)) if giveaway else []
+
+    def add_entrant(self, giveaway_id: str, user_id: int) -> bool:
+        """
+        Record an entry, in memory only until the next save or flush.
+
+        Returns:
+            bool: True if the user was not entered yet.
+        """
+        with self._lock:
+            giveaway = self._by_id.get(giveaway_id)
+            if giveaway is None:
+                return False
+            entrants = self._entrant_set(giveaway)
+            if user_id in entrants:
+                return False
+            entrants[user_id] = None
+            self._dirty.add(giveaway_id)
+            return True
+
+    def remove_entrant(self, giveaway_id: str, user_id: int) -> bool:
+        """
+        Withdraw an entry, in memory only until the next save or flush.
+
+        Returns:
+            bool: True if the user was entered.
+        """
+        with self._lock:
+            giveaway = self._by_id.get(giveaway_id)
+            if giveaway is None or user_id not in self._entrant_set(giveaway):
+                return False
+            del self._entrants[giveaway_id][user_id]
+            self._dirty.add(giveaway_id)
+            return True
+
+    def set_entrants(self, giveaway_id: str, user_ids: Iterable[int]) -> None:
+        """Replace the entrants of a giveaway, e.g. after a full reconciliation."""
+        with self._lock:
+            if giveaway_id in self._by_id:
+                self._entrants[giveaway_id] = dict.fromkeys(user_ids)
+                self._dirty.add(giveaway_id)
+
+    def flush(self) -> int:
+        """
+        Write every giveaway whose entrants changed since its last write.
+
+        Returns:
+            int: Number of giveaways written.
+        """
+        with self._lock:
+            dirty = [self._by_id[giveaway_id] for giveaway_id in self._dirty if giveaway_id in self._by_id]
+            for giveaway in dirty:
+                self._write(giveaway)
+            self._dirty.clear()
+            return len(dirty)
+
+
+giveaway_store = GiveawayRepository(GIVEAWAY_DIR)
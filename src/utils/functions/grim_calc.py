@@ -1,24 +1,57 @@
-import json
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from src.utils.config import emojis
+from . import game_tables
+from .game_tables import GRIM_DATA_FILES
+from .memo import memoize
+
 
 class GrimCalcResult(BaseModel):
     """
     Data model for the result of a Grimoire cost calculation.
+
+    Results are memoized and shared between callers, so the model is frozen.
+
+    Attributes:
+        essence_cost (int): Essence needed for the requested level range.
+        imprint_cost (int): Imprint needed for the requested level range.
+        essence_choices (float): Essence cost expressed in event choices.
+        imprint_choices (float): Imprint cost expressed in event choices.
+        error (str | None): An error message if the input was invalid.
     """
+    model_config = ConfigDict(frozen=True)
+
     essence_cost: int = 0
     imprint_cost: int = 0
     essence_choices: float = 0.0
     imprint_choices: float = 0.0
     error: str | None = None
 
-def _load_json_data(file_path: str) -> dict:
-    """A utility function to load data from a specified JSON file."""
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Error: {file_path} not found")
-        return {}
+class GrimReachResult(BaseModel):
+    """
+    Data model for the result of a Grimoire reverse query.
+
+    Results are memoized and shared between callers, so the model is frozen.
+
+    Attributes:
+        start_lvl (int): The level the resources are spent from (0 from scratch).
+        level (int): The highest level the resources reach.
+        essence_left (int): Essence left over after reaching `level`.
+        imprint_left (int | None): Imprint left over, None if no imprint budget was given.
+        next_essence (int): Additional essence needed for the next level (0 at max level).
+        next_imprint (int): Additional imprint needed for the next level (0 at max level
+            or without an imprint budget).
+        error (str | None): An error message if the input was invalid.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    start_lvl: int = 0
+    level: int = 0
+    essence_left: int = 0
+    imprint_left: int | None = None
+    next_essence: int = 0
+    next_imprint: int = 0
+    error: str | None = None
 
 def _calculate_event_choices(essence: int = 0, imprint: int = 0) -> tuple[float, float]:
     """Calculates the number of 'event choices' for essence and imprint."""
@@ -26,6 +59,7 @@ def _calculate_event_choices(essence: int = 0, imprint: int = 0) -> tuple[float,
     imprint_choices = imprint / 175000 if imprint > 0 else 0
     return essence_choices, imprint_choices
 
+@memoize(maxsize=2048, data_files=GRIM_DATA_FILES)
 def get_grim_calc(
     book: str,
     goal_lvl: int,
@@ -34,6 +68,10 @@ def get_grim_calc(
     """
     Calculates the resource cost to upgrade a Grimoire.
 
+    Costs are looked up in the startup-loaded cumulative tables, so a range
+    query is two subtractions with no file I/O. Results are memoized per
+    argument tuple and dropped when a Grimoire data file changes.
+
     Args:
         book: The type of Grimoire ('Enable' or 'Imprint').
         goal_lvl: The target level for the calculation.
@@ -42,41 +80,21 @@ def get_grim_calc(
     Returns:
         A GrimCalcResult object containing the calculated costs or an error.
     """
-    grim1_cost = _load_json_data("data/grim1Cost.json")
-    grim2_cost = _load_json_data("data/grim2Cost.json")
-
     if current_lvl is not None and goal_lvl <= current_lvl:
         return GrimCalcResult(error="Goal level must be higher than current level.")
 
-    if book.lower() == "enable":
-        cost_data = grim1_cost
-    elif book.lower() == "imprint":
-        cost_data = grim2_cost
-    else:
+    table = game_tables.tables.grimoire(book)
+    if table is None:
         return GrimCalcResult(error="Invalid book type. Please choose 'Enable' or 'Imprint'.")
 
-    goal_cost = cost_data.get(str(goal_lvl))
-    if goal_cost is None:
+    if not 1 <= goal_lvl <= table.max_level:
         return GrimCalcResult(error=f"No data available for goal level {goal_lvl}")
 
-    current_cost = cost_data.get(str(current_lvl)) if current_lvl is not None else None
-    if current_lvl is not None and current_cost is None:
+    if current_lvl is not None and not 1 <= current_lvl <= table.max_level:
         return GrimCalcResult(error=f"No data available for current level {current_lvl}")
 
-    essence_diff = 0
-    imprint_diff = 0
-
-    if isinstance(goal_cost, int):  # Enable book
-        essence_goal = goal_cost
-        essence_current = current_cost if current_cost is not None else 0
-        essence_diff = essence_goal - essence_current
-    else:  # Imprint book
-        essence_goal = goal_cost.get("essence", 0)
-        imprint_goal = goal_cost.get("imprint", 0)
-        essence_current = current_cost.get("essence", 0) if current_cost is not None else 0
-        imprint_current = current_cost.get("imprint", 0) if current_cost is not None else 0
-        essence_diff = essence_goal - essence_current
-        imprint_diff = imprint_goal - imprint_current
+    # Without a current level the cost is measured from scratch (index 0).
+    essence_diff, imprint_diff = table.range_cost(current_lvl or 0, goal_lvl)
 
     essence_choices, imprint_choices = _calculate_event_choices(essence=essence_diff, imprint=imprint_diff)
 
@@ -86,3 +104,149 @@ def get_grim_calc(
         essence_choices=essence_choices,
         imprint_choices=imprint_choices
     )
+
+@memoize(maxsize=2048, data_files=GRIM_DATA_FILES)
+def get_grim_reach(
+    book: str,
+    essence: int,
+    imprint: int | None = None,
+    current_lvl: int | None = None
+) -> GrimReachResult:
+    """
+    Finds the highest Grimoire level reachable with the given resources.
+
+    A binary search over the startup-loaded cumulative tables, with no file
+    I/O. Results are memoized per argument tuple.
+
+    Args:
+        book: The type of Grimoire ('Enable' or 'Imprint').
+        essence: The essence available.
+        imprint: The imprint available, if it should limit the result.
+        current_lvl: An optional current level to spend the resources from.
+
+    Returns:
+        A GrimReachResult object containing the reachable level or an error.
+    """
+    table = game_tables.tables.grimoire(book)
+    if table is None:
+        return GrimReachResult(error="Invalid book type. Please choose 'Enable' or 'Imprint'.")
+
+    if essence < 0 or (imprint is not None and imprint < 0):
+        return GrimReachResult(error="Resources can't be negative.")
+
+    if current_lvl is not None and not 1 <= current_lvl <= table.max_level:
+        return GrimReachResult(error=f"No data available for current level {current_lvl}")
+
+    start = current_lvl or 0
+    level = table.reachable_level(start, essence, imprint)
+    essence_spent, imprint_spent = table.range_cost(start, level)
+
+    next_essence = next_imprint = 0
+    if level < table.max_level:
+        next_essence, next_imprint = table.range_cost(level, level + 1)
+        # Only what the leftover resources don't already cover is still needed.
+        next_essence = max(0, next_essence - (essence - essence_spent))
+        next_imprint = 0 if imprint is None else max(0, next_imprint - (imprint - imprint_spent))
+
+    return GrimReachResult(
+        start_lvl=start,
+        level=level,
+        essence_left=essence - essence_spent,
+        imprint_left=None if imprint is None else imprint - imprint_spent,
+        next_essence=next_essence,
+        next_imprint=next_imprint,
+    )
+
+def format_grim_calc(book: str, goal_lvl: int, current_lvl: int | None, result: GrimCalcResult) -> str:
+    """
+    Formats a successful Grimoire calculation as a Discord message.
+
+    Args:
+        book: The type of Grimoire ('Enable' or 'Imprint').
+        goal_lvl: The target level of the calculation.
+        current_lvl: The optional current level of the calculation.
+        result: The calculation result to format.
+
+    Returns:
+        The formatted message.
+    """
+    level_range = f"`{current_lvl} → {goal_lvl}`" if current_lvl else f"`→ {goal_lvl}`"
+    if book.lower() == "enable":
+        book_name = f"{emojis.grim_book1} Grimoire • Enabling Chapter"
+        return (
+            f"> **{book_name}** {level_range}\n"
+            f"> \n"
+            f"> {emojis.grim_essence} `{result.essence_cost:,}` {result.essence_choices:.2f} event choices"
+        )
+
+    # Imprint
+    book_name = "Grimoire • Imprint Chapter"
+    return (
+        f"> **{book_name}** {level_range}\n"
+        f"> \n"
+        f"> {emojis.grim_essence} `{result.essence_cost:,}` {result.essence_choices:.2f} event choices\n"
+        f"> {emojis.grim_imprint} `{result.imprint_cost:,}` {result.imprint_choices:.2f} event choices"
+    )
+
+def format_grim_reach(book: str, result: GrimReachResult) -> str:
+    """
+    Formats a successful Grimoire reverse query as a Discord message.
+
+    Args:
+        book: The type of Grimoire ('Enable' or 'Imprint').
+        result: The reverse query result to format.
+
+    Returns:
+        The formatted message.
+    """
+    if book.lower() == "enable":
+        book_name = f"{emojis.grim_book1} Grimoire • Enabling Chapter"
+    else:
+        book_name = "Grimoire • Imprint Chapter"
+
+    level_range = f"`{result.start_lvl} → {result.level}`" if result.start_lvl else f"`→ {result.level}`"
+    lines = [
+        f"> **{book_name}** {level_range}",
+        "> ",
+        f"> {emojis.grim_essence} `{result.essence_left:,}` left over",
+    ]
+    if result.imprint_left is not None:
+        lines.append(f"> {emojis.grim_imprint} `{result.imprint_left:,}` left over")
+
+    missing = []
+    if result.next_essence:
+        missing.append(f"{emojis.grim_essence} `{result.next_essence:,}`")
+    if result.next_imprint:
+        missing.append(f"{emojis.grim_imprint} `{result.next_imprint:,}`")
+    if missing:
+        lines.append(f"> Level `{result.level + 1}` needs {' '.join(missing)} more")
+    else:
+        lines.append("> That's the max level!")
+    return "\n".join(lines)
+
+@memoize(maxsize=2048, data_files=GRIM_DATA_FILES)
+def get_grim_reach_response(
+    book: str,
+    essence: int,
+    imprint: int | None = None,
+    current_lvl: int | None = None
+) -> str:
+    """
+    Returns the formatted Grimoire reverse query, or a warning if the input is invalid.
+    """
+    result = get_grim_reach(book, essence, imprint, current_lvl)
+    if result.error:
+        return f"⚠️ {result.error}"
+    return format_grim_reach(book, result)
+
+@memoize(maxsize=2048, data_files=GRIM_DATA_FILES)
+def get_grim_calc_response(book: str, goal_lvl: int, current_lvl: int | None = None) -> str:
+    """
+    Returns the formatted Grimoire calculation, or a warning if the input is invalid.
+
+    Memoized per argument tuple, so repeated agent tool calls reuse the string.
+    """
+    result = get_grim_calc(book, goal_lvl, current_lvl)
+    if result.error:
+        return f"⚠️ {result.error}"
+    return format_grim_calc(book, goal_lvl, current_lvl, result)
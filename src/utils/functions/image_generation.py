@@ -0,0 +1,172 @@
+"""
+Non-blocking image generation for the `/imagine` command.
+
+All requests go through one shared `AsyncOpenAI` client backed by a pooled
+HTTP connection, so a generation never blocks the bot's event loop. A per-user
+rate limiter spaces out requests from the same member, and a generation queue
+caps how many images are generated at once and how many may wait in line.
+"""
+
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from ..config import config
+
+load_dotenv()
+API_KEY = os.getenv("OPENAI_API_KEY")
+
+_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Return the shared async OpenAI client, creating it on first use.
+
+    The client keeps a pool of keep-alive connections, so consecutive
+    generations reuse the same TLS sessions.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(
+            api_key=API_KEY,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=config.openai_max_connections,
+                    max_keepalive_connections=config.openai_max_connections,
+                ),
+            ),
+        )
+    return _client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client and its connection pool, if it was created."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
+
+
+class UserRateLimiter:
+    """
+    Allows each user one request per cooldown window.
+
+    Attributes:
+        cooldown (float): Seconds a user must wait between two requests.
+    """
+
+    def __init__(self, cooldown: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            cooldown (float): Seconds a user must wait between two requests.
+        """
+        self.cooldown = cooldown
+        self._last: Dict[int, float] = {}
+
+    def retry_after(self, user_id: int) -> float:
+        """
+        Return how many seconds `user_id` must still wait (0 if allowed now).
+        """
+        last = self._last.get(user_id)
+        if last is None:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - last))
+
+    def hit(self, user_id: int) -> float:
+        """
+        Record a request from `user_id` if allowed.
+
+        Returns:
+            float: 0 if the request was recorded, otherwise the seconds left to wait.
+        """
+        wait = self.retry_after(user_id)
+        if wait > 0:
+            return wait
+        self._last[user_id] = time.monotonic()
+
+        # Forget users whose cooldown has passed so the map stays small.
+        if len(self._last) > 1024:
+            now = time.monotonic()
+            self._last = {uid: t for uid, t in self._last.items() if now - t < self.cooldown}
+        return 0.0
+
+    def refund(self, user_id: int) -> None:
+        """
+        Give back a recorded request that was rejected or failed, so the user
+        is not locked out for a request that produced nothing.
+        """
+        self._last.pop(user_id, None)
+
+
+class QueueFullError(Exception):
+    """Raised when the generation queue has no room for another request."""
+
+
+class GenerationQueue:
+    """
+    Bounds concurrent generations and the number of requests waiting for a slot.
+
+    Attributes:
+        max_concurrent (int): Generations allowed to run at the same time.
+        max_pending (int): Requests allowed to wait for a free slot.
+    """
+
+    def __init__(self, max_concurrent: int, max_pending: int):
+        """
+        Initialize the queue.
+
+        Args:
+            max_concurrent (int): Generations allowed to run at the same time.
+            max_pending (int): Requests allowed to wait for a free slot.
+        """
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return self._waiting
+
+    async def generate(self, prompt: str) -> Optional[str]:
+        """
+        Generate an image once a slot is free.
+
+        Args:
+            prompt (str): The image prompt.
+
+        Returns:
+            Optional[str]: The generated image URL.
+
+        Raises:
+            QueueFullError: If `max_pending` requests are already waiting.
+        """
+        if self._slots.locked() and self._waiting >= self.max_pending:
+            raise QueueFullError()
+
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            response = await get_openai_client().images.generate(
+                model="dall-e-3",
+                prompt=prompt,
+                size="1024x1024",
+                quality="standard",
+                n=1,
+            )
+            return response.data[0].url if response.data else None
+        finally:
+            self._slots.release()
@@ -0,0 +1,156 @@
+"""
+Level curve service for the leveling system.
+
+The cumulative XP required for every level is built once at startup from
+`data/levelCosts.json`, or from the formula used by `scripts/lvl_cost.py`
+when that file is missing, and kept as one level-indexed tuple. XP for a
+level and XP between two levels are then O(1) lookups, and the level reached
+with some XP is a binary search.
+"""
+
+import json
+import math
+import os
+from bisect import bisect_right
+from typing import Dict, Optional, Tuple
+
+from ..types.user_level import XpFactors
+
+LEVEL_COSTS_PATH = os.path.join(os.path.dirname(__file__), "../../..", "data", "levelCosts.json")
+
+# Highest level generated by `scripts/lvl_cost.py`.
+MAX_LEVEL = 250
+
+
+def formula_level_costs(max_level: int = MAX_LEVEL) -> Dict[int, int]:
+    """
+    Cumulative XP per level from the formula in `scripts/lvl_cost.py`.
+
+    Args:
+        max_level (int): Highest level to generate.
+
+    Returns:
+        Dict[int, int]: Level mapped to the cumulative XP required to reach it.
+    """
+    costs: Dict[int, int] = {}
+    cumulative = 0
+    for level in range(1, max_level + 1):
+        cumulative += round(100 * level + (level ** 3) * 3)
+        costs[level] = cumulative
+    return costs
+
+
+class LevelCurve:
+    """
+    Cumulative XP requirements of every level, indexed by level.
+
+    Attributes:
+        cumulative (Tuple[int, ...]): XP required to reach each level; index 0
+            is level 0 (no XP) and the last index is the highest level.
+    """
+
+    def __init__(self, level_costs: Dict[int, int]):
+        """
+        Build the curve from a level to cumulative XP mapping.
+
+        Args:
+            level_costs (Dict[int, int]): Level mapped to the cumulative XP
+                required to reach it, starting at level 1.
+        """
+        self.cumulative: Tuple[int, ...] = (0, *(level_costs[level] for level in sorted(level_costs)))
+
+    @classmethod
+    def load(cls, path: str = LEVEL_COSTS_PATH) -> "LevelCurve":
+        """
+        Build the curve from `levelCosts.json`, falling back to the formula.
+
+        Args:
+            path (str): Path of the level costs JSON file.
+
+        Returns:
+            LevelCurve: The curve.
+        """
+        try:
+            with open(path, "r") as f:
+                costs = {int(level): int(xp) for level, xp in json.load(f).items()}
+            if costs:
+                return cls(costs)
+        except (FileNotFoundError, json.JSONDecodeError, ValueError):
+            pass
+        return cls(formula_level_costs())
+
+    @property
+    def max_level(self) -> int:
+        """The highest level on the curve."""
+        return len(self.cumulative) - 1
+
+    def xp_for_level(self, level: int) -> Optional[int]:
+        """
+        Cumulative XP required to reach `level`, or None if it is not on the curve.
+        """
+        if not 0 <= level <= self.max_level:
+            return None
+        return self.cumulative[level]
+
+    def level_for_xp(self, xp: int) -> int:
+        """
+        Highest level reached with `xp` total XP, 0 below the level 1 requirement.
+        """
+        return bisect_right(self.cumulative, xp) - 1
+
+    def xp_between(self, from_level: int, to_level: int) -> Optional[int]:
+        """
+        XP needed to go from the start of `from_level` to `to_level`, or None
+        if either level is not on the curve or `to_level` is below `from_level`.
+        """
+        start, goal = self.xp_for_level(from_level), self.xp_for_level(to_level)
+        if start is None or goal is None or goal < start:
+            return None
+        return goal - start
+
+    def messages_to_level(
+        self,
+        xp: int,
+        target_level: int,
+        factors: XpFactors,
+        base_xp: int,
+        level_multiplier_rate: float,
+    ) -> Optional[int]:
+        """
+        Messages needed to reach `target_level` from `xp`, with the given XP factors.
+
+        The level multiplier grows with each level, so messages are counted
+        level by level, carrying the overshoot of the last message into the
+        next level. The work is bounded by the number of levels crossed.
+
+        Args:
+            xp (int): Current total XP.
+            target_level (int): Level to reach.
+            factors (XpFactors): The member's static bonus and multipliers.
+            base_xp (int): Base XP per message.
+            level_multiplier_rate (float): Level multiplier gained per level.
+
+        Returns:
+            int | None: Number of messages, 0 if the level is already reached,
+                None if the level is not on the curve or no XP is gained.
+        """
+        goal = self.xp_for_level(target_level)
+        if goal is None:
+            return None
+
+        messages = 0
+        level = self.level_for_xp(xp)
+        while xp < goal:
+            per_message = factors.message_xp(base_xp, level, level_multiplier_rate)
+            if per_message <= 0:
+                return None
+            level_end = self.cumulative[min(level + 1, target_level)]
+            count = math.ceil((level_end - xp) / per_message)
+            messages += count
+            xp += count * per_message
+            level = self.level_for_xp(xp)
+        return messages
+
+
+# The shared curve, built once at import time.
+level_curve: LevelCurve = LevelCurve.load()
@@ -0,0 +1,185 @@
+"""
+Bulk level recomputation for XP formula migrations.
+
+One engine replaces the old one-off scripts: user records are streamed one by
+one through an optional XP transform (such as the x3.5 rescale), levels are
+recomputed with a binary search over the level curve, and the result is
+either reported as a dry-run diff or written back atomically. The whole
+read-modify-write cycle holds the same lock as `add_xp`, so XP granted by the
+running bot is never overwritten.
+"""
+
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .level_curve import LevelCurve, level_curve
+from .leveling import LEVEL_DATA_PATH, load_user_levels, save_user_levels, user_levels_lock
+
+XpTransform = Callable[[int], int]
+
+
+class LevelChange(BaseModel):
+    """
+    One user's XP and level before and after a migration.
+
+    Attributes:
+        user_id (str): The Discord ID of the user.
+        username (str): The stored username.
+        old_xp (int): XP before the migration.
+        new_xp (int): XP after the migration.
+        old_level (int): Stored level before the migration.
+        new_level (int): Level recomputed from the new XP.
+    """
+    user_id: str
+    username: str
+    old_xp: int
+    new_xp: int
+    old_level: int
+    new_level: int
+
+
+class MigrationReport(BaseModel):
+    """
+    Outcome of a level migration.
+
+    Attributes:
+        users (int): User records processed.
+        xp_changed (int): Users whose XP changed.
+        level_changed (int): Users whose level changed.
+        changes (List[LevelChange]): Every user whose XP or level changed.
+        applied (bool): Whether the result was written, False for a dry run.
+        output_path (str): The file written, or that would be written.
+    """
+    users: int = 0
+    xp_changed: int = 0
+    level_changed: int = 0
+    changes: List[LevelChange] = Field(default_factory=list)
+    applied: bool = False
+    output_path: str = LEVEL_DATA_PATH
+
+
+def scale_xp(factor: float) -> XpTransform:
+    """
+    XP transform multiplying every total by `factor`, rounded down.
+
+    The factor is applied as an exact decimal, so x3.5 gives the same
+    result for every XP total regardless of float rounding.
+
+    Args:
+        factor (float): The multiplier, e.g. 3.5.
+
+    Returns:
+        XpTransform: The transform.
+    """
+    exact = Decimal(str(factor))
+    return lambda xp: int(xp * exact)
+
+
+def iter_user_records(data: Dict[str, Dict]) -> Iterator[Tuple[str, Dict]]:
+    """Yield (user_id, record) pairs, skipping malformed records."""
+    for user_id, record in data.items():
+        if isinstance(record, dict):
+            yield user_id, record
+
+
+def recompute_levels(
+    records: Iterator[Tuple[str, Dict]],
+    transform: Optional[XpTransform] = None,
+    curve: LevelCurve = level_curve,
+) -> Iterator[Tuple[str, Dict, Optional[LevelChange]]]:
+    """
+    Apply `transform` to each record's XP and recompute its level.
+
+    Args:
+        records (Iterator[Tuple[str, Dict]]): (user_id, record) pairs.
+        transform (XpTransform | None): XP transform, None keeps the XP.
+        curve (LevelCurve): The level curve to recompute levels with.
+
+    Yields:
+        Tuple[str, Dict, LevelChange | None]: The user ID, the updated record
+            and the change, None if neither XP nor level changed.
+    """
+    for user_id, record in records:
+        old_xp = int(record.get("xp", 0))
+        old_level = int(record.get("level", 0))
+        new_xp = transform(old_xp) if transform else old_xp
+        new_level = curve.level_for_xp(new_xp)
+
+        updated = {**record, "xp": new_xp, "level": new_level}
+        change = None
+        if new_xp != old_xp or new_level != old_level:
+            change = LevelChange(
+                user_id=user_id,
+                username=str(record.get("username", user_id)),
+                old_xp=old_xp,
+                new_xp=new_xp,
+                old_level=old_level,
+                new_level=new_level,
+            )
+        yield user_id, updated, change
+
+
+def migrate_user_levels(
+    transform: Optional[XpTransform] = None,
+    dry_run: bool = True,
+    output_path: Optional[str] = None,
+    curve: LevelCurve = level_curve,
+) -> MigrationReport:
+    """
+    Recompute every user's level, optionally after transforming their XP.
+
+    Args:
+        transform (XpTransform | None): XP transform, None only fixes levels.
+        dry_run (bool): Only report the changes, write nothing.
+        output_path (str | None): File to write, defaults to user_levels.json.
+        curve (LevelCurve): The level curve to recompute levels with.
+
+    Returns:
+        MigrationReport: The changes, and whether they were written.
+    """
+    report = MigrationReport(output_path=output_path or LEVEL_DATA_PATH, applied=not dry_run)
+
+    with user_levels_lock():
+        migrated: Dict[str, Dict] = {}
+        for user_id, record, change in recompute_levels(iter_user_records(load_user_levels()), transform, curve):
+            report.users += 1
+            migrated[user_id] = record
+            if change is None:
+                continue
+            report.changes.append(change)
+            if change.new_xp != change.old_xp:
+                report.xp_changed += 1
+            if change.new_level != change.old_level:
+                report.level_changed += 1
+
+        if not dry_run:
+            save_user_levels(migrated, report.output_path)
+
+    return report
+
+
+def format_migration_report(report: MigrationReport, limit: Optional[int] = 50) -> str:
+    """
+    Format a migration report as a diff, one line per changed user.
+
+    Args:
+        report (MigrationReport): The report to format.
+        limit (int | None): Changed users to list, None for all.
+
+    Returns:
+        str: The formatted report.
+    """
+    lines = [
+        f"  {c.username}: XP {c.old_xp:,} → {c.new_xp:,}, level {c.old_level} → {c.new_level}"
+        for c in report.changes[:limit]
+    ]
+    if limit is not None and len(report.changes) > limit:
+        lines.append(f"  ... and {len(report.changes) - limit} more")
+
+    action = f"Wrote {report.output_path}" if report.applied else "Dry run, nothing written"
+    lines.append(
+        f"{report.users} users, {report.xp_changed} XP changes, {report.level_changed} level changes. {action}."
+    )
+    return "\n".join(lines)
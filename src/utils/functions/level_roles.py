@@ -0,0 +1,287 @@
+"""
+Level roles: granting roles from a level on, one member or all at once.
+
+`roles.level_roles` maps levels to roles. A member should hold the role of
+the highest level they reached (or every reached role, with
+`roles.level_roles_stack`), and none of the other level roles; roles outside
+the mapping are never touched.
+
+`apply_level_roles` fixes one member, e.g. on level-up. `sync_level_roles`
+walks every user in the leveling store with a pool of
+`config.level_role_sync_workers` workers, diffs their roles and applies only
+the changes, each request retried on rate limits. Progress is checkpointed to
+`data/level_role_sync.json`, so an interrupted sync resumes where it stopped.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+import nextcord
+from pydantic import BaseModel, Field
+
+from src.utils.config import config, roles
+from .discord_rest import with_backoff
+from .leveling import load_user_levels
+from .profile_cache import profile_cache
+from .time_utils import utc_now
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../..", "data")
+SYNC_PROGRESS_PATH = os.path.join(DATA_DIR, "level_role_sync.json")
+
+AUDIT_REASON = "Level role sync"
+
+
+class RoleSyncReport(BaseModel):
+    """
+    Outcome of a level role sync, accumulated across resumed runs.
+
+    Attributes:
+        started_at (datetime): When the sync was first started, in UTC.
+        total (int): Users in the leveling store.
+        processed (int): Users handled so far.
+        changed (int): Members whose roles were (or would be) changed.
+        roles_added (int): Roles added, or that would be added.
+        roles_removed (int): Roles removed, or that would be removed.
+        not_in_guild (int): Users who are no longer members.
+        failed (int): Members whose roles could not be changed.
+        resumed (bool): Whether this run continued an interrupted sync.
+        dry_run (bool): Whether changes were only counted.
+    """
+    started_at: datetime = Field(default_factory=utc_now)
+    total: int = 0
+    processed: int = 0
+    changed: int = 0
+    roles_added: int = 0
+    roles_removed: int = 0
+    not_in_guild: int = 0
+    failed: int = 0
+    resumed: bool = False
+    dry_run: bool = False
+
+
+def target_level_roles(level: int) -> Set[int]:
+    """
+    Return the IDs of the level roles a member of `level` should hold.
+
+    Args:
+        level (int): The member's level.
+
+    Returns:
+        Set[int]: The highest reached level role, or every reached one when
+            `roles.level_roles_stack` is set.
+    """
+    reached = sorted((lr for lr in roles.level_roles if lr.level <= level), key=lambda lr: lr.level)
+    if not reached:
+        return set()
+    if roles.level_roles_stack:
+        return {lr.id for lr in reached}
+    return {reached[-1].id}
+
+
+def diff_level_roles(current_role_ids: Iterable[int], level: int) -> Tuple[Set[int], Set[int]]:
+    """
+    Compute the level roles to add and to remove for a member.
+
+    Args:
+        current_role_ids (Iterable[int]): IDs of the roles the member holds.
+        level (int): The member's level.
+
+    Returns:
+        Tuple[Set[int], Set[int]]: Role IDs to add, role IDs to remove.
+    """
+    managed = {lr.id for lr in roles.level_roles}
+    held = set(current_role_ids) & managed
+    target = target_level_roles(level)
+    return target - held, held - target
+
+
+async def apply_level_roles(member: nextcord.Member, level: int, dry_run: bool = False) -> Tuple[int, int]:
+    """
+    Give a member exactly the level roles of their level.
+
+    Roles missing from the guild are ignored. Costs at most one request to
+    add and one to remove, and none if the member's roles are already right.
+
+    Args:
+        member (nextcord.Member): The member.
+        level (int): The member's level.
+        dry_run (bool): Only count the changes.
+
+    Returns:
+        Tuple[int, int]: Roles added and removed.
+
+    Raises:
+        nextcord.HTTPException: A change failed after its retries.
+    """
+    add_ids, remove_ids = diff_level_roles((role.id for role in member.roles), level)
+    to_add = [role for role in map(member.guild.get_role, add_ids) if role is not None]
+    to_remove = [role for role in map(member.guild.get_role, remove_ids) if role is not None]
+    if not dry_run:
+        if to_add:
+            await with_backoff(lambda: member.add_roles(*to_add, reason=AUDIT_REASON))
+        if to_remove:
+            await with_backoff(lambda: member.remove_roles(*to_remove, reason=AUDIT_REASON))
+    return len(to_add), len(to_remove)
+
+
+# --- Progress checkpoints ---
+
+def _load_progress(path: str) -> Tuple[Optional[RoleSyncReport], Set[str]]:
+    """Return the report and the processed user IDs of an interrupted sync."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return RoleSyncReport(**data["report"]), set(data["done"])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        return None, set()
+
+
+def _save_progress(path: str, report: RoleSyncReport, done: Set[str]) -> None:
+    """Write the progress through a temporary file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"report": report.model_dump(mode="json"), "done": sorted(done)}, f)
+    os.replace(tmp_path, path)
+
+
+def clear_sync_progress(path: str = SYNC_PROGRESS_PATH) -> None:
+    """Forget an interrupted sync, so the next one starts over."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# --- Bulk sync ---
+
+async def _current_member(guild: nextcord.Guild, user_id: int) -> Optional[nextcord.Member]:
+    """
+    Return a member with up-to-date roles, or None if they left the guild.
+
+    The profile cache may hold members seen minutes ago, whose roles are
+    stale without the members intent. A chunked guild's member cache is kept
+    current by member update events; otherwise the member is fetched.
+    """
+    if guild.chunked:
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+    try:
+        member = await with_backoff(lambda: guild.fetch_member(user_id))
+    except nextcord.NotFound:
+        profile_cache.forget_member(guild.id, user_id)
+        return None
+    profile_cache.put_member(member)
+    return member
+
+
+async def sync_level_roles(
+    guild: nextcord.Guild,
+    dry_run: bool = False,
+    resume: bool = True,
+    on_progress: Optional[Callable[[RoleSyncReport], Awaitable[None]]] = None,
+    path: str = SYNC_PROGRESS_PATH,
+) -> RoleSyncReport:
+    """
+    Give every member in the leveling store the level roles of their level.
+
+    Users are processed by `config.level_role_sync_workers` concurrent
+    workers. A dry run takes members from the profile cache, so only
+    uncached ones cost a fetch; applying diffs against current roles, read
+    from a chunked guild's member cache or fetched. Progress is saved every
+    `config.level_role_sync_checkpoint_every` users and removed once the
+    sync completes. A dry run neither changes roles nor saves progress.
+
+    Args:
+        guild (nextcord.Guild): The guild to sync.
+        dry_run (bool): Only count the changes.
+        resume (bool): Continue an interrupted sync instead of starting over.
+        on_progress (Callable | None): Awaited with the report at each checkpoint.
+        path (str): Progress file.
+
+    Returns:
+        RoleSyncReport: The totals, including those of resumed runs.
+    """
+    levels: Dict[str, Dict] = load_user_levels()
+    report, done = _load_progress(path) if resume and not dry_run else (None, set())
+    if report is None:
+        report, done = RoleSyncReport(dry_run=dry_run), set()
+    else:
+        report.resumed = True
+    report.total = len(levels)
+
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    for user_id in sorted(levels):
+        if user_id not in done:
+            queue.put_nowait(user_id)
+
+    async def checkpoint() -> None:
+        if not dry_run:
+            _save_progress(path, report, done)
+        if on_progress is not None:
+            await on_progress(report)
+
+    async def worker() -> None:
+        while True:
+            try:
+                user_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                if dry_run:
+                    member = await profile_cache.get_member(guild, int(user_id))
+                else:
+                    member = await _current_member(guild, int(user_id))
+                if member is None:
+                    report.not_in_guild += 1
+                else:
+                    added, removed = await apply_level_roles(member, int(levels[user_id].get("level", 0)), dry_run)
+                    if added or removed:
+                        report.changed += 1
+                        report.roles_added += added
+                        report.roles_removed += removed
+            except Exception as e:
+                report.failed += 1
+                print(f"Error syncing level roles of {user_id}: {e}")
+            done.add(user_id)
+            report.processed += 1
+            if report.processed % config.level_role_sync_checkpoint_every == 0:
+                await checkpoint()
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(config.level_role_sync_workers)))
+    except BaseException:
+        # Cancelled or crashed: keep what was done for the next run.
+        if not dry_run:
+            _save_progress(path, report, done)
+        raise
+
+    if not dry_run:
+        clear_sync_progress(path)
+    return report
+
+
+def format_sync_report(report: RoleSyncReport) -> str:
+    """
+    Format a level role sync report for a reply.
+
+    Args:
+        report (RoleSyncReport): The report to format.
+
+    Returns:
+        str: The formatted report.
+    """
+    verb = "would change" if report.dry_run else "changed"
+    lines = [
+        f"{report.processed}/{report.total} users processed{' (resumed)' if report.resumed else ''}.",
+        f"{report.changed} members {verb}: +{report.roles_added} / -{report.roles_removed} roles.",
+    ]
+    if report.not_in_guild:
+        lines.append(f"{report.not_in_guild} users are no longer members.")
+    if report.failed:
+        lines.append(f"⚠ {report.failed} members could not be updated.")
+    return "\n".join(lines)
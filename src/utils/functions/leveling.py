@@ -8,13 +8,27 @@ Implements a four-tier XP calculation system:
 """
 import json
 import os
-from typing import Dict, Tuple, Optional, List
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple, Optional, List
 import nextcord
-from ..types.user_level import UserLevel
+from ..types.user_level import UserLevel, XpFactors
 from ..config import config, channels, roles
+from .level_curve import LEVEL_COSTS_PATH, level_curve
 
 LEVEL_DATA_PATH = os.path.join(os.path.dirname(__file__), "../../..", "data", "user_levels.json")
-LEVEL_COSTS_PATH = os.path.join(os.path.dirname(__file__), "../../..", "data", "levelCosts.json")
+LEVEL_LOCK_PATH = f"{LEVEL_DATA_PATH}.lock"
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads in this process are coordinated
+    fcntl = None
+
+# Serializes read-modify-write cycles on user_levels.json within this process.
+_levels_lock = threading.RLock()
+
+# XP factors of each user's latest message, keyed by user ID.
+_xp_factors: Dict[int, XpFactors] = {}
 
 
 # ============================================================================
@@ -152,10 +166,33 @@ def calculate_xp_from_context(
     # (base_xp + static_additions) * multiplier_product * level_multiplier * true_multiplier
     total_xp = int(xp_after_static * multiplier_product * level_multiplier * true_multiplier)
     breakdown["total_xp"] = total_xp
+
+    # Remembered so level ETAs can be estimated without a member object.
+    _xp_factors[user_id] = XpFactors(
+        static_total=static_total,
+        multiplier_product=multiplier_product,
+        true_multiplier=true_multiplier,
+    )
     
     return total_xp, breakdown
 
 
+def get_cached_xp_factors(user_id: int) -> XpFactors:
+    """
+    Returns the XP factors of the user's latest message.
+
+    Users who have not sent a message since startup get the default factors
+    (no bonus, no multiplier).
+
+    Args:
+        user_id: The Discord ID of the user.
+
+    Returns:
+        The cached `XpFactors`.
+    """
+    return _xp_factors.get(user_id, XpFactors())
+
+
 def get_xp_breakdown(
     base_xp: int,
     member: nextcord.Member,
@@ -213,6 +250,29 @@ def load_level_costs() -> Dict[str, int]:
         print(f"Error loading level costs from {LEVEL_COSTS_PATH}")
         return {}
 
+@contextmanager
+def user_levels_lock() -> Iterator[None]:
+    """
+    Holds exclusive access to user_levels.json for a read-modify-write cycle.
+
+    Threads of this process are serialized with a lock, and other processes
+    (such as `scripts/migrate_levels.py` run next to the bot) with an advisory
+    lock on a sibling `.lock` file where the platform supports it, so neither
+    side overwrites XP granted by the other. Acquiring it blocks while a
+    migration holds the file, so the bot takes it from a worker thread.
+    """
+    with _levels_lock:
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(LEVEL_LOCK_PATH), exist_ok=True)
+        with open(LEVEL_LOCK_PATH, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 def load_user_levels() -> Dict[str, Dict]:
     """
     Loads all user level and XP data from the user_levels.json file.
@@ -228,35 +288,42 @@ def load_user_levels() -> Dict[str, Dict]:
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
-def save_user_levels(data: Dict[str, Dict]) -> None:
+def save_user_levels(data: Dict[str, Dict], path: str = LEVEL_DATA_PATH) -> None:
     """
     Saves the provided user level data to the user_levels.json file.
 
     This function will create the data directory if it doesn't exist.
-    The data is saved in a human-readable format with an indent of 2.
+    The data is saved in a human-readable format with an indent of 2,
+    through a temporary file so a crash never leaves it half-written.
 
     Args:
         data: A dictionary containing all user level data to be saved.
+        path: The file to write, defaults to user_levels.json.
     """
-    os.makedirs(os.path.dirname(LEVEL_DATA_PATH), exist_ok=True)
-    with open(LEVEL_DATA_PATH, 'w', encoding='utf-8') as f:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
 
-def get_level_for_xp(xp: int, level_costs: Dict[str, int]) -> int:
+def get_level_for_xp(xp: int, level_costs: Optional[Dict[str, int]] = None) -> int:
     """
     Determines a user's level based on their total accumulated XP.
 
-    It iterates through the sorted level costs and finds the highest level
-    the user has achieved.
+    Without `level_costs` this is a binary search over the startup-loaded
+    level curve; with a custom mapping it scans the sorted level costs.
 
     Args:
         xp: The total XP of the user.
-        level_costs: A dictionary mapping level numbers to cumulative XP costs.
+        level_costs: Optional dictionary mapping level numbers to cumulative XP costs.
 
     Returns:
         The calculated level for the given XP. Returns 0 if the user's XP
         doesn't meet the requirement for level 1.
     """
+    if level_costs is None:
+        return level_curve.level_for_xp(xp)
+
     level = 0
     
     for lv in sorted([int(k) for k in level_costs.keys()]):
@@ -267,22 +334,48 @@ def get_level_for_xp(xp: int, level_costs: Dict[str, int]) -> int:
     
     return level
 
-def get_xp_for_level(level: int, level_costs: Dict[str, int]) -> int:
+def get_xp_for_level(level: int, level_costs: Optional[Dict[str, int]] = None) -> int:
     """
     Retrieves the total cumulative XP required to reach a specific level.
 
     Args:
         level: The level to look up.
-        level_costs: A dictionary mapping level numbers to cumulative XP costs.
+        level_costs: Optional dictionary mapping level numbers to cumulative
+            XP costs, defaults to the startup-loaded level curve.
 
     Returns:
         The cumulative XP required for the given level. Returns 0 if the
-        level is not found in the `level_costs` dictionary.
+        level is not found.
     """
+    if level_costs is None:
+        return level_curve.xp_for_level(level) or 0
+
     if str(level) in level_costs:
         return level_costs[str(level)]
     return 0
 
+def get_messages_to_level(user_id: int, xp: int, target_level: int) -> Optional[int]:
+    """
+    Estimates how many messages a user needs to reach a level.
+
+    Uses the user's cached XP factors and the level curve, so no file is read.
+
+    Args:
+        user_id: The Discord ID of the user.
+        xp: The user's total XP.
+        target_level: The level to reach.
+
+    Returns:
+        The number of messages, or `None` if the level is not on the curve.
+    """
+    return level_curve.messages_to_level(
+        xp,
+        target_level,
+        get_cached_xp_factors(user_id),
+        config.base_XP,
+        config.level_multiplier_rate,
+    )
+
 def add_xp(
     user_id: int,
     username: str,
@@ -293,7 +386,9 @@ def add_xp(
 
     This function handles loading user data, adding XP, checking for level ups,
     and saving the updated data. If the user does not exist in the data file,
-    they will be created.
+    they will be created. Holds `user_levels_lock()`, which blocks while a
+    migration runs: call it from a worker thread (`asyncio.to_thread`) in
+    event handlers.
 
     Args:
         user_id: The Discord ID of the user.
@@ -306,31 +401,31 @@ def add_xp(
         - The user's new level.
         - The user's old level.
     """
-    user_levels = load_user_levels()
-    level_costs = load_level_costs()
-    
-    user_key = str(user_id)
-    
-    if user_key not in user_levels:
-        user_levels[user_key] = {
-            "username": username,
-            "xp": 0,
-            "level": 1,
-        }
-    
-    user_data = user_levels[user_key]
-    old_level = user_data["level"]
-    
-    # Add XP
-    user_data["xp"] += xp_amount
-    
-    # Recalculate level based on total XP
-    new_level = get_level_for_xp(user_data["xp"], level_costs)
-    user_data["level"] = new_level
-    user_data["username"] = username  # Update username in case it changed
-    
-    save_user_levels(user_levels)
-    
+    with user_levels_lock():
+        user_levels = load_user_levels()
+
+        user_key = str(user_id)
+
+        if user_key not in user_levels:
+            user_levels[user_key] = {
+                "username": username,
+                "xp": 0,
+                "level": 1,
+            }
+
+        user_data = user_levels[user_key]
+        old_level = user_data["level"]
+
+        # Add XP
+        user_data["xp"] += xp_amount
+
+        # Recalculate level based on total XP
+        new_level = level_curve.level_for_xp(user_data["xp"])
+        user_data["level"] = new_level
+        user_data["username"] = username  # Update username in case it changed
+
+        save_user_levels(user_levels)
+
     leveled_up = new_level > old_level
     return leveled_up, new_level, old_level
 
@@ -359,12 +454,10 @@ def get_user_level_info(user_id: int) -> Optional[Dict]:
     
     if user_key in user_levels:
         user_data = user_levels[user_key]
-        level_costs = load_level_costs()
-        
         
-        xp_for_current_level = get_xp_for_level(user_data["level"], level_costs)
-        xp_for_next_level = get_xp_for_level(user_data["level"] + 1, level_costs)
-        xp_needed_for_next = xp_for_next_level - xp_for_current_level
+        xp_for_current_level = get_xp_for_level(user_data["level"])
+        xp_for_next_level = get_xp_for_level(user_data["level"] + 1)
+        xp_needed_for_next = max(0, xp_for_next_level - xp_for_current_level)
         xp_progress = user_data["xp"] - xp_for_current_level
         
         return {
@@ -0,0 +1,213 @@
+"""
+Shared memoization layer for the pure game calculators.
+
+`memoize` keeps a bounded LRU cache per function and counts hits, misses
+and invalidations. A function can declare the data files its results depend
+on: their modification stamps are checked at most once every
+`config.memo_data_check_interval` seconds, and when one changes the reload
+hooks registered for it with `on_data_change` run (so the lookup tables are
+rebuilt) and every cache depending on it is dropped.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from src.utils.config import config
+from src.utils.types.memo import MemoStats
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Marks the start of keyword arguments in a cache key.
+_KWARGS = object()
+
+_lock = threading.RLock()
+_registry: Dict[str, "_Memo"] = {}
+
+# Data file watching: last seen (mtime, size) stamp, a generation counter
+# bumped on every change, and the hooks to run when a file changes.
+_stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+_generations: Dict[str, int] = {}
+_reload_hooks: Dict[str, List[Callable[[], None]]] = {}
+_last_check = 0.0
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Return the (mtime, size) of `path`, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _watch(paths: Iterable[str]) -> Tuple[str, ...]:
+    """Start watching `paths` and return their normalized form."""
+    normalized = tuple(os.path.abspath(path) for path in paths)
+    with _lock:
+        for path in normalized:
+            if path not in _stamps:
+                _stamps[path] = _stamp(path)
+                _generations[path] = 0
+    return normalized
+
+
+def check_data_files(force: bool = False) -> Set[str]:
+    """
+    Detect changed data files, run their reload hooks and bump their generation.
+
+    Checks are throttled to one per `config.memo_data_check_interval` seconds
+    unless `force` is set.
+
+    Args:
+        force (bool): Check now regardless of the interval.
+
+    Returns:
+        Set[str]: The files that changed since the previous check.
+    """
+    global _last_check
+    now = time.monotonic()
+    if not force and now - _last_check < config.memo_data_check_interval:
+        return set()
+
+    changed: Set[str] = set()
+    with _lock:
+        _last_check = now
+        for path, previous in _stamps.items():
+            current = _stamp(path)
+            if current != previous:
+                _stamps[path] = current
+                changed.add(path)
+
+        hooks: List[Callable[[], None]] = []
+        for path in changed:
+            for hook in _reload_hooks.get(path, []):
+                if hook not in hooks:
+                    hooks.append(hook)
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"Error reloading data after a file change: {e}")
+
+        # Bumped after the hooks so a cache refills only from reloaded data.
+        for path in changed:
+            _generations[path] += 1
+    return changed
+
+
+def on_data_change(paths: Iterable[str], hook: Callable[[], None]) -> None:
+    """
+    Run `hook` whenever one of `paths` changes, before dependent caches are dropped.
+
+    Args:
+        paths (Iterable[str]): Data files to watch.
+        hook (Callable[[], None]): Reloads whatever is built from those files.
+    """
+    with _lock:
+        for path in _watch(paths):
+            _reload_hooks.setdefault(path, []).append(hook)
+
+
+class _Memo:
+    """Bounded LRU cache and statistics of one memoized function."""
+
+    def __init__(self, func: Callable[..., Any], maxsize: int, data_files: Tuple[str, ...]):
+        self.func = func
+        self.maxsize = maxsize
+        self.data_files = data_files
+        self.cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.generations = self._current_generations()
+
+    def _current_generations(self) -> Tuple[int, ...]:
+        return tuple(_generations[path] for path in self.data_files)
+
+    def stats(self) -> MemoStats:
+        with _lock:
+            return MemoStats(
+                name=f"{self.func.__module__}.{self.func.__qualname__}",
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+                size=len(self.cache),
+                maxsize=self.maxsize,
+                data_files=self.data_files,
+            )
+
+    def clear(self) -> None:
+        with _lock:
+            self.cache.clear()
+
+    def call(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        if self.data_files:
+            check_data_files()
+
+        key: Hashable = args
+        if kwargs:
+            key = (*args, _KWARGS, *sorted(kwargs.items()))
+
+        with _lock:
+            generations = self._current_generations()
+            if generations != self.generations:
+                self.cache.clear()
+                self.generations = generations
+                self.invalidations += 1
+            elif key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            self.misses += 1
+
+        # Computed outside the lock; two threads may compute the same key once each.
+        result = self.func(*args, **kwargs)
+
+        with _lock:
+            if self.generations == self._current_generations():
+                self.cache[key] = result
+                if len(self.cache) > self.maxsize:
+                    self.cache.popitem(last=False)
+        return result
+
+
+def memoize(maxsize: int = 1024, data_files: Iterable[str] = ()) -> Callable[[F], F]:
+    """
+    Memoize a pure function with a bounded LRU cache.
+
+    The wrapped function gains `cache_info()` (a `MemoStats`) and
+    `cache_clear()`. Arguments must be hashable.
+
+    Args:
+        maxsize (int): Results kept before the least recently used one is evicted.
+        data_files (Iterable[str]): Data files the results depend on; the cache
+            is dropped when any of them changes.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(func: F) -> F:
+        memo = _Memo(func, maxsize, _watch(data_files))
+        with _lock:
+            _registry[f"{func.__module__}.{func.__qualname__}"] = memo
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return memo.call(args, kwargs)
+
+        wrapper.cache_info = memo.stats  # type: ignore[attr-defined]
+        wrapper.cache_clear = memo.clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def memo_stats() -> Dict[str, MemoStats]:
+    """Return the statistics of every memoized function, keyed by qualified name."""
+    with _lock:
+        memos = list(_registry.items())
+    return {name: memo.stats() for name, memo in memos}
@@ -0,0 +1,165 @@
+"""
+Shared cache of Discord users and members.
+
+With the default intents the library's member cache is sparse, so commands
+used to fall back to `fetch_user` / `fetch_member` REST calls on every
+invocation. `profile_cache` keeps the users and members the bot sees in
+gateway events (messages, reactions, interactions, member updates) for
+`config.profile_cache_ttl` seconds, and fetches only on a miss. Lookups of
+users or members that do not exist are cached too, for
+`config.profile_cache_negative_ttl` seconds, so a departed member does not
+cost a failing request every time. At most `config.profile_cache_max_entries`
+profiles are kept, least recently used first out.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple, Union, cast
+
+import nextcord
+
+from src.utils.config import config
+from .discord_rest import with_backoff
+
+Profile = Union[nextcord.User, nextcord.Member]
+
+# Stands for "looked up, does not exist" in the cache.
+_MISSING = object()
+
+
+class ProfileCache:
+    """
+    TTL cache of users and members with negative caching.
+
+    Attributes:
+        hits (int): Lookups answered from the cache or the library's cache.
+        fetches (int): Lookups that needed a REST request.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self.hits = 0
+        self.fetches = 0
+
+    # --- Storage ---
+
+    def _get(self, key: Hashable) -> Optional[object]:
+        """Return the live entry for `key` (possibly `_MISSING`), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: Hashable, value: object, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > config.profile_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    # --- Filling ---
+
+    def put_user(self, user: Optional[Profile]) -> None:
+        """Cache a user seen in a gateway event or a REST response."""
+        if user is None:
+            return
+        if isinstance(user, nextcord.Member):
+            self.put_member(user)
+        else:
+            self._put(("user", user.id), user, config.profile_cache_ttl)
+
+    def put_member(self, member: Optional[nextcord.Member]) -> None:
+        """Cache a member, and the user behind it."""
+        if member is None:
+            return
+        self._put(("member", member.guild.id, member.id), member, config.profile_cache_ttl)
+        self._put(("user", member.id), member, config.profile_cache_ttl)
+
+    def forget_member(self, guild_id: int, user_id: int) -> None:
+        """Record that a user left a guild."""
+        self._put(("member", guild_id, user_id), _MISSING, config.profile_cache_negative_ttl)
+
+    def clear(self) -> None:
+        """Drop every cached profile."""
+        self._entries.clear()
+
+    # --- Lookups ---
+
+    async def get_user(self, client: nextcord.Client, user_id: int) -> Optional[Profile]:
+        """
+        Return a user, fetching it only if neither cache has it.
+
+        Args:
+            client (nextcord.Client): The bot, for its cache and REST calls.
+            user_id (int): The Discord ID of the user.
+
+        Returns:
+            Profile | None: The user (a member if one was cached), or None if
+                there is no such user or the fetch failed.
+        """
+        key = ("user", user_id)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return None if cached is _MISSING else cast(Profile, cached)
+
+        user = client.get_user(user_id)
+        if user is not None:
+            self.hits += 1
+            self.put_user(user)
+            return user
+
+        self.fetches += 1
+        try:
+            user = await with_backoff(lambda: client.fetch_user(user_id))
+        except nextcord.NotFound:
+            self._put(key, _MISSING, config.profile_cache_negative_ttl)
+            return None
+        except Exception as e:
+            print(f"Error fetching user {user_id}: {e}")
+            return None
+        self.put_user(user)
+        return user
+
+    async def get_member(self, guild: nextcord.Guild, user_id: int) -> Optional[nextcord.Member]:
+        """
+        Return a guild member, fetching it only if neither cache has it.
+
+        Args:
+            guild (nextcord.Guild): The guild.
+            user_id (int): The Discord ID of the user.
+
+        Returns:
+            nextcord.Member | None: The member, or None if the user is not in
+                the guild or the fetch failed.
+        """
+        key = ("member", guild.id, user_id)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return None if cached is _MISSING else cast(nextcord.Member, cached)
+
+        member = guild.get_member(user_id)
+        if member is not None:
+            self.hits += 1
+            self.put_member(member)
+            return member
+
+        self.fetches += 1
+        try:
+            member = await with_backoff(lambda: guild.fetch_member(user_id))
+        except nextcord.NotFound:
+            self.forget_member(guild.id, user_id)
+            return None
+        except Exception as e:
+            print(f"Error fetching member {user_id}: {e}")
+            return None
+        self.put_member(member)
+        return member
+
+
+profile_cache = ProfileCache()
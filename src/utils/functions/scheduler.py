@@ -0,0 +1,217 @@
+"""
+Timer scheduler shared by every timed feature (giveaway endings, reminders,
+temporary roles, ...).
+
+Due times are held in a priority queue and persisted to
+`data/scheduled_jobs.json`. A single task sleeps until the earliest job is
+due, or until an earlier job is scheduled, so nothing runs between events.
+A job stays persisted until its handler has finished: after a restart,
+jobs that were due while the bot was down fire at once, and a job whose
+handler was interrupted fires again, so handlers must be idempotent.
+"""
+
+import asyncio
+import heapq
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from src.utils.types.scheduler import ScheduledJob
+from .time_utils import utc_now
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../..", "data")
+SCHEDULE_PATH = os.path.join(DATA_DIR, "scheduled_jobs.json")
+
+JobHandler = Callable[[ScheduledJob], Awaitable[None]]
+
+
+class TimerScheduler:
+    """
+    Persistent priority queue of due-times driven by one asyncio task.
+
+    Attributes:
+        path (str): JSON file persisting the pending jobs.
+    """
+
+    def __init__(self, path: str):
+        """
+        Load the persisted jobs.
+
+        Args:
+            path (str): JSON file persisting the pending jobs.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._jobs: Dict[str, ScheduledJob] = {}
+        # Heap of (due, id); an entry is stale once its job was replaced or cancelled.
+        self._heap: List[Tuple[datetime, str]] = []
+        self._running: Set[str] = set()
+        self._handlers: Dict[str, JobHandler] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        # Running handler tasks, referenced so they are not garbage collected.
+        self._firing: Set[asyncio.Task] = set()
+        self._load()
+
+    # --- Persistence ---
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        for record in records:
+            job = ScheduledJob(**record)
+            self._jobs[job.id] = job
+            heapq.heappush(self._heap, (job.due, job.id))
+
+    def _persist(self) -> None:
+        """Write the pending jobs through a temporary file."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([job.model_dump(mode="json") for job in self._jobs.values()], f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    # --- Public API ---
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """
+        Set the coroutine that runs jobs of `kind`.
+
+        Jobs of a kind without a handler wait until one is registered.
+
+        Args:
+            kind (str): The job kind.
+            handler (JobHandler): Coroutine function receiving the due job.
+        """
+        self._handlers[kind] = handler
+        self._wake()
+
+    def schedule(self, job_id: str, kind: str, due: datetime, payload: Optional[Dict[str, Any]] = None) -> ScheduledJob:
+        """
+        Schedule a job, replacing any pending job with the same id.
+
+        Args:
+            job_id (str): Unique job id.
+            kind (str): Name of the handler that runs the job.
+            due (datetime): When the job is due, in UTC.
+            payload (Dict[str, Any] | None): Data passed to the handler.
+
+        Returns:
+            ScheduledJob: The scheduled job.
+        """
+        job = ScheduledJob(id=job_id, kind=kind, due=due, payload=payload or {})
+        with self._lock:
+            self._jobs[job_id] = job
+            heapq.heappush(self._heap, (due, job_id))
+            self._persist()
+        self._wake()
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a pending job.
+
+        Returns:
+            bool: True if a job was cancelled.
+        """
+        with self._lock:
+            if self._jobs.pop(job_id, None) is None:
+                return False
+            self._persist()
+        return True
+
+    def get(self, job_id: str) -> Optional[ScheduledJob]:
+        """Return the pending job with this id, or None."""
+        return self._jobs.get(job_id)
+
+    def start(self) -> None:
+        """Start the scheduler task; needs a running event loop. Idempotent."""
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler task. Pending jobs stay persisted."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # --- Runner ---
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_due(self) -> Optional[ScheduledJob]:
+        """Return the earliest job that can run, dropping stale heap entries."""
+        with self._lock:
+            waiting: List[Tuple[datetime, str]] = []
+            job = None
+            while self._heap:
+                due, job_id = self._heap[0]
+                current = self._jobs.get(job_id)
+                if current is None or current.due != due or job_id in self._running:
+                    heapq.heappop(self._heap)
+                    continue
+                if current.kind not in self._handlers:
+                    # No handler yet: set aside and look further.
+                    waiting.append(heapq.heappop(self._heap))
+                    continue
+                job = current
+                break
+            for entry in waiting:
+                heapq.heappush(self._heap, entry)
+            return job
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._wakeup.clear()
+            job = self._next_due()
+            if job is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = (job.due - utc_now()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                # Woken early or on time: look at the queue again.
+                continue
+
+            with self._lock:
+                self._running.add(job.id)
+            task = asyncio.create_task(self._fire(job))
+            self._firing.add(task)
+            task.add_done_callback(self._firing.discard)
+
+    async def _fire(self, job: ScheduledJob) -> None:
+        try:
+            await self._handlers[job.kind](job)
+        except Exception as e:
+            print(f"Error running scheduled job {job.id}: {e}")
+        finally:
+            with self._lock:
+                self._running.discard(job.id)
+                # Drop the job unless it was rescheduled while running.
+                if self._jobs.get(job.id) is job:
+                    del self._jobs[job.id]
+                    self._persist()
+                elif job.id in self._jobs:
+                    heapq.heappush(self._heap, (self._jobs[job.id].due, job.id))
+            self._wake()
+
+
+timer_scheduler = TimerScheduler(SCHEDULE_PATH)
@@ -1,22 +1,102 @@
-from src.utils.se_hp_values import se_hp
+from decimal import Decimal, localcontext
+from itertools import accumulate
+from typing import Iterable, List, Tuple
 
+from src.utils.se_hp_table import EXPONENTS, MANTISSAS
+from .memo import memoize
 
-def get_se_hp(hp: int, percentage: int = 100) -> str | None:
+# Exact HP of every stage, index 0 is stage 1.
+_STAGE_HP: List[int] = [m * 10 ** e for m, e in zip(MANTISSAS, EXPONENTS)]
+
+# _PREFIX_HP[s] is the total HP of stages 1..s, so any stage range sums in O(1).
+_PREFIX_HP: List[int] = [0, *accumulate(_STAGE_HP)]
+
+MAX_STAGE = len(_STAGE_HP)
+
+
+def stage_hp(stage: int) -> Decimal | None:
+    """
+    Return the exact full HP of a Star Expedition boss stage, or None if unknown.
+    """
+    if not 1 <= stage <= MAX_STAGE:
+        return None
+    return Decimal(MANTISSAS[stage - 1]).scaleb(EXPONENTS[stage - 1])
+
+
+@memoize(maxsize=4096)
+def get_se_hp(hp: int, percentage: int = 100) -> Decimal | None:
     """
 Compute the HP value of a Star Expedition (SE) boss in Idle Heroes (IH).
 
 Args:
     hp (int, required): Boss stage number (1–200).
-    percentage (int, optional): Boss’s remaining HP %. 
+    percentage (int, optional): Boss’s remaining HP %.
         If omitted, assumes full HP.
 
 Returns:
-    float or None: The calculated boss HP, or None if invalid input.
+    Decimal or None: The exact boss HP, or None if invalid input.
 """
 
-    bosshp = se_hp.get(hp)
+    bosshp = stage_hp(hp)
     if bosshp is None:
         return None
-    
-    result = (bosshp * percentage) / 100
-    return result
\ No newline at end of file
+
+    return bosshp * percentage / 100
+
+
+def get_se_hp_table(stage: int, percentages: Iterable[int] = range(1, 101)) -> List[Tuple[int, Decimal]]:
+    """
+    Compute the boss HP at many remaining percentages in one call.
+
+    Args:
+        stage (int): Boss stage number (1-200).
+        percentages (Iterable[int]): Remaining HP percentages, 1-100 by default.
+
+    Returns:
+        List[Tuple[int, Decimal]]: (percentage, HP) pairs in input order, empty if the stage is unknown.
+    """
+    bosshp = stage_hp(stage)
+    if bosshp is None:
+        return []
+    one_percent = bosshp / 100
+    return [(percentage, one_percent * percentage) for percentage in percentages]
+
+
+@memoize(maxsize=4096)
+def get_se_damage(from_stage: int, from_percentage: int, to_stage: int, to_percentage: int = 0) -> Decimal | None:
+    """
+    Compute the damage needed to go from `from_percentage` of one boss to
+    `to_percentage` of another, clearing every stage in between.
+
+    Stage totals come from prefix sums, so the cost does not depend on how
+    many stages are crossed. Going back to an earlier stage, or up in HP on
+    the same stage, is not a valid range.
+
+    Args:
+        from_stage (int): Current boss stage number (1-200).
+        from_percentage (int): Current boss's remaining HP %.
+        to_stage (int): Target boss stage number (1-200).
+        to_percentage (int): Target boss's remaining HP %, 0 to defeat it.
+
+    Returns:
+        Decimal or None: The exact damage, or None if invalid input or range.
+    """
+    if not (1 <= from_stage <= MAX_STAGE and 1 <= to_stage <= MAX_STAGE):
+        return None
+    if not (0 <= to_percentage <= 100 and 0 <= from_percentage <= 100):
+        return None
+
+    from_hp, to_hp = _STAGE_HP[from_stage - 1], _STAGE_HP[to_stage - 1]
+    if to_stage < from_stage:
+        return None
+    if from_stage == to_stage:
+        if to_percentage > from_percentage:
+            return None
+        return Decimal(from_hp * (from_percentage - to_percentage)) / 100
+
+    between = _PREFIX_HP[to_stage - 1] - _PREFIX_HP[from_stage]
+    partial = from_hp * from_percentage + to_hp * (100 - to_percentage)
+    # Sums across stages can exceed the default 28 significant digits.
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return +(Decimal(between * 100 + partial) / 100)
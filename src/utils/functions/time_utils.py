@@ -2,6 +2,16 @@ from datetime import datetime, timezone
 from typing import Optional
 
 
+def utc_now() -> datetime:
+    """Return the current UTC time as a naive datetime.
+
+    Giveaways, scheduler jobs and draw records store naive UTC datetimes;
+    this replaces the deprecated `datetime.utcnow()` without mixing naive
+    and aware values.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def format_relative_date(dt: Optional[datetime], now: Optional[datetime] = None) -> Optional[str]:
     """Format a datetime as a relative years/months string plus a YYYY-MM-DD date.
 
@@ -1,19 +1,26 @@
 """Helper to fetch XP required for a given level."""
 from typing import Optional
 
-from .leveling import load_level_costs, get_xp_for_level
+from .level_curve import level_curve
 
 
 def get_xp_required_for_level(level: int) -> Optional[int]:
     """Return cumulative XP required to reach a given level.
     
-    Returns None if level is invalid or data cannot be loaded.
+    Looked up in the startup-loaded level curve. Returns None if the level
+    is not on the curve.
     """
-    try:
-        level_costs = load_level_costs()
-        if not level_costs:
-            return None
-        
-        return get_xp_for_level(level, level_costs)
-    except Exception:
-        return None
+    return level_curve.xp_for_level(level)
+
+
+def get_xp_between_levels(from_level: int, to_level: int) -> Optional[int]:
+    """Return the XP needed to go from `from_level` to `to_level`.
+
+    Returns None if either level is not on the curve or `to_level` is lower.
+    """
+    return level_curve.xp_between(from_level, to_level)
+
+
+def get_level_reached(xp: int) -> int:
+    """Return the highest level reached with `xp` total XP."""
+    return level_curve.level_for_xp(xp)
@@ -0,0 +1,64 @@
+"""
+Star Expedition boss HP, generated by `scripts/jsontopy.py` from `data/seHP.json`.
+
+Do not edit by hand. The HP of stage `s` is exactly
+`MANTISSAS[s - 1] * 10 ** EXPONENTS[s - 1]`.
+"""
+
+from array import array
+
+MANTISSAS = array("q", [
+    863580423241232, 697698332560217, 563679942431175, 455404667993512, 367927605754046, 297253701136488, 240155295382776, 194024719220927,
+    156755201290721, 126644652446141, 102317931788801, 826640443424173, 667854022025203, 539568319313854, 435924560766052, 35218936300917,
+    284538561440158, 229882561627299, 18572523833977, 150049938160548, 121227379451762, 979412434879993, 791280585240445, 639286313181413,
+    516488080011335, 41727772250631, 337124329560968, 272367316662139, 220049247950578, 177780770898001, 143631495201411, 116041832362337,
+    937517696876029, 75743325838847, 611940598907796, 494395106690146, 399428509818466, 322703708626694, 260716701491217, 210636557992248,
+    170176131061233, 137487603571815, 111078099014479, 897415022164213, 725033763767431, 585764607923598, 473247168673856, 382342803966458,
+    308899935216895, 249564445798679, 201626499413378, 162896782574901, 131606519234613, 106326691241349, 859027754558204, 694020169805061,
+    560708304871901, 453003841719223, 365987945656089, 295686623444987, 23888923206901, 193001849504155, 155928810978236, 125977000508293,
+    101778526736034, 82228251686908, 664333194075564, 53672379467714, 433626430745325, 350125723865274, 282871319396506, 228535574175378,
+    184636988597116, 149075611311328, 120445330698771, 972902511040737, 785866326654562, 634787017569612, 512752034293545, 4141777342561,
+    3345553733157, 270238587976909, 218286420318261, 176321826028161, 14242473850905, 115044215478883, 929274767803493, 750625817994282,
+    60632133625367, 489758764114141, 3956048093562, 319551543683874, 258119176810435, 208496912460517, 168414307523999, 13603740510816,
+    109884818342729, 8875995019632, 7169624410035, 5791295969328, 472182974736399, 479973993820099, 464518420736709, 456978279149994,
+    44956053041706, 4422631878364, 435084296936399, 4280219350064, 421074210536, 4142392626992, 407515260894789, 40090040422524,
+    394392921007279, 38799106839943, 38169313172588, 37549742422642, 369402286460186, 36340608605963, 35750721699827, 35170409935885,
+    345995178907009, 340378926546179, 334853838233232, 329418434088384, 324071258343048, 318810878858919, 313635886727849, 30854489594495,
+    30353654298552, 29860948645912, 293762452345498, 288994044904842, 284303039151634, 279688178687106, 275148227506598, 270681969668504,
+    266288208968615, 261965768619732, 257713490936489, 25353024194447, 24941489615779, 24536635136033, 241383523227139, 23746534503416,
+    233610767372449, 233610572312007, 229818504184473, 226088075833826, 222418175948107, 218807869683405, 215256078067315, 211762014201908,
+    204943331743399, 222207979486339, 215585202078449, 209159812634339, 1919571354156, 18884125471289, 185775951513009, 184898694716884,
+    179387898502418, 110263986954672, 677757358252139, 4165957075847, 25606718764938, 15739577580018, 9674582076336, 5946635980319,
+    36551945296572, 22467235414944, 13809844129903, 848844067239099, 5217555272224, 32070534588659, 1971266493862, 12116703508916,
+    7447724819547, 4577862695618, 28138562269579, 17295815520066, 10631148515619, 65346047794159, 4016598917824, 2468866505512,
+    1517528124362, 932772834458, 573343680897, 352414826288, 216617386613, 133147327185, 81841125574, 50304951476,
+    30920739744, 19005925232, 111327095937, 7180708512, 4413736879, 271297369, 16675725, 1025,
+])
+
+EXPONENTS = array("b", [
+    13, 13, 13, 13, 13, 13, 13, 13,
+    13, 13, 13, 12, 12, 12, 12, 13,
+    12, 12, 13, 12, 12, 11, 11, 11,
+    11, 12, 11, 11, 11, 11, 11, 11,
+    10, 11, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 8, 8,
+    8, 8, 8, 8, 9, 8, 8, 8,
+    8, 8, 7, 8, 7, 7, 7, 7,
+    7, 7, 7, 6, 6, 6, 6, 8,
+    8, 6, 6, 6, 7, 6, 5, 5,
+    6, 5, 7, 5, 5, 5, 5, 6,
+    5, 6, 6, 6, 4, 4, 4, 4,
+    5, 6, 4, 6, 7, 6, 4, 5,
+    4, 5, 5, 5, 4, 5, 5, 5,
+    4, 4, 4, 4, 4, 4, 4, 5,
+    5, 5, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 5, 5, 5, 4, 5,
+    4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 6, 5, 4, 4,
+    4, 4, 3, 5, 4, 4, 4, 4,
+    3, 3, 3, 1, 3, 2, 3, 2,
+    2, 2, 1, 1, 1, 0, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 0, 1, 1, 2, 3, 7,
+])
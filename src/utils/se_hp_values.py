@@ -1,202 +0,0 @@
-se_hp: dict = {
-  1: 8.6358042324123e+27,
-  2: 6.9769833256022e+27,
-  3: 5.6367994243118e+27,
-  4: 4.5540466799351e+27,
-  5: 3.6792760575405e+27,
-  6: 2.9725370113649e+27,
-  7: 2.4015529538278e+27,
-  8: 1.9402471922093e+27,
-  9: 1.5675520129072e+27,
-  10: 1.2664465244614e+27,
-  11: 1.0231793178880e+27,
-  12: 8.2664044342417e+26,
-  13: 6.6785402202520e+26,
-  14: 5.3956831931385e+26,
-  15: 4.3592456076605e+26,
-  16: 3.5218936300917e+26,
-  17: 2.8453856144016e+26,
-  18: 2.2988256162730e+26,
-  19: 1.8572523833977e+26,
-  20: 1.5004993816055e+26,
-  21: 1.2122737945176e+26,
-  22: 9.7941243487999e+25,
-  23: 7.9128058524044e+25,
-  24: 6.3928631318141e+25,
-  25: 5.1648808001134e+25,
-  26: 4.1727772250631e+25,
-  27: 3.3712432956097e+25,
-  28: 2.7236731666214e+25,
-  29: 2.2004924795058e+25,
-  30: 1.7778077089800e+25,
-  31: 1.4363149520141e+25,
-  32: 1.1604183236234e+25,
-  33: 9.3751769687603e+24,
-  34: 7.5743325838847e+24,
-  35: 6.1194059890780e+24,
-  36: 4.9439510669015e+24,
-  37: 3.9942850981847e+24,
-  38: 3.2270370862669e+24,
-  39: 2.6071670149122e+24,
-  40: 2.1063655799225e+24,
-  41: 1.7017613106123e+24,
-  42: 1.3748760357182e+24,
-  43: 1.1107809901448e+24,
-  44: 8.9741502216421e+23,
-  45: 7.2503376376743e+23,
-  46: 5.8576460792360e+23,
-  47: 4.7324716867386e+23,
-  48: 3.8234280396646e+23,
-  49: 3.0889993521690e+23,
-  50: 2.4956444579868e+23,
-  51: 2.0162649941338e+23,
-  52: 1.6289678257490e+23,
-  53: 1.3160651923461e+23,
-  54: 1.0632669124135e+23,
-  55: 8.5902775455820e+22,
-  56: 6.9402016980506e+22,
-  57: 5.6070830487190e+22,
-  58: 4.5300384171922e+22,
-  59: 3.6598794565609e+22,
-  60: 2.9568662344499e+22,
-  61: 2.3888923206901e+22,
-  62: 1.9300184950416e+22,
-  63: 1.5592881097824e+22,
-  64: 1.2597700050829e+22,
-  65: 1.0177852673603e+22,
-  66: 8.2228251686908e+21,
-  67: 6.6433319407556e+21,
-  68: 5.3672379467714e+21,
-  69: 4.3362643074532e+21,
-  70: 3.5012572386527e+21,
-  71: 2.8287131939651e+21,
-  72: 2.2853557417538e+21,
-  73: 1.8463698859712e+21,
-  74: 1.4907561131133e+21,
-  75: 1.2044533069877e+21,
-  76: 9.7290251104074e+20,
-  77: 7.8586632665456e+20,
-  78: 6.3478701756961e+20,
-  79: 5.1275203429354e+20,
-  80: 4.1417773425610e+20,
-  81: 3.3455537331570e+20,
-  82: 2.7023858797691e+20,
-  83: 2.1828642031826e+20,
-  84: 1.7632182602816e+20,
-  85: 1.4242473850905e+20,
-  86: 1.1504421547888e+20,
-  87: 9.2927476780349e+19,
-  88: 7.5062581799428e+19,
-  89: 6.0632133625367e+19,
-  90: 4.8975876411414e+19,
-  91: 3.9560480935620e+19,
-  92: 3.1955154368387e+19,
-  93: 2.5811917681044e+19,
-  94: 2.0849691246052e+19,
-  95: 1.6841430752400e+19,
-  96: 1.3603740510816e+19,
-  97: 1.0988481834273e+19,
-  98: 8.8759950196320e+18,
-  99: 7.1696244100350e+18,
-  100: 5.7912959693280e+18,
-  101: 4.7218297473640e+18,
-  102: 4.7997399382010e+18,
-  103: 4.6451842073671e+18,
-  104: 4.5697827914999e+18,
-  105: 4.4956053041706e+18,
-  106: 4.4226318783640e+18,
-  107: 4.3508429693640e+18,
-  108: 4.2802193500640e+18,
-  109: 4.2107421053600e+18,
-  110: 4.1423926269920e+18,
-  111: 4.0751526089479e+18,
-  112: 4.0090040422524e+18,
-  113: 3.9439292100728e+18,
-  114: 3.8799106839943e+18,
-  115: 3.8169313172588e+18,
-  116: 3.7549742422642e+18,
-  117: 3.6940228646019e+18,
-  118: 3.6340608605963e+18,
-  119: 3.5750721699827e+18,
-  120: 3.5170409935885e+18,
-  121: 3.4599517890701e+18,
-  122: 3.4037892654618e+18,
-  123: 3.3485383823323e+18,
-  124: 3.2941843408838e+18,
-  125: 3.2407125834305e+18,
-  126: 3.1881087885892e+18,
-  127: 3.1363588672785e+18,
-  128: 3.0854489594495e+18,
-  129: 3.0353654298552e+18,
-  130: 2.9860948645912e+18,
-  131: 2.9376245234550e+18,
-  132: 2.8899404490484e+18,
-  133: 2.8430303915163e+18,
-  134: 2.7968817868711e+18,
-  135: 2.7514822750660e+18,
-  136: 2.7068196966850e+18,
-  137: 2.6628820896862e+18,
-  138: 2.6196576861973e+18,
-  139: 2.5771349093649e+18,
-  140: 2.5353024194447e+18,
-  141: 2.4941489615779e+18,
-  142: 2.4536635136033e+18,
-  143: 2.4138352322714e+18,
-  144: 2.3746534503416e+18,
-  145: 2.3361076737245e+18,
-  146: 2.3361057231201e+18,
-  147: 2.2981850418447e+18,
-  148: 2.2608807583383e+18,
-  149: 2.2241817594811e+18,
-  150: 2.1880786968340e+18,
-  151: 2.1525607806732e+18,
-  152: 2.1176201420191e+18,
-  153: 2.0494333174340e+18,
-  154: 2.2220797948634e+18,
-  155: 2.1558520207845e+18,
-  156: 2.0915981263434e+18,
-  157: 1.9195713541560e+18,
-  158: 1.8884125471289e+18,
-  159: 1.8577595151301e+18,
-  160: 1.8489869471688e+18,
-  161: 1.7938789850242e+18,
-  162: 1.1026398695467e+18,
-  163: 6.7775735825214e+17,
-  164: 4.1659570758470e+17,
-  165: 2.5606718764938e+17,
-  166: 1.5739577580018e+17,
-  167: 9.6745820763360e+16,
-  168: 5.9466359803190e+16,
-  169: 3.6551945296572e+16,
-  170: 2.2467235414944e+16,
-  171: 1.3809844129903e+16,
-  172: 8.4884406723910e+15,
-  173: 5.2175552722240e+15,
-  174: 3.2070534588659e+15,
-  175: 1.9712664938620e+15,
-  176: 1.2116703508916e+15,
-  177: 7.4477248195470e+14,
-  178: 4.5778626956180e+14,
-  179: 2.8138562269579e+14,
-  180: 1.7295815520066e+14,
-  181: 1.0631148515619e+14,
-  182: 65346047794159,
-  183: 40165989178240,
-  184: 24688665055120,
-  185: 15175281243620,
-  186: 9327728344580,
-  187: 5733436808970,
-  188: 3524148262880,
-  189: 2166173866130,
-  190: 1331473271850,
-  191: 818411255740,
-  192: 503049514760,
-  193: 309207397440,
-  194: 190059252320,
-  195: 111327095937,
-  196: 71807085120,
-  197: 44137368790,
-  198: 27129736900,
-  199: 16675725000,
-  200: 10250000000,
-}
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Pydantic models for the offline `/ask` evaluation harness.
+"""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class EvalCase(BaseModel):
+    """
+    A recorded `/ask` query, optionally labelled with the expected routing.
+
+    Attributes:
+        query (str): The user's query.
+        expected_agent (str | None): The agent that should produce the answer
+            (e.g. 'Tool Caller' or 'Chat Agent'), if known.
+        expected_tool (str | None): The tool that should be called, if any.
+    """
+    query: str
+    expected_agent: Optional[str] = None
+    expected_tool: Optional[str] = None
+
+
+class EvalRecord(BaseModel):
+    """
+    Measurements for one query run through the pipeline.
+
+    Attributes:
+        query (str): The user's query.
+        final_agent (str): The agent that produced the final output.
+        handoffs (List[str]): Handoffs taken, as 'source -> target'.
+        tools (List[str]): Names of the tools that were invoked.
+        round_trips (int): Number of model responses needed.
+        prompt_ms (float): Time spent building the agents and prompt locally.
+        model_ms (float): Time spent inside the model.
+        tool_ms (float): Time spent inside tools.
+        run_ms (float): Total wall time of the run.
+        routing_ok (bool | None): Whether `final_agent` matched the expectation.
+        tool_ok (bool | None): Whether the tools matched the expectation.
+        output (str): The final output, truncated for the report.
+    """
+    query: str
+    final_agent: str
+    handoffs: List[str] = Field(default_factory=list)
+    tools: List[str] = Field(default_factory=list)
+    round_trips: int = 0
+    prompt_ms: float = 0.0
+    model_ms: float = 0.0
+    tool_ms: float = 0.0
+    run_ms: float = 0.0
+    routing_ok: Optional[bool] = None
+    tool_ok: Optional[bool] = None
+    output: str = ""
+
+
+class CacheStats(BaseModel):
+    """
+    Hit/miss counts of one memoized calculator over an evaluation run.
+
+    Attributes:
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that had to be computed.
+    """
+    hits: int = 0
+    misses: int = 0
+
+
+class EvalReport(BaseModel):
+    """
+    A full evaluation run, comparable against another run.
+
+    Attributes:
+        label (str): A free-form name for the run (e.g. a git revision).
+        records (List[EvalRecord]): Per-query measurements.
+        summary (Dict[str, float]): Aggregated metrics, keyed by metric name.
+        caches (Dict[str, CacheStats]): Cache activity per memoized calculator.
+    """
+    label: str = ""
+    records: List[EvalRecord] = Field(default_factory=list)
+    summary: Dict[str, float] = Field(default_factory=dict)
+    caches: Dict[str, CacheStats] = Field(default_factory=dict)
@@ -4,22 +4,47 @@
 This module defines the Pydantic models for storing user chat history.
 """
 
-from pydantic import BaseModel, Field, RootModel
-from typing import Dict, List
+from pydantic import BaseModel, Field, RootModel, model_validator
+from typing import Any, Dict, List
+
+
+class ChatTurn(BaseModel):
+    """
+    Represents one exchange between a user and the bot.
+
+    Attributes:
+        query (str): What the user asked.
+        answer (str): What the bot replied (empty if no answer was recorded).
+    """
+    query: str
+    answer: str = ""
 
 
 class ChatHistory(BaseModel):
     """
     Represents a user's chat history.
 
+    Recent turns are kept verbatim; older turns are folded into `summary`
+    so the stored history and the prompt built from it stay bounded.
+
     Attributes:
         discord_username (str): The user's Discord username.
         server_nickname (str | None): The user's server-specific nickname.
-        queries (List[str]): A list of the user's recent queries.
+        turns (List[ChatTurn]): The most recent exchanges, oldest first.
+        summary (List[str]): Compact one-line summaries of older exchanges, oldest first.
     """
     discord_username: str
     server_nickname: str | None = None
-    queries: List[str] = Field(default_factory=list, max_length=5)
+    turns: List[ChatTurn] = Field(default_factory=list)
+    summary: List[str] = Field(default_factory=list)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_queries(cls, data: Any) -> Any:
+        """Convert histories saved with the old `queries` list into turns."""
+        if isinstance(data, dict) and "queries" in data and "turns" not in data:
+            data = {**data, "turns": [{"query": q} for q in data["queries"]]}
+        return data
 
 
 class ChatHistories(RootModel[Dict[str, ChatHistory]]):
@@ -58,6 +58,11 @@ class XpTrueMultiplier(BaseModel):
     id: int
     value: float = Field(gt=0.0, description="True multiplier value (e.g., 2.0 for x2)")
 
+class LevelRole(BaseModel):
+    """Represents a role granted from a level on"""
+    level: int = Field(ge=0, description="Level from which the role is granted")
+    id: int
+
 class Channels(BaseModel):
     
     spam: str = Field(default="bot-spam")
@@ -76,6 +81,9 @@ class Roles(BaseModel):
     xp_multipliers: list[XpMultiplier] = Field(default=[], description="Roles that grant normal XP multipliers")
     xp_true_multipliers: list[XpTrueMultiplier] = Field(default=[], description="Roles that grant true XP multipliers (calculated last)")
 
+    level_roles: list[LevelRole] = Field(default=[], description="Roles granted when members reach a level")
+    level_roles_stack: bool = Field(default=False, description="Keep every level role reached instead of only the highest one")
+
 class UserIDs(BaseModel):
     blank: int = Field(default=315225900113199106, description="Blank wanna stays sneaky ☠️")
 
@@ -86,4 +94,44 @@ class Config(BaseModel):
 
     # XP given per message
     base_XP: int = Field(default=35, description="Amount of base given per message")
-    level_multiplier_rate: float = Field(default=0.01, description="XP multiplier per user level (e.g., 0.01 = +1% per level)")
\ No newline at end of file
+    level_multiplier_rate: float = Field(default=0.01, description="XP multiplier per user level (e.g., 0.01 = +1% per level)")
+
+    # /ask streaming
+    ask_stream: bool = Field(default=True, description="Stream /ask answers by progressively editing the followup message")
+    ask_stream_edit_interval: float = Field(default=1.0, gt=0.0, description="Minimum seconds between two edits of a streamed /ask answer")
+
+    # /ask conversation context
+    ask_context_token_budget: int = Field(default=600, gt=0, description="Estimated-token budget for the conversation context in the /ask prompt")
+    ask_summary_token_budget: int = Field(default=120, ge=0, description="Part of the context budget reserved for the rolling summary of older turns")
+
+    # /imagine generation
+    openai_max_connections: int = Field(default=10, gt=0, description="Size of the shared OpenAI HTTP connection pool")
+    imagine_user_cooldown: float = Field(default=60.0, ge=0.0, description="Seconds a user must wait between two /imagine requests")
+    imagine_max_concurrent: int = Field(default=2, gt=0, description="Image generations allowed to run at the same time")
+    imagine_max_pending: int = Field(default=5, ge=0, description="/imagine requests allowed to wait for a free generation slot")
+
+    # /awaken_plan Monte Carlo
+    awaken_plan_workers: int = Field(default=2, gt=0, description="Worker processes for /awaken_plan Monte Carlo estimates (1 runs them in the bot process)")
+    awaken_plan_trials: int = Field(default=20000, gt=0, description="Monte Carlo trials per pool for /awaken_plan return estimates")
+
+    # Giveaways
+    giveaway_entrant_flush_delay: float = Field(default=10.0, ge=0.0, description="Seconds to batch giveaway entries from reactions before writing them")
+    giveaway_max_active: int = Field(default=5, ge=1, description="Maximum number of giveaways running at the same time")
+    giveaway_retention_days: int = Field(default=30, ge=0, description="Days an ended giveaway is kept (and can be rerolled) before it is deleted")
+
+    # Discord REST retries (background work)
+    discord_rest_attempts: int = Field(default=3, gt=0, description="Attempts for a background Discord request that hits a rate limit or a server error")
+    discord_rest_max_backoff: float = Field(default=30.0, ge=0.0, description="Longest wait in seconds before retrying a Discord request")
+
+    # Profile cache
+    profile_cache_ttl: float = Field(default=900.0, ge=0.0, description="Seconds a user or member seen by the bot is served from the profile cache")
+    profile_cache_negative_ttl: float = Field(default=300.0, ge=0.0, description="Seconds a lookup of a missing user or member is remembered")
+    profile_cache_max_entries: int = Field(default=10000, gt=0, description="Users and members kept in the profile cache")
+    profile_cache_chunk_members: bool = Field(default=False, description="Enable the members intent and cache every Exile member at startup")
+
+    # Level role sync
+    level_role_sync_workers: int = Field(default=4, gt=0, description="Members whose level roles are updated at the same time by /sync_level_roles")
+    level_role_sync_checkpoint_every: int = Field(default=50, gt=0, description="Members processed between two saves of the level role sync progress")
+
+    # Calculator memoization
+    memo_data_check_interval: float = Field(default=5.0, ge=0.0, description="Seconds between checks of the game data files behind memoized calculators")
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class Costs(BaseModel):
     """
     Pydantic model representing the costs for a Divine Temple rank.
+    Costs can't be negative: the temple solver minimizes over them.
     
     Attributes:
         name (str): Name of the rank (e.g., 'origin', 'surge')
@@ -12,7 +13,7 @@ class Costs(BaseModel):
         stellars (int): Stellar Shards cost
     """
     name: str = "unknown"
-    gems: int = 0
-    spiritvein: int = 0
-    cots: int = 0
-    stellars: int = 0
\ No newline at end of file
+    gems: int = Field(default=0, ge=0)
+    spiritvein: int = Field(default=0, ge=0)
+    cots: int = Field(default=0, ge=0)
+    stellars: int = Field(default=0, ge=0)
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Immutable lookup tables for the game calculators.
+
+The tables are built once at startup by `src.utils.functions.game_tables`
+and shared by the slash commands and the agent tools.
+"""
+
+from bisect import bisect_right
+from typing import Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+
+class GrimTable(BaseModel):
+    """
+    Cumulative upgrade costs for one Grimoire book, indexed by level.
+
+    Attributes:
+        book (str): Book name ('Enable' or 'Imprint').
+        essence (Tuple[int, ...]): Cumulative essence needed to reach each level.
+            Index 0 is padding and holds 0, so `essence[lvl]` is the cost of `lvl`.
+        imprint (Tuple[int, ...]): Cumulative imprint needed to reach each level,
+            laid out like `essence`. All zeros for the Enable book.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    book: str
+    essence: Tuple[int, ...] = (0,)
+    imprint: Tuple[int, ...] = (0,)
+
+    @property
+    def max_level(self) -> int:
+        """The highest level the table has data for (0 if empty)."""
+        return len(self.essence) - 1
+
+    def range_cost(self, current_lvl: int, goal_lvl: int) -> Tuple[int, int]:
+        """
+        Return the (essence, imprint) cost to go from `current_lvl` to `goal_lvl`.
+
+        Both levels must be within `0..max_level`; level 0 and level 1 both cost 0.
+        """
+        return (
+            self.essence[goal_lvl] - self.essence[current_lvl],
+            self.imprint[goal_lvl] - self.imprint[current_lvl],
+        )
+
+    def reachable_level(self, current_lvl: int, essence: int, imprint: Optional[int] = None) -> int:
+        """
+        Return the highest level reachable from `current_lvl` with the given resources.
+
+        The cumulative columns are non-decreasing, so each budget is a binary
+        search. Without an `imprint` budget only essence limits the result.
+        """
+        level = bisect_right(self.essence, self.essence[current_lvl] + essence) - 1
+        if imprint is not None:
+            level = min(level, bisect_right(self.imprint, self.imprint[current_lvl] + imprint) - 1)
+        return max(level, current_lvl)
+
+
+class TempleTable(BaseModel):
+    """
+    Divine Temple requirements and per-rank resource values.
+
+    Attributes:
+        gems (Tuple[int, ...]): Cumulative Aurora Gems required for each temple
+            level. Index 0 is padding and holds 0.
+        spiritveins (Tuple[int, ...]): Cumulative Spiritvein Shards required for
+            each temple level, laid out like `gems`.
+        rank_gems (Tuple[int, ...]): Aurora Gems returned by one rank of each
+            tier, in order Origin, Surge, Chaos, Core, Polystar, Nirvana.
+        rank_spiritveins (Tuple[int, ...]): Spiritvein Shards returned by one rank
+            of each tier, in the same order.
+        rank_names (Tuple[str, ...]): Name of each tier, in the same order.
+        rank_cots (Tuple[int, ...]): Crystals of Transcendence needed to bring one
+            hero to each tier, in the same order.
+        rank_stellars (Tuple[int, ...]): Stellar Shards needed to bring one hero
+            to each tier, in the same order.
+        rank_limits (Tuple[int, ...]): Maximum number of heroes of each tier.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    gems: Tuple[int, ...]
+    spiritveins: Tuple[int, ...]
+    rank_gems: Tuple[int, ...]
+    rank_spiritveins: Tuple[int, ...]
+    rank_names: Tuple[str, ...] = ()
+    rank_cots: Tuple[int, ...] = ()
+    rank_stellars: Tuple[int, ...] = ()
+    rank_limits: Tuple[int, ...] = ()
+
+    @property
+    def max_level(self) -> int:
+        """The highest temple level with known requirements."""
+        return len(self.gems) - 1
+
+    def reachable_level(self, gems: int, spiritveins: int) -> int:
+        """Return the highest temple level the given totals cover (0 if none), by binary search."""
+        return min(bisect_right(self.gems, gems), bisect_right(self.spiritveins, spiritveins)) - 1
+
+
+class AwakeningPoolTable(BaseModel):
+    """
+    Column-oriented, precompiled view of an awakening pool.
+
+    Attributes:
+        name (str): Pool name ('normal' or 'buffed').
+        answers (Tuple[str, ...]): Outcome grade names, in pool order.
+        emojis (Tuple[str, ...]): Discord emoji for each outcome.
+        probabilities (Tuple[float, ...]): Probability of each outcome.
+        cumulative (Tuple[float, ...]): Running sum of `probabilities`.
+        alias_prob (Tuple[float, ...]): Alias-method acceptance probability of each slot.
+        alias_index (Tuple[int, ...]): Alias-method fallback outcome of each slot.
+        retire (Tuple[int, ...]): CSG returned when retiring each outcome.
+        points (Tuple[int, ...]): Gala points earned for each outcome.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    answers: Tuple[str, ...]
+    emojis: Tuple[str, ...]
+    probabilities: Tuple[float, ...]
+    cumulative: Tuple[float, ...]
+    alias_prob: Tuple[float, ...]
+    alias_index: Tuple[int, ...]
+    retire: Tuple[int, ...]
+    points: Tuple[int, ...]
+
+
+class GameTables(BaseModel):
+    """
+    Registry of every game lookup table.
+
+    Attributes:
+        enable (GrimTable): Grimoire Enabling Chapter costs.
+        imprint (GrimTable): Grimoire Imprint Chapter costs.
+        temple (TempleTable): Divine Temple requirements.
+        normal_pool (AwakeningPoolTable): The normal awakening pool.
+        buffed_pool (AwakeningPoolTable): The buffed awakening pool.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    enable: GrimTable
+    imprint: GrimTable
+    temple: TempleTable
+    normal_pool: AwakeningPoolTable
+    buffed_pool: AwakeningPoolTable
+
+    def grimoire(self, book: str) -> Optional[GrimTable]:
+        """Return the table for `book` (case-insensitive), or None if unknown."""
+        book = book.lower()
+        if book == "enable":
+            return self.enable
+        if book == "imprint":
+            return self.imprint
+        return None
+
+    def pool(self, normal: bool) -> AwakeningPoolTable:
+        """Return the normal pool if `normal` is True, else the buffed pool."""
+        return self.normal_pool if normal else self.buffed_pool
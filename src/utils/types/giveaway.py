@@ -2,6 +2,43 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
+class DrawRecord(BaseModel):
+    """
+    Audit record of one winner draw, enough to replay and verify it.
+
+    Attributes:
+        seed (int): Seed of the random generator the draw used.
+        count (int): Winners requested.
+        candidates_digest (str): SHA-256 of the candidates and weights drawn from.
+        winners (List[int]): The winners drawn, in draw order.
+        drawn_at (datetime): When the draw happened, in UTC.
+    """
+    seed: int
+    count: int
+    candidates_digest: str
+    winners: List[int] = Field(default_factory=list)
+    drawn_at: datetime
+
+class RerollPool(BaseModel):
+    """
+    Entrants a giveaway is drawn from, persisted with the giveaway.
+
+    Attributes:
+        giveaway_id (str): The giveaway the pool belongs to.
+        previous_winners (List[int]): Everyone drawn so far, in draw order.
+        eligible (List[int]): The entrants when the giveaway ended; drawn
+            ones stay listed and are skipped by later draws.
+        weighting (str): How entries are weighted, "none" or "level".
+        weights (List[float]): Weight of each eligible entrant, empty when unweighted.
+        draws (List[DrawRecord]): Every draw from the pool, in order.
+    """
+    giveaway_id: str
+    previous_winners: List[int] = Field(default_factory=list)
+    eligible: List[int] = Field(default_factory=list)
+    weighting: str = "none"
+    weights: List[float] = Field(default_factory=list)
+    draws: List[DrawRecord] = Field(default_factory=list)
+
 class Giveaway(BaseModel):
     id: str
     prize: str
@@ -20,13 +57,12 @@ class Giveaway(BaseModel):
     # message_id stores the Discord message ID for the giveaway post so we
     # can edit / update it when the giveaway ends or when rerolls occur.
     message_id: Optional[int] = None
+    # Entry weighting used when drawing winners: "none" or "level".
+    weighting: str = "none"
+    # Filled when the giveaway ends; rerolls draw from it.
+    reroll_pool: Optional[RerollPool] = None
 
 class GiveawayJob(BaseModel):
     giveaway_id: str
     job_id: str
     end_time: datetime
-
-class RerollPool(BaseModel):
-    giveaway_id: str
-    previous_winners: List[int] = Field(default_factory=list)
-    eligible: List[int] = Field(default_factory=list)
@@ -0,0 +1,29 @@
+"""
+Pydantic models for the shared memoization layer.
+"""
+
+from typing import Tuple
+
+from pydantic import BaseModel
+
+
+class MemoStats(BaseModel):
+    """
+    Activity of one memoized function.
+
+    Attributes:
+        name (str): Qualified name of the function.
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that had to compute the result.
+        invalidations (int): Times the cache was dropped because a data file changed.
+        size (int): Results currently cached.
+        maxsize (int): Results kept before the least recently used one is evicted.
+        data_files (Tuple[str, ...]): Data files the cached results depend on.
+    """
+    name: str
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+    maxsize: int = 0
+    data_files: Tuple[str, ...] = ()
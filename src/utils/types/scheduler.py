@@ -0,0 +1,24 @@
+"""
+Pydantic models for the timer scheduler.
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+
+class ScheduledJob(BaseModel):
+    """
+    A job due at a given time.
+
+    Attributes:
+        id (str): Unique job id; scheduling the same id again replaces the job.
+        kind (str): Name of the registered handler that runs the job.
+        due (datetime): When the job is due, in UTC.
+        payload (Dict[str, Any]): JSON-serializable data passed to the handler.
+    """
+    id: str
+    kind: str
+    due: datetime
+    payload: Dict[str, Any] = Field(default_factory=dict)
@@ -1,7 +1,7 @@
 """
 User level data model for the leveling system.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict
 
 class UserLevel(BaseModel):
@@ -10,3 +10,26 @@ class UserLevel(BaseModel):
     username: str
     xp: int = Field(default=0, description="Total experience points")
     level: int = Field(default=1, description="Current level")
+
+
+class XpFactors(BaseModel):
+    """
+    A member's XP factors apart from the level multiplier.
+
+    Attributes:
+        static_total (int): Flat XP added to the base XP of each message.
+        multiplier_product (float): Product of the normal multipliers.
+        true_multiplier (float): The final multiplier, applied last.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    static_total: int = 0
+    multiplier_product: float = 1.0
+    true_multiplier: float = 1.0
+
+    def message_xp(self, base_xp: int, level: int, level_multiplier_rate: float) -> int:
+        """
+        XP granted for one message at `level`, as `calculate_xp_from_context` computes it.
+        """
+        level_multiplier = 1.0 + level * level_multiplier_rate
+        return int((base_xp + self.static_total) * self.multiplier_product * level_multiplier * self.true_multiplier)
@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+# `src.utils.config` reads the premium role from the environment at import.
+os.environ.setdefault("PREMIUM_ROLE", "0")
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    """Point the giveaway store at a temporary directory for one test."""
+    from src.utils.functions.giveaway_store import giveaway_store
+
+    previous = giveaway_store.directory
+    giveaway_store.reload(str(tmp_path))
+    yield str(tmp_path)
+    giveaway_store.reload(previous)
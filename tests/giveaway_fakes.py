@@ -0,0 +1,124 @@
+"""
+Fakes and helpers racing giveaway endings and rerolls against each other.
+
+Shared by `tests/test_giveaway_concurrency.py` and `scripts/giveaway_stress.py`.
+Giveaways are created in whatever directory `giveaway_store` was reloaded
+from, and channels are fakes with random latency.
+"""
+import asyncio
+import random
+from collections import Counter
+from datetime import timedelta
+from typing import cast
+
+import nextcord
+
+from src.utils.functions.giveaway import finish_giveaway, reroll_and_announce
+from src.utils.functions.giveaway_draw import verify_draws
+from src.utils.functions.giveaway_store import GiveawayRepository, giveaway_store
+from src.utils.functions.time_utils import utc_now
+from src.utils.types.giveaway import Giveaway
+
+
+async def _latency():
+    await asyncio.sleep(random.uniform(0, 0.005))
+
+
+class FakeMessage:
+    """Giveaway post without embeds; edits only cost latency."""
+    embeds = []
+
+    async def edit(self, **kwargs):
+        await _latency()
+
+
+class FakeChannel:
+    """Channel recording what was sent to it."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def fetch_message(self, message_id):
+        await _latency()
+        return FakeMessage()
+
+    async def send(self, content=None, **kwargs):
+        await _latency()
+        self.sent.append(content)
+
+
+def create_giveaways(count: int, entrants: int, winners: int) -> list:
+    """Store `count` overdue giveaways with `entrants` entrants each."""
+    now = utc_now()
+    ids = []
+    for i in range(count):
+        g = Giveaway(
+            id=f"stress-{i}",
+            prize=f"Prize {i}",
+            host_id=1,
+            host_name="host",
+            winners=winners,
+            duration_seconds=60,
+            start_time=now - timedelta(minutes=1),
+            end_time=now,
+            channel_id=1,
+            active=True,
+            participants=list(range(1000, 1000 + entrants)),
+            winner_ids=[],
+            message_id=10_000 + i,
+        )
+        giveaway_store.save(g)
+        ids.append(g.id)
+    return ids
+
+
+async def run(ids: list, clicks: int, rerolls: int) -> dict:
+    """Race the endings and rerolls; return each giveaway's channel."""
+    channels = {giveaway_id: FakeChannel() for giveaway_id in ids}
+
+    def channel(giveaway_id) -> nextcord.abc.Messageable:
+        # The fakes implement only what finishing and rerolling use.
+        return cast(nextcord.abc.Messageable, channels[giveaway_id])
+
+    async def ends(giveaway_id):
+        # The scheduled ending plus End Now clicks, all at once.
+        await asyncio.gather(*(finish_giveaway(giveaway_id, channel(giveaway_id)) for _ in range(1 + clicks)))
+
+    async def end_then_reroll(giveaway_id):
+        await ends(giveaway_id)
+        await asyncio.gather(*(reroll_and_announce(giveaway_id, channel(giveaway_id)) for _ in range(rerolls)))
+
+    await asyncio.gather(*(end_then_reroll(giveaway_id) for giveaway_id in ids))
+    return channels
+
+
+def check(ids: list, channels: dict, directory: str) -> list:
+    """Return a description of every inconsistency found."""
+    errors = []
+    reloaded = GiveawayRepository(directory)
+    for giveaway_id in ids:
+        sent = channels[giveaway_id].sent
+        ended = sum(1 for content in sent if content.startswith("🎉 Giveaway ended"))
+        if ended != 1:
+            errors.append(f"{giveaway_id}: announced as ended {ended} times")
+
+        g = giveaway_store.get(giveaway_id)
+        if g is None:
+            errors.append(f"{giveaway_id}: missing from the store")
+            continue
+        if g.active or g.reroll_pool is None:
+            errors.append(f"{giveaway_id}: not ended")
+            continue
+        drawn = Counter(g.reroll_pool.previous_winners)
+        twice = [uid for uid, n in drawn.items() if n > 1]
+        if twice:
+            errors.append(f"{giveaway_id}: drawn more than once: {twice}")
+        if not set(drawn) <= set(g.reroll_pool.eligible):
+            errors.append(f"{giveaway_id}: drawn users who did not enter")
+        if verify_draws(g.reroll_pool):
+            errors.append(f"{giveaway_id}: draws do not replay from their records")
+
+        on_disk = reloaded.get(giveaway_id)
+        if on_disk is None or on_disk.model_dump() != g.model_dump():
+            errors.append(f"{giveaway_id}: file does not match memory")
+    return errors
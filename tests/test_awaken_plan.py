@@ -0,0 +1,19 @@
+"""
+Budget limits of the awakening planner.
+"""
+import pytest
+
+from src.utils.functions.awaken import CSG_PER_AWAKENING
+from src.utils.functions.awaken_plan import MAX_BUDGET_CSG, make_plan_response, plan_pool
+from src.utils.functions.game_tables import tables
+
+
+def test_budget_pays_for_whole_awakenings():
+    plan = plan_pool(tables.normal_pool, "A-", 0.9, budget_csg=10 * CSG_PER_AWAKENING + 1)
+    assert plan.budget_awakenings == 10
+
+
+def test_budgets_above_the_simulated_maximum_are_rejected():
+    with pytest.raises(ValueError):
+        plan_pool(tables.normal_pool, "A-", 0.9, budget_csg=MAX_BUDGET_CSG + CSG_PER_AWAKENING)
+    assert make_plan_response("A-", budget_csg=MAX_BUDGET_CSG + 1).startswith("⚠️")
@@ -0,0 +1,22 @@
+"""
+Divine Temple rank costs and the cheapest rank-up plan.
+"""
+import pytest
+from pydantic import ValidationError
+
+from src.utils.dt_cost import dt_cost
+from src.utils.functions.dt_calc import get_dt_plan
+from src.utils.types.dt_cost import Costs
+
+
+def test_rank_costs_are_non_negative():
+    for costs in dt_cost:
+        assert min(costs.gems, costs.spiritvein, costs.cots, costs.stellars) >= 0
+    with pytest.raises(ValidationError):
+        Costs(name="broken", spiritvein=-39)
+
+
+def test_first_temple_takes_the_cheapest_rank():
+    plan = get_dt_plan(goal_temple=1)
+    assert plan.error is None
+    assert plan.added_ranks == (1, 0, 0, 0, 0, 0)
@@ -0,0 +1,50 @@
+"""
+Locking and idempotency of giveaway endings and rerolls.
+
+Runs a small version of `scripts/giveaway_stress.py` against a temporary
+giveaway store (the `store_dir` fixture): the scheduled ending, End Now
+clicks and rerolls all race.
+"""
+import asyncio
+from typing import cast
+
+import nextcord
+
+from src.utils.functions.giveaway import finish_giveaway, reroll_and_announce
+from tests.giveaway_fakes import FakeChannel, check, create_giveaways, run
+
+
+def test_concurrent_endings_and_rerolls_are_consistent(store_dir):
+    ids = create_giveaways(count=20, entrants=12, winners=3)
+    channels = asyncio.run(run(ids, clicks=4, rerolls=3))
+    assert check(ids, channels, store_dir) == []
+
+
+def test_finish_giveaway_ends_only_once(store_dir):
+    [giveaway_id] = create_giveaways(count=1, entrants=5, winners=2)
+    fake = FakeChannel()
+    channel = cast(nextcord.abc.Messageable, fake)
+
+    async def race():
+        return await asyncio.gather(*(finish_giveaway(giveaway_id, channel) for _ in range(5)))
+
+    results = asyncio.run(race())
+    winners = [r for r in results if r is not None]
+    assert len(winners) == 1 and len(winners[0]) == 2
+    assert asyncio.run(finish_giveaway(giveaway_id, channel)) is None
+    assert sum(1 for content in fake.sent if content.startswith("🎉 Giveaway ended")) == 1
+
+
+def test_concurrent_rerolls_never_repeat_a_winner(store_dir):
+    [giveaway_id] = create_giveaways(count=1, entrants=7, winners=2)
+    channel = cast(nextcord.abc.Messageable, FakeChannel())
+
+    async def end_then_reroll():
+        first = await finish_giveaway(giveaway_id, channel)
+        rerolls = await asyncio.gather(*(reroll_and_announce(giveaway_id, channel) for _ in range(4)))
+        return first, rerolls
+
+    first, rerolls = asyncio.run(end_then_reroll())
+    drawn = list(first or []) + [uid for winners in rerolls for uid in winners]
+    # 7 entrants, 2 per draw: the end and two rerolls, then too few remain.
+    assert len(drawn) == len(set(drawn)) == 6
@@ -0,0 +1,53 @@
+"""
+Entrant reconciliation racing live reaction events.
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+import nextcord
+
+from src.utils.functions.giveaway import reconcile_entrants, record_reaction_entry
+from src.utils.functions.giveaway_store import giveaway_store
+from tests.giveaway_fakes import create_giveaways
+
+
+class PagedReaction:
+    """🎉 reaction whose users come back in pages, with events between pages."""
+
+    def __init__(self, pages, between_pages):
+        self.emoji = "🎉"
+        self.pages = pages
+        self.between_pages = between_pages
+
+    async def users(self):
+        for i, page in enumerate(self.pages):
+            for user_id in page:
+                yield SimpleNamespace(id=user_id, bot=False)
+            if i < len(self.between_pages):
+                self.between_pages[i]()
+
+
+def test_reaction_events_during_pagination_are_kept(store_dir):
+    [giveaway_id] = create_giveaways(count=1, entrants=0, winners=1)
+    g = giveaway_store.get(giveaway_id)
+    assert g is not None and g.message_id is not None
+    message_id = g.message_id
+
+    def events():
+        # User 2 was paged already and withdraws; user 1 reacts after the
+        # range holding their id was paged; user 6 reacts before their page.
+        record_reaction_entry(message_id, 2, False, "🎉")
+        record_reaction_entry(message_id, 1, True, "🎉")
+        record_reaction_entry(message_id, 6, True, "🎉")
+
+    msg = SimpleNamespace(reactions=[PagedReaction([[2, 3], [4, 5]], [events])])
+
+    async def fetch_message(_):
+        return msg
+
+    channel = cast(nextcord.TextChannel, SimpleNamespace(fetch_message=fetch_message))
+    found = asyncio.run(reconcile_entrants(channel, g))
+
+    assert sorted(giveaway_store.entrants(giveaway_id)) == [1, 3, 4, 5, 6]
+    assert found == 5
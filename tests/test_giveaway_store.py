@@ -0,0 +1,29 @@
+"""
+Loading and migrating the giveaway store.
+"""
+import json
+import os
+
+from src.utils.functions.giveaway_store import GiveawayRepository
+from tests.giveaway_fakes import create_giveaways
+
+
+def test_legacy_store_is_only_migrated_on_request(store_dir, tmp_path):
+    [giveaway_id] = create_giveaways(count=1, entrants=3, winners=1)
+    with open(os.path.join(store_dir, f"{giveaway_id}.json"), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    legacy_path = str(tmp_path / "giveaway.json")
+    data["id"] = "legacy"
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump([data], f)
+
+    directory = str(tmp_path / "giveaways")
+    repository = GiveawayRepository(directory)
+    assert repository.get("legacy") is None
+    assert os.path.exists(legacy_path)
+
+    assert repository.migrate_legacy(legacy_path) == 1
+    assert repository.get("legacy") is not None
+    assert os.path.exists(os.path.join(directory, "legacy.json"))
+    assert os.path.exists(f"{legacy_path}.migrated") and not os.path.exists(legacy_path)
+    assert repository.migrate_legacy(legacy_path) == 0
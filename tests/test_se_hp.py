@@ -0,0 +1,23 @@
+"""
+Damage between Soul Eater boss stages.
+"""
+from decimal import Decimal
+
+from src.utils.functions.se_hp import get_se_damage, get_se_hp
+
+
+def test_damage_within_a_stage():
+    assert get_se_damage(3, 50, 3, 20) == get_se_hp(3, 30)
+
+
+def test_damage_across_stages_adds_every_stage_in_between():
+    parts = [get_se_hp(3, 50), get_se_hp(4, 100), get_se_hp(5, 60)]
+    damage = get_se_damage(3, 50, 5, 40)
+    assert damage is not None and all(part is not None for part in parts)
+    expected = sum(Decimal(part) for part in parts if part is not None)
+    assert abs(damage - expected) <= expected * Decimal("1e-20")
+
+
+def test_backward_ranges_are_invalid():
+    assert get_se_damage(3, 50, 1, 100) is None
+    assert get_se_damage(3, 20, 3, 50) is None